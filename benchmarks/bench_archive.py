@@ -0,0 +1,134 @@
+# benchmarks/bench_archive.py
+
+"""Raw-archive write, compaction and query cost over months of history.
+
+Simulates --days of ingestion at --cycles per day, each cycle archiving
+--records raw records per source through storage.archive, alongside the
+old layout (one JSON dump per cycle and source, like data/github/*.json).
+Then times two analytics queries over the JSON dumps, over the fresh
+archive and over the compacted archive:
+
+    week     one source, one week, one category (partition + column predicates)
+    history  one repo's star history across every day (key predicate)
+
+    python benchmarks/bench_archive.py --days 90 --cycles 24 --records 200
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import logging
+
+import pyarrow.dataset as ds
+
+from storage.archive import archive_records, compact_archive, read_archive
+
+LANGUAGES = ["Python", "JavaScript", "Go", "Rust", "TypeScript", "Java", "C", "Ruby"]
+START = datetime(2025, 1, 1)
+
+
+def cycle_records(source, index, n, rng):
+    if source == "github":
+        return [{"full_name": f"owner{i}/repo-{i}", "name": f"repo-{i}", "url": f"https://github.com/owner{i}/repo-{i}",
+                 "stars": i * 10 + index, "description": "Synthetic repository " * 3,
+                 "language": LANGUAGES[i % len(LANGUAGES)]} for i in rng.sample(range(n * 5), n)]
+    if source == "reddit":
+        return [{"id": f"p{index}_{i}", "title": f"Post {i} of cycle {index}", "score": rng.randint(0, 5000),
+                 "url": f"https://example.com/{index}/{i}", "subreddit": rng.choice(["python", "rust", "golang"]),
+                 "author": "someone", "num_comments": rng.randint(0, 300), "created_utc": 1.7e9 + index}
+                for i in range(n)]
+    return [{"article_id": f"a{index}_{i}", "link": f"https://news.example.com/{index}/{i}",
+             "title": f"Headline {i} of cycle {index}", "description": "Synthetic article body " * 10,
+             "source_id": rng.choice(["verge", "wired", "techcrunch"])} for i in range(n)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def json_week(json_dir, first, last):
+    rows = 0
+    for path in glob.glob(os.path.join(json_dir, "github_*.json")):
+        day = datetime.strptime(os.path.basename(path).split("_")[1], "%Y%m%d").date()
+        if first <= day <= last:
+            with open(path) as f:
+                rows += sum(record["language"] == "Rust" for record in json.load(f))
+    return rows
+
+
+def json_history(json_dir, key):
+    rows = 0
+    for path in glob.glob(os.path.join(json_dir, "github_*.json")):
+        with open(path) as f:
+            rows += sum(record["full_name"] == key for record in json.load(f))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--cycles", type=int, default=24, help="Ingestion cycles per day")
+    parser.add_argument("--records", type=int, default=200, help="Records per cycle and source")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root, json_dir = os.path.join(tmpdir, "archive"), os.path.join(tmpdir, "json")
+        os.makedirs(json_dir)
+
+        archive_ms = json_ms = 0.0
+        for index in range(args.days * args.cycles):
+            fetched_at = START + timedelta(hours=24 * index / args.cycles)
+            for source in ("github", "reddit", "news"):
+                records = cycle_records(source, index, args.records, rng)
+                archive_ms += timed(lambda: archive_records(source, records, fetched_at, root))[1]
+                path = os.path.join(json_dir, f"{source}_{fetched_at:%Y%m%d_%H%M%S}_{index}.json")
+                json_ms += timed(lambda: json.dump(records, open(path, "w")))[1]
+        total = args.days * args.cycles * args.records * 3
+        print(f"{total:,} records in {args.days * args.cycles * 3:,} cycles: "
+              f"archive {archive_ms / 1000:.1f}s, json dumps {json_ms / 1000:.1f}s")
+
+        first = START.date() + timedelta(days=args.days // 2)
+        last = first + timedelta(days=6)
+        key = "owner7/repo-7"
+        queries = {
+            "week": lambda: read_archive("github", first, last, ["key", "metric"], ds.field("category") == "Rust",
+                                         root=root).num_rows,
+            "history": lambda: read_archive("github", columns=["fetched_at", "metric"], where=ds.field("key") == key,
+                                            root=root).num_rows,
+        }
+        json_queries = {"week": lambda: json_week(json_dir, first, last), "history": lambda: json_history(json_dir, key)}
+
+        def files():
+            return len(glob.glob(os.path.join(root, "**", "*.parquet"), recursive=True))
+
+        print(f"\n{'layout':>22} {'files':>7} {'week':>18} {'history':>18}")
+        results = {name: timed(fn) for name, fn in json_queries.items()}
+        print(f"{'json dumps':>22} {len(os.listdir(json_dir)):>7} "
+              + " ".join(f"{ms:>9.1f}ms ({rows:>4})" for rows, ms in results.values()))
+        results = {name: timed(fn) for name, fn in queries.items()}
+        print(f"{'archive, per cycle':>22} {files():>7} "
+              + " ".join(f"{ms:>9.1f}ms ({rows:>4})" for rows, ms in results.values()))
+
+        compacted, ms = timed(lambda: compact_archive(root, before=date.max))
+        results = {name: timed(fn) for name, fn in queries.items()}
+        print(f"{'archive, compacted':>22} {files():>7} "
+              + " ".join(f"{ms:>9.1f}ms ({rows:>4})" for rows, ms in results.values()))
+        print(f"\ncompacted {compacted} partitions in {ms / 1000:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
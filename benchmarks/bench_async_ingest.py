@@ -0,0 +1,60 @@
+# benchmarks/bench_async_ingest.py
+
+"""Sequential vs concurrent ingestion against a local mock API.
+
+    python benchmarks/bench_async_ingest.py --latency 0.3 --languages 4
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_server import MockAPIServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.3, help="Seconds per mock API call")
+    parser.add_argument("--languages", type=int, default=4, help="Languages fetched per cycle")
+    args = parser.parse_args()
+
+    with MockAPIServer(latency=args.latency) as server:
+        # Module-level URLs are read at import time, so point them at the mock first
+        os.environ["GITHUB_API_URL"] = server.url
+        os.environ["NEWSDATA_API_URL"] = f"{server.url}/api/1"
+        os.environ["DEVRADAR_GITHUB_HTTP_CACHE"] = ""  # every call should reach the mock
+
+        from ingest.github_ingest import fetch_top_repos, get_repo_languages
+        from ingest.news_ingest import fetch_tech_news
+        from ingest.async_ingest import ingest_all
+
+        languages = get_repo_languages()[:args.languages]
+
+        server.hits = 0
+        start = time.perf_counter()
+        repos = [repo for lang in languages for repo in fetch_top_repos(lang)]
+        news = fetch_tech_news("bench-key")
+        sequential = time.perf_counter() - start
+        sequential_calls = server.hits
+
+        server.hits = 0
+        start = time.perf_counter()
+        result = asyncio.run(ingest_all("bench-key", languages=languages, include_reddit=False))
+        concurrent = time.perf_counter() - start
+        concurrent_calls = server.hits
+
+    assert len(result["github"]) == len(repos) and len(result["news"]) == len(news)
+    print(f"latency per call : {args.latency:.2f}s, languages: {len(languages)}")
+    print(f"sequential       : {sequential:6.2f}s ({sequential_calls} calls)")
+    print(f"async fan-out    : {concurrent:6.2f}s ({concurrent_calls} calls)")
+    print(f"speedup          : {sequential / concurrent:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# benchmarks/bench_dashboard_event_loop.py
+
+"""Event-loop responsiveness while simulated clients refresh the dashboard.
+
+A probe coroutine asks to wake every --tick ms; how late it wakes is the
+latency any UI event (click, websocket message) would see. Each simulated
+client refreshes stats + all panels concurrently, with the panel cache
+bypassed so every refresh reads the database. Queries run either inline on
+the loop (the old behaviour) or on the dashboard's DB thread pool.
+
+    python benchmarks/bench_dashboard_event_loop.py --rows 1000000 --clients 50
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+
+from db.database import Base
+from dashboard import queries
+from bench_dashboard_queries import populate
+
+PANELS = [
+    (queries.dashboard_stats.uncached, ()),
+    (queries.top_repos.uncached, (None, 5)),
+    (queries.top_posts.uncached, (5,)),
+    (queries.latest_news.uncached, (6,)),
+]
+
+
+async def refresh_inline(engine):
+    for fn, args in PANELS:
+        fn(*args, bind=engine)
+
+
+async def refresh_pooled(engine):
+    await asyncio.gather(*(queries.run_query(fn, *args, bind=engine) for fn, args in PANELS))
+
+
+async def simulate(refresh, engine, clients, interval, duration, tick):
+    lags = []
+    stop = time.perf_counter() + duration
+
+    async def probe():
+        while time.perf_counter() < stop:
+            start = time.perf_counter()
+            await asyncio.sleep(tick)
+            lags.append((time.perf_counter() - start - tick) * 1000)
+
+    async def client(offset):
+        await asyncio.sleep(offset)
+        while time.perf_counter() < stop:
+            await refresh(engine)
+            await asyncio.sleep(interval)
+
+    await asyncio.gather(probe(), *(client(interval * i / clients) for i in range(clients)))
+    return lags
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=300_000, help="Rows per table")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between a client's refreshes")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--tick", type=float, default=0.01, help="Probe interval in seconds")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmpdir, 'loop.db')}",
+                               connect_args={"check_same_thread": False}, pool_size=8)
+        Base.metadata.create_all(engine)
+        populate(engine, args.rows)
+
+        print(f"{args.clients} clients, refresh every {args.interval}s, {args.rows:,} rows per table")
+        print(f"{'mode':<10} {'p50 lag':>10} {'p99 lag':>10} {'max lag':>10}")
+        for mode, refresh in (("inline", refresh_inline), ("threadpool", refresh_pooled)):
+            lags = asyncio.run(simulate(refresh, engine, args.clients, args.interval, args.duration, args.tick))
+            print(f"{mode:<10} {statistics.median(lags):>8.1f}ms {percentile(lags, 99):>8.1f}ms {max(lags):>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
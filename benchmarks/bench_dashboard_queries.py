@@ -0,0 +1,114 @@
+# benchmarks/bench_dashboard_queries.py
+
+"""Dashboard panel latency as the tables grow.
+
+Times the dashboard.queries panel functions (median of --repeat runs) at each
+table size; they should stay flat. The old pandas path (read the whole table,
+sort, drop_duplicates, head) is timed up to --legacy-max rows for comparison.
+
+    python benchmarks/bench_dashboard_queries.py --sizes 1000,100000,1000000,10000000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from sqlalchemy import create_engine
+
+from db.database import Base
+from db import models  # noqa: F401  (registers tables)
+from dashboard import queries
+
+LANGUAGES = ["Python", "JavaScript", "Go", "Rust", "TypeScript", "Java", "C", "Ruby"]
+CHUNK = 50_000
+
+
+def populate(engine, n):
+    base = datetime(2025, 1, 1)
+    with engine.begin() as conn:
+        for start in range(0, n, CHUNK):
+            ids = range(start, min(start + CHUNK, n))
+            conn.execute(models.GitHubRepo.__table__.insert(), [{
+                "id": i + 1, "full_name": f"owner{i}/repo-{i}", "name": f"owner{i}/repo-{i}",
+                "url": f"https://github.com/owner{i}/repo-{i}", "stars": (i * 7919) % 500_000,
+                "description": "Synthetic repository", "language": LANGUAGES[i % len(LANGUAGES)],
+                "timestamp": base + timedelta(seconds=i),
+            } for i in ids])
+            conn.execute(models.TrendingRepo.__table__.insert(), [{
+                "repo_id": i + 1, "language": LANGUAGES[i % len(LANGUAGES)], "stars": (i * 7919) % 500_000,
+                "captured_at": base, "observations": 2, "velocity": float((i * 31) % 1000),
+                "acceleration": 0.0, "trend_score": float((i * 31) % 1000),
+            } for i in ids])
+            conn.execute(models.RedditPost.__table__.insert(), [{
+                "id": i + 1, "post_id": f"p{i}", "title": f"Post {i % (n // 2 + 1)}", "score": (i * 104729) % 100_000,
+                "url": f"https://example.com/{i}", "subreddit": "programming", "timestamp": base,
+            } for i in ids])
+            conn.execute(models.TrendingPost.__table__.insert(), [{
+                "post_id": i + 1, "score": (i * 104729) % 100_000, "captured_at": base, "observations": 2,
+                "velocity": float((i * 37) % 500), "acceleration": 0.0, "trend_score": float((i * 37) % 500),
+            } for i in ids])
+            conn.execute(models.TechNews.__table__.insert(), [{
+                "url": f"https://news.example.com/{i}", "title": f"Story {i % (n // 2 + 1)}",
+                "summary": "Synthetic summary", "sentiment": "Neutral",
+                "published_at": (base + timedelta(seconds=i)).isoformat(),
+            } for i in ids])
+
+
+def median_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def legacy_panels(engine):
+    import pandas as pd
+
+    repos = pd.read_sql("SELECT name, url, stars, description, language, timestamp FROM github_repos", engine)
+    repos.sort_values("stars", ascending=False).drop_duplicates("name").head(5)
+    posts = pd.read_sql("SELECT title, url, subreddit, score, created_utc FROM reddit_posts ORDER BY score DESC", engine)
+    posts.drop_duplicates(subset="title").head(5)
+    news = pd.read_sql("SELECT title, url, summary, source, published_at, sentiment FROM tech_news ORDER BY published_at DESC", engine)
+    news.drop_duplicates("title").head(6)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,100000,1000000", help="Comma-separated rows per table")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--legacy-max", type=int, default=100_000, help="Largest size to run the pandas path at")
+    args = parser.parse_args()
+
+    # Bypass the panel cache: this measures the SQL itself
+    panels = {
+        "top_repos(All)": lambda e: queries.top_repos.uncached(None, 5, bind=e),
+        "top_repos(Go)": lambda e: queries.top_repos.uncached("Go", 5, bind=e),
+        "repo_languages": lambda e: queries.repo_languages.uncached(bind=e),
+        "top_posts": lambda e: queries.top_posts.uncached(5, bind=e),
+        "latest_news": lambda e: queries.latest_news.uncached(6, bind=e),
+    }
+
+    print(f"{'rows':>10} " + " ".join(f"{name:>15}" for name in panels) + f" {'legacy pandas':>15}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for n in (int(size) for size in args.sizes.split(",")):
+            engine = create_engine(f"sqlite:///{os.path.join(tmpdir, f'dash_{n}.db')}")
+            Base.metadata.create_all(engine)
+            populate(engine, n)
+
+            timings = [median_ms(lambda: fn(engine), args.repeat) for fn in panels.values()]
+            legacy = f"{median_ms(lambda: legacy_panels(engine), 3):>13.2f}ms" if n <= args.legacy_max else f"{'skipped':>15}"
+            print(f"{n:>10} " + " ".join(f"{ms:>13.2f}ms" for ms in timings) + f" {legacy}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/bench_dashboard_render.py
+
+"""Websocket bytes per refresh: clear-and-rebuild vs keyed incremental rendering.
+
+Renders the real dashboard cards into NiceGUI's auto-index client (no server
+needed) and measures the JSON payload NiceGUI's outbox would emit after each
+refresh.
+
+    python benchmarks/bench_dashboard_render.py
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from nicegui import ui
+
+from dashboard.components import KeyedList, repo_card
+
+
+def repos(stars_bump=0, swap=False):
+    rows = [{
+        "full_name": f"owner{i}/repo-{i}", "name": f"owner{i}/repo-{i}",
+        "url": f"https://github.com/owner{i}/repo-{i}", "stars": 50_000 - i * 1000,
+        "description": "A fast, friendly framework for building developer tools " * 2,
+        "language": "Python", "timestamp": datetime(2025, 6, 20, 12, 0),
+    } for i in range(5)]
+    rows[2]["stars"] += stars_bump
+    if swap:
+        rows[0], rows[1] = rows[1], rows[0]
+    return rows
+
+
+def drain(container):
+    """Bytes NiceGUI would push for everything enqueued since the last drain"""
+    outbox = container.client.outbox
+    payload = {element_id: None if element is None else element._to_dict()
+               for element_id, element in outbox.updates.items()}
+    outbox.updates.clear()
+    return len(json.dumps(payload, default=str)) if payload else 0
+
+
+def legacy_render(container, rows):
+    container.clear()
+    with container:
+        for row in rows:
+            repo_card(row)
+
+
+def main():
+    scenarios = [
+        ("first render", repos()),
+        ("nothing changed", repos()),
+        ("one card changed", repos(stars_bump=250)),
+        ("two cards reordered", repos(stars_bump=250, swap=True)),
+        ("nothing changed", repos(stars_bump=250, swap=True)),
+    ]
+
+    legacy_container = ui.column()
+    keyed_container = ui.column()
+    keyed = KeyedList(keyed_container, key=lambda row: row["full_name"], render=repo_card)
+    drain(keyed_container)
+
+    print(f"{'refresh':<22} {'clear+rebuild':>14} {'keyed':>10}")
+    for label, rows in scenarios:
+        legacy_render(legacy_container, rows)
+        legacy_bytes = drain(legacy_container)
+        keyed.update(rows)
+        keyed_bytes = drain(keyed_container)
+        print(f"{label:<22} {legacy_bytes:>12,} B {keyed_bytes:>8,} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# benchmarks/bench_http_cache.py
+
+"""GitHub requests, 304s and bytes downloaded per cycle with the conditional cache.
+
+The first cycle fills the on-disk cache; later cycles repeat the same searches,
+so the mock answers them with empty 304s.
+
+    python benchmarks/bench_http_cache.py --cycles 3 --languages 4
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_server import MockAPIServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=3)
+    parser.add_argument("--languages", type=int, default=4, help="Languages fetched per cycle")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per mock API call")
+    args = parser.parse_args()
+
+    with MockAPIServer(latency=args.latency) as server, tempfile.TemporaryDirectory() as tmpdir:
+        # Module-level settings are read at import time, so point them at the mock first
+        os.environ["GITHUB_API_URL"] = server.url
+        os.environ["DEVRADAR_GITHUB_HTTP_CACHE"] = os.path.join(tmpdir, "github_http.sqlite3")
+
+        from ingest.async_ingest import fetch_top_repos_async, github_client, http_cache
+        from ingest.github_ingest import get_repo_languages
+
+        languages = get_repo_languages()[:args.languages]
+
+        async def cycle():
+            async with github_client() as gh:
+                await asyncio.gather(*(fetch_top_repos_async(lang, client=gh) for lang in languages))
+
+        print(f"{'cycle':>5} {'requests':>9} {'304s':>6} {'bytes':>9}")
+        for n in range(1, args.cycles + 1):
+            hits, not_modified, sent = server.hits, server.not_modified, server.bytes_sent
+            asyncio.run(cycle())
+            print(f"{n:>5} {server.hits - hits:>9} {server.not_modified - not_modified:>6} "
+                  f"{server.bytes_sent - sent:>9,}")
+        print(f"cache counters: {http_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
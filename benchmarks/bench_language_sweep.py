@@ -0,0 +1,64 @@
+# benchmarks/bench_language_sweep.py
+
+"""All-languages GitHub sweep against the metered mock API, saved to a scratch DB.
+
+Reports what the sweep itself reports (repos/sec, search quota used) plus the
+rows that actually reached the database.
+
+    python benchmarks/bench_language_sweep.py --languages 19 --pages 3 --limit 120 --window 10
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_server import MockAPIServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--languages", type=int, default=19)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=120, help="Search calls allowed per window")
+    parser.add_argument("--window", type=float, default=10.0, help="Rate-limit window in seconds")
+    parser.add_argument("--latency", type=float, default=0.1, help="Seconds per mock API call")
+    args = parser.parse_args()
+
+    with MockAPIServer(latency=args.latency, search_limit=args.limit, window=args.window) as server, \
+            tempfile.TemporaryDirectory() as tmpdir:
+        # Module-level settings are read at import time, so point them at the mock first
+        os.environ["GITHUB_API_URL"] = server.url
+        os.environ["DEVRADAR_GITHUB_HTTP_CACHE"] = ""
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmpdir, 'sweep.db')}"
+
+        from sqlalchemy import func, select
+
+        from db.database import Base, engine
+        from db.models import GitHubRepo
+        from flows.devradar_flow import page_saver
+        from ingest.async_ingest import sweep_languages_async
+        from ingest.github_ingest import get_repo_languages
+
+        Base.metadata.create_all(engine)
+        languages = get_repo_languages()[:args.languages]
+        report = asyncio.run(sweep_languages_async(page_saver(), languages, args.pages, args.per_page))
+
+        with engine.connect() as conn:
+            stored = conn.execute(select(func.count()).select_from(GitHubRepo)).scalar()
+        print(f"{args.languages} languages x {args.pages} pages x {args.per_page}, "
+              f"quota {args.limit} per {args.window:g}s, {args.latency}s per call")
+        for key, value in report.items():
+            print(f"{key:<18} {value}")
+        print(f"{'rows stored':<18} {stored}")
+        print(f"{'403s':<18} {server.rejected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# benchmarks/bench_near_dup.py
+
+"""Near-duplicate clustering cost and accuracy as the news table grows.
+
+Writes synthetic headlines through the news upsert with the clustering hook
+(storage.clusters.cluster_news), --batch at a time. A --dup-rate share of
+them are edits (one word dropped, added or swapped) of an earlier headline.
+Per-batch time should stay flat as the table grows, since candidates come
+from the LSH bucket index rather than a scan. Accuracy: recall is the share
+of edits clustered with their original, false merges the share of fresh
+headlines put into an existing cluster.
+
+    python benchmarks/bench_near_dup.py --items 200000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from sqlalchemy import create_engine, select
+
+from db.database import Base
+from db.models import TechNews
+from storage.bulk import upsert_rows
+from storage.clusters import cluster_news
+
+VOCABULARY = [f"word{i}" for i in range(5_000)]
+
+
+def edit(words, rng):
+    words = list(words)
+    op = rng.choice(("drop", "add", "swap"))
+    position = rng.randrange(len(words))
+    if op == "drop" and len(words) > 6:
+        words.pop(position)
+    elif op == "add":
+        words.insert(position, rng.choice(VOCABULARY))
+    else:
+        words[position] = rng.choice(VOCABULARY)
+    return words
+
+
+def headlines(n, dup_rate, seed=0):
+    """(url, title, original url or None) triples"""
+    rng = random.Random(seed)
+    fresh = []
+    for i in range(n):
+        if fresh and rng.random() < dup_rate:
+            origin_url, words = rng.choice(fresh)
+            yield f"https://news.example.com/{i}", " ".join(edit(words, rng)), origin_url
+        else:
+            words = rng.sample(VOCABULARY, rng.randint(7, 12))
+            url = f"https://news.example.com/{i}"
+            fresh.append((url, words))
+            yield url, " ".join(words), None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--dup-rate", type=float, default=0.2)
+    parser.add_argument("--report-every", type=int, default=50_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmpdir, 'near_dup.db')}")
+        Base.metadata.create_all(engine)
+
+        items = list(headlines(args.items, args.dup_rate))
+        print(f"{'stored':>10} {'ms/batch':>10} {'items/s':>10}")
+        window_start, window_items = time.perf_counter(), 0
+        for start in range(0, len(items), args.batch):
+            rows = [{"url": url, "title": title, "summary": "", "sentiment": "Neutral", "source": "",
+                     "published_at": ""} for url, title, _ in items[start:start + args.batch]]
+            upsert_rows(TechNews.__table__, rows, "url", args.batch, bind=engine, after_batch=cluster_news)
+            window_items += len(rows)
+            stored = start + len(rows)
+            if stored % args.report_every == 0 or stored == len(items):
+                elapsed = time.perf_counter() - window_start
+                print(f"{stored:>10,} {elapsed * 1000 * args.batch / window_items:>10.1f} "
+                      f"{window_items / elapsed:>10,.0f}")
+                window_start, window_items = time.perf_counter(), 0
+
+        with engine.connect() as conn:
+            cluster_of = dict(conn.execute(select(TechNews.url, TechNews.cluster_id)).all())
+            id_of = dict(conn.execute(select(TechNews.url, TechNews.id)).all())
+        edits = [(url, origin) for url, _, origin in items if origin]
+        recalled = sum(cluster_of[url] == cluster_of[origin] for url, origin in edits)
+        fresh = [url for url, _, origin in items if origin is None]
+        merged = sum(cluster_of[url] != id_of[url] for url in fresh)
+        print(f"\nrecall {recalled / max(len(edits), 1):.1%} of {len(edits):,} edits; "
+              f"false merges {merged / max(len(fresh), 1):.2%} of {len(fresh):,} fresh headlines")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# benchmarks/bench_news_enrichment.py
+
+"""News enrichment throughput: per-article path vs the BatchEnricher.
+
+The per-article path is the old summarize_text (a new Tokenizer and
+LsaSummarizer per call) plus get_sentiment_label, one article at a time.
+Synthetic articles repeat with probability 1 - --unique, like a feed that
+returns the same stories across runs. The last mode is a second run with a
+fresh process-local state but a warm on-disk memo.
+
+    python benchmarks/bench_news_enrichment.py --articles 5000 --unique 0.5 --workers 4
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from sumy.nlp.tokenizers import Tokenizer
+from sumy.parsers.plaintext import PlaintextParser
+from sumy.summarizers.lsa import LsaSummarizer
+
+from transform.news_transform import BatchEnricher, get_sentiment_label
+from utils.memo_cache import MemoCache
+
+WORDS = ("framework release developers performance security open source model cloud "
+         "startup funding compiler runtime database latency benchmark outage patch").split()
+
+
+def synthetic_articles(n, unique, seed=0):
+    rng = random.Random(seed)
+    distinct = max(1, int(n * unique))
+    texts = []
+    for i in range(distinct):
+        sentences = [" ".join(rng.choice(WORDS) for _ in range(12)).capitalize() + "." for _ in range(4)]
+        texts.append(f"Story {i}. " + " ".join(sentences))
+    return [texts[i] if i < distinct else rng.choice(texts) for i in range(n)]
+
+
+def legacy_enrich(text):
+    parser = PlaintextParser.from_string(text, Tokenizer("english"))
+    summary = " ".join(str(sentence) for sentence in LsaSummarizer()(parser.document, 1))
+    return summary[:200], get_sentiment_label(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=5000)
+    parser.add_argument("--unique", type=float, default=0.5, help="Fraction of distinct descriptions")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+
+    texts = synthetic_articles(args.articles, args.unique)
+    modes = [("per-article", lambda: [legacy_enrich(text) for text in texts])]
+    for workers in sorted({1, args.workers}):
+        enricher = BatchEnricher(workers=workers, batch_size=args.batch_size)
+        modes.append((f"batch x{workers}", lambda enricher=enricher: enricher.enrich(texts)))
+
+    tmpdir = tempfile.TemporaryDirectory()
+    memo = MemoCache(os.path.join(tmpdir.name, "memo.sqlite3"))
+    BatchEnricher(workers=args.workers, batch_size=args.batch_size, memo=memo).enrich(texts)
+    rerun = BatchEnricher(workers=args.workers, batch_size=args.batch_size, memo=memo)
+    modes.append(("warm memo", lambda: rerun.enrich(texts)))
+
+    print(f"{args.articles} articles, {args.unique:.0%} distinct, {os.cpu_count()} CPUs")
+    print(f"{'mode':<12} {'seconds':>8} {'articles/s':>11}")
+    for name, run in modes:
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<12} {elapsed:>8.2f} {args.articles / elapsed:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
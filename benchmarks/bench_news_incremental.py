@@ -0,0 +1,54 @@
+# benchmarks/bench_news_incremental.py
+
+"""Requests and articles handled per run by the incremental NewsData ingest.
+
+Runs fetch_new_tech_news repeatedly against the paginated mock feed with a
+persisted cursor. Between runs --publish new articles appear. The first run
+walks back --max-pages pages; steady-state runs should need one request and
+only handle the new articles.
+
+    python benchmarks/bench_news_incremental.py --runs 4 --publish 5
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_server import MockAPIServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=4)
+    parser.add_argument("--publish", type=int, default=5, help="New articles between runs")
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--max-pages", type=int, default=5)
+    args = parser.parse_args()
+
+    with MockAPIServer(latency=0, news_size=args.page_size) as server, tempfile.TemporaryDirectory() as tmpdir:
+        # Module-level settings are read at import time, so point them at the mock first
+        os.environ["NEWSDATA_API_URL"] = f"{server.url}/api/1"
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmpdir, 'news.db')}"
+
+        from db.database import Base, engine
+        from ingest.news_ingest import NEWS_CURSOR, fetch_new_tech_news
+        from storage.cursors import load_cursor, save_cursor
+
+        Base.metadata.create_all(engine)
+
+        print(f"{'run':>3} {'requests':>9} {'articles':>9}  cursor")
+        for run in range(1, args.runs + 1):
+            hits = server.hits
+            articles, cursor = fetch_new_tech_news("bench-key", load_cursor(NEWS_CURSOR), args.max_pages)
+            save_cursor(NEWS_CURSOR, cursor)
+            print(f"{run:>3} {server.hits - hits:>9} {len(articles):>9}  {cursor['published_at']}")
+            server.news_total += args.publish
+
+
+if __name__ == "__main__":
+    main()
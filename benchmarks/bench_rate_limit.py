@@ -0,0 +1,65 @@
+# benchmarks/bench_rate_limit.py
+
+"""Search calls against a metered mock API: unpaced vs the shared rate limiter.
+
+The mock allows --limit search calls per --window seconds and answers 403
+beyond that, like GitHub. Unpaced requests all go out at once; paced ones go
+through make_github_request_async and the process-wide token buckets.
+
+    python benchmarks/bench_rate_limit.py --requests 60 --limit 30 --window 10
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_server import MockAPIServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=60)
+    parser.add_argument("--limit", type=int, default=30, help="Search calls allowed per window")
+    parser.add_argument("--window", type=float, default=10.0, help="Rate-limit window in seconds")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per mock API call")
+    args = parser.parse_args()
+
+    with MockAPIServer(latency=args.latency, search_limit=args.limit, window=args.window) as server:
+        # Module-level settings are read at import time, so point them at the mock first
+        os.environ["GITHUB_API_URL"] = server.url
+        os.environ["DEVRADAR_GITHUB_HTTP_CACHE"] = ""  # every call should reach the mock
+
+        from ingest.async_ingest import github_client, make_github_request_async, rate_limiter
+        from ingest.github_ingest import SEARCH_URL, popular_params
+
+        params = [popular_params(f"lang{i}", 5) for i in range(args.requests)]
+
+        async def unpaced():
+            async with github_client() as gh:
+                responses = await asyncio.gather(*(gh.get(SEARCH_URL, params=p) for p in params))
+            return sum(r.status_code == 200 for r in responses)
+
+        async def paced():
+            async with github_client() as gh:
+                results = await asyncio.gather(*(make_github_request_async(gh, SEARCH_URL, p) for p in params))
+            return sum(bool(items) for items in results)
+
+        print(f"{args.requests} search calls, quota {args.limit} per {args.window:g}s")
+        print(f"{'mode':<8} {'ok':>5} {'403s':>6} {'elapsed':>9}")
+        for mode, run in (("unpaced", unpaced), ("paced", paced)):
+            time.sleep(args.window)  # start each mode on a fresh quota window
+            rejected = server.rejected
+            start = time.perf_counter()
+            ok = asyncio.run(run())
+            print(f"{mode:<8} {ok:>5} {server.rejected - rejected:>6} {time.perf_counter() - start:>8.2f}s")
+        print(f"limiter: {rate_limiter.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# benchmarks/bench_replay.py
+
+"""Rebuilding a database from the raw archive with flows.replay.
+
+Archives --days of synthetic ingestion at --cycles per day (--records GitHub
+repos and Reddit posts per cycle, --news articles) with storage.archive,
+compacts it like the pipeline does, then replays it into an empty SQLite
+database: first up to the middle day, then the rest from the checkpoint, as
+an interrupted replay would. Prints records/s per source and checks that
+the resumed replay wrote every snapshot exactly once.
+
+    python benchmarks/bench_replay.py --days 30 --cycles 24 --records 2000 --news 20
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+LANGUAGES = ["Python", "JavaScript", "Go", "Rust", "TypeScript", "Java", "C", "Ruby"]
+SUBREDDITS = ["programming", "python", "rust", "golang"]
+START = datetime(2025, 1, 1)
+VOCABULARY = [f"word{i}" for i in range(5_000)]
+
+
+def headline(seed, n_words=8):
+    # Distinct stories, stable per id; bench_near_dup covers the near-duplicate case
+    return " ".join(random.Random(seed).sample(VOCABULARY, n_words))
+
+
+def cycle_records(source, index, n, rng):
+    """One cycle's raw records in the shape ingestion archives them"""
+    if source == "github":
+        # The same top repos come back every cycle, with their stars moving
+        return [{"name": f"repo-{i}", "full_name": f"owner{i}/repo-{i}", "html_url": f"https://github.com/owner{i}/repo-{i}",
+                 "description": f"Synthetic repository {i} for tooling", "stargazers_count": 1000 + i + index * (i % 7),
+                 "language": LANGUAGES[i % len(LANGUAGES)], "topics": []} for i in range(n)]
+    if source == "reddit":
+        # Every other cycle the listing is new; in between the same posts come back rescored
+        return [{"id": f"p{index // 2 * n + i}", "title": f"{headline(index // 2 * n + i)} owner{i}/repo-{i}",
+                 "score": rng.randint(0, 5000), "author": "someone",
+                 "url": f"https://reddit.example.com/{index}/{i}", "num_comments": rng.randint(0, 300),
+                 "created_utc": 1.7e9 + index * 3600, "subreddit": rng.choice(SUBREDDITS)} for i in range(n)]
+    return [{"title": f"{headline(-index * n - i)} {rng.choice(LANGUAGES)} compiler release",
+             "link": f"https://news.example.com/{index}/{i}", "pubDate": f"{START.date()} 00:00:00",
+             "description": "The new compiler release improves build times. Developers report faster CI. "
+                            f"Story {index}-{i} covers programming and open source software.",
+             "source": "wired", "topics": ["programming"]} for i in range(n)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--cycles", type=int, default=24, help="Ingestion cycles per day")
+    parser.add_argument("--records", type=int, default=2000, help="GitHub repos and Reddit posts per cycle")
+    parser.add_argument("--news", type=int, default=20, help="News articles per cycle")
+    parser.add_argument("--workers", type=int, default=0, help="Replay worker processes (0 = one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmpdir, 'replay.db')}"
+    os.environ["DEVRADAR_NLP_CACHE"] = ""
+    logging.disable(logging.WARNING)
+
+    from sqlalchemy import func, select
+
+    from db.create_tables import init_db
+    from db.database import engine
+    from db.models import PostScoreSnapshot, RepoStarSnapshot
+    from flows.replay import replay
+    from storage.archive import archive_records, compact_archive
+
+    rng = random.Random(0)
+    root = os.path.join(tmpdir, "archive")
+    counts = {"github": args.records, "reddit": args.records, "news": args.news}
+    started = time.perf_counter()
+    for index in range(args.days * args.cycles):
+        fetched_at = START + timedelta(hours=24 * index / args.cycles)
+        for source, n in counts.items():
+            archive_records(source, cycle_records(source, index, n, rng), fetched_at, root)
+    compact_archive(root, before=START.date() + timedelta(days=args.days - 1))  # the last day stays per-cycle
+    total = args.days * args.cycles * sum(counts.values())
+    print(f"archived {total:,} records in {time.perf_counter() - started:.1f}s\n")
+
+    init_db()
+    middle = START.date() + timedelta(days=args.days // 2 - 1)
+    options = {"workers": args.workers, "chunk_size": args.chunk_size, "archive_root": root, "legacy_root": None}
+    print(f"{'source':>8} {'records':>12} {'rows':>10} {'seconds':>9} {'records/s':>11}")
+    elapsed = 0.0
+    for phase, kwargs in (("to middle", {"until": middle}), ("resumed", {})):
+        for report in replay(**kwargs, **options):
+            elapsed += report["seconds"]
+            print(f"{report['source']:>8} {report['records']:>12,} {report['rows']:>10,} {report['seconds']:>9.1f} "
+                  f"{report['records'] / max(report['seconds'], 0.1):>11,.0f}   ({phase})")
+
+    with engine.connect() as conn:
+        stars = conn.execute(select(func.count()).select_from(RepoStarSnapshot)).scalar()
+        scores = conn.execute(select(func.count()).select_from(PostScoreSnapshot)).scalar()
+    cycles = args.days * args.cycles * args.records
+    print(f"\n{total:,} records replayed in {elapsed:.0f}s ({total / elapsed:,.0f}/s); "
+          f"snapshots: {stars:,} stars / {cycles:,} expected, {scores:,} scores / {cycles:,} expected")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# benchmarks/bench_search.py
+
+"""Full-text search latency at a million documents.
+
+Fills the FTS5 search_index through storage.search.index_documents with
+synthetic repos, posts and articles whose words follow a Zipf distribution
+(the commonest word appears in nearly every document), then times
+storage.search.search (median and p95 of --repeat runs) for queries from the
+worst case, a word in most documents, down to a rare one. The target is
+under 50ms for every query.
+
+    python benchmarks/bench_search.py --docs 1000000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from sqlalchemy import create_engine, text
+
+from db.database import Base
+from db import models  # noqa: F401  (registers tables and the search index DDL)
+from storage.search import index_documents, search
+
+# Real words at the head of the distribution so the queries below mean something
+HEAD = ["the", "and", "for", "with", "python", "rust", "fast", "linter", "kubernetes", "database",
+        "release", "framework", "javascript", "security", "compiler", "async"]
+VOCABULARY = HEAD + [f"term{i}" for i in range(50_000)]
+WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+KINDS = ["repo", "post", "news"]
+CHUNK = 50_000
+
+QUERIES = {
+    "most docs": ("the", None),
+    "common": ("python", None),
+    "two words": ("fast linter", None),
+    "prefix": ("kube", None),
+    "one kind": ("rust", "post"),
+    "mid": ("term500", None),
+    "rare": ("term40000", None),
+    "no match": ("zzzz", None),
+}
+
+
+def populate(engine, n, seed=0):
+    rng = random.Random(seed)
+    with engine.begin() as conn:
+        for start in range(0, n, CHUNK):
+            size = min(CHUNK, n - start)
+            words = rng.choices(VOCABULARY, WEIGHTS, k=size * 24)
+            for kind in KINDS:
+                documents = [
+                    (i, f"https://example.com/{kind}/{i}", " ".join(words[(i - start) * 24:(i - start) * 24 + 4]),
+                     " ".join(words[(i - start) * 24 + 4:(i - start) * 24 + 24]))
+                    for i in range(start, start + size) if i % len(KINDS) == KINDS.index(kind)
+                ]
+                index_documents(conn, kind, documents)
+        conn.execute(text("INSERT INTO search_index (search_index) VALUES ('optimize')"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmpdir, 'search.db')}")
+        Base.metadata.create_all(engine)
+
+        start = time.perf_counter()
+        populate(engine, args.docs)
+        elapsed = time.perf_counter() - start
+        print(f"indexed {args.docs:,} documents in {elapsed:.1f}s ({args.docs / elapsed:,.0f} docs/s)\n")
+
+        print(f"{'query':>10} {'text':>12} {'kind':>5} {'hits':>5} {'median':>10} {'p95':>10}")
+        worst = 0.0
+        for name, (query, kind) in QUERIES.items():
+            samples = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                rows = search(query, kind, args.limit, bind=engine)
+                samples.append((time.perf_counter() - start) * 1000)
+            p95 = sorted(samples)[int(len(samples) * 0.95) - 1]
+            worst = max(worst, p95)
+            print(f"{name:>10} {query:>12} {kind or '-':>5} {len(rows):>5} "
+                  f"{statistics.median(samples):>8.2f}ms {p95:>8.2f}ms")
+        print(f"\nworst p95 {worst:.2f}ms ({'under' if worst < 50 else 'OVER'} the 50ms target)")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# benchmarks/bench_storage.py
+
+"""Rows/sec of the old per-row ORM loop vs the bulk upsert path.
+
+    python benchmarks/bench_storage.py --sizes 10000,1000000 --batch-size 500
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from db.database import Base
+from db.models import GitHubRepo
+from storage.bulk import upsert_rows
+from storage.github_storage import repo_to_row
+
+
+def synthetic_repos(n, stars_offset=0):
+    now = datetime.utcnow()
+    return [{
+        "name": f"owner{i}/repo-{i}",
+        "url": f"https://github.com/owner{i}/repo-{i}",
+        "stars": i + stars_offset,
+        "description": f"Synthetic repository number {i}",
+        "language": "Python",
+        "timestamp": now,
+    } for i in range(n)]
+
+
+def legacy_save(session_factory, repos):
+    """The pre-bulk save_github_to_db: one ORM object and session.add per row"""
+    session = session_factory()
+    try:
+        for repo in repos:
+            session.add(GitHubRepo(full_name=repo["name"], name=repo["name"], url=repo["url"],
+                                   stars=repo["stars"], description=repo.get("description", ""),
+                                   language=repo.get("language", ""), timestamp=repo["timestamp"]))
+        session.commit()
+    finally:
+        session.close()
+
+
+def fresh_engine(tmpdir, label):
+    engine = create_engine(f"sqlite:///{os.path.join(tmpdir, label)}.db")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,1000000", help="Comma-separated record counts")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'path':<18} {'seconds':>9} {'rows/sec':>12}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for n in (int(size) for size in args.sizes.split(",")):
+            repos = synthetic_repos(n)
+            table = GitHubRepo.__table__
+
+            legacy_engine = fresh_engine(tmpdir, f"legacy_{n}")
+            legacy = timed(lambda: legacy_save(sessionmaker(bind=legacy_engine), repos))
+
+            bulk_engine = fresh_engine(tmpdir, f"bulk_{n}")
+            rows = [repo_to_row(repo) for repo in repos]
+            insert = timed(lambda: upsert_rows(table, rows, "full_name", args.batch_size, bind=bulk_engine))
+
+            # Second cycle over the same keys exercises the ON CONFLICT UPDATE branch
+            rows = [repo_to_row(repo) for repo in synthetic_repos(n, stars_offset=1)]
+            update = timed(lambda: upsert_rows(table, rows, "full_name", args.batch_size, bind=bulk_engine))
+
+            for label, seconds in (("orm session.add", legacy), ("upsert (insert)", insert), ("upsert (update)", update)):
+                print(f"{n:>10} {label:<18} {seconds:>9.2f} {n / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+# benchmarks/bench_suite.py
+
+"""End-to-end ingestion benchmark: every stage, against the local mock APIs.
+
+Runs one ingestion cycle per --rounds against mock_server.MockAPIServer
+(synthetic answers at --latency and the given volumes, or the recordings in
+--fixtures, see record_fixtures.py) and a throwaway SQLite database, timing
+each stage on its own:
+
+    fetch      fetch_top_repos, fetch_top_posts (praw), fetch_tech_news
+    transform  normalize_repos, normalize_posts, summarize_text, get_sentiment_label
+    storage    save_github_to_db, save_reddit_to_db, save_news_to_db
+    dashboard  the dashboard.queries panel functions, bypassing the panel cache
+
+Per stage it reports calls, items, p50 / p95 / max latency and items/s, and
+writes them as JSON to --output. With --baseline it compares the p50s to an
+earlier result file and exits 1 if any stage got slower than --tolerance
+allows, so it can gate a change in CI. With --profile the rounds are also
+recorded as a utils.profiling run, to see where a regressed stage spends
+its time (`devradar_cli --compare`). Unlike src/test.py it never calls a
+live API or touches devradar.db.
+
+    python benchmarks/bench_suite.py --rounds 5 --latency 0.05 --output suite.json
+    python benchmarks/bench_suite.py --baseline suite.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import logging
+
+import requests
+
+from mock_server import MockAPIServer
+
+NOISE_FLOOR_MS = 0.5  # p50s below this are too noisy to call a regression
+
+
+class StageTimer:
+    """Latency and item count of every call, per stage"""
+
+    def __init__(self):
+        self.calls = defaultdict(list)  # stage -> [(seconds, items)]
+
+    def __call__(self, stage, fn, *args, **kwargs):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        items = len(result) if isinstance(result, (list, tuple)) else 1
+        self.calls[stage].append((elapsed, items))
+        return result
+
+    def summary(self):
+        stages = {}
+        for stage, calls in self.calls.items():
+            latencies = sorted(seconds * 1000 for seconds, _ in calls)
+            total = sum(seconds for seconds, _ in calls)
+            items = sum(n for _, n in calls)
+            stages[stage] = {
+                "calls": len(calls),
+                "items": items,
+                "total_s": round(total, 4),
+                "p50_ms": round(statistics.median(latencies), 3),
+                "p95_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3),
+                "max_ms": round(latencies[-1], 3),
+                "items_per_s": round(items / total, 1) if total else None,
+            }
+        return stages
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def regressions(stages, baseline, tolerance):
+    """(stage, baseline p50, p50) for every stage slower than the baseline allows"""
+    slower = []
+    for stage, result in stages.items():
+        before = baseline.get("stages", {}).get(stage)
+        if before and before["p50_ms"] >= NOISE_FLOOR_MS and result["p50_ms"] > before["p50_ms"] * (1 + tolerance):
+            slower.append((stage, before["p50_ms"], result["p50_ms"]))
+    return slower
+
+
+def run_cycle(timer, server, args):
+    from dashboard import queries
+    from ingest.github_ingest import fetch_top_repos
+    from ingest.news_ingest import fetch_tech_news
+    from ingest.reddit_ingest import fetch_top_posts
+    from storage.db_helpers import save_github_to_db, save_news_to_db, save_reddit_to_db
+    from transform.github_transform import normalize_repos
+    from transform.news_transform import get_sentiment_label, summarize_text
+    from transform.reddit_transform import normalize_posts
+
+    repos, posts = [], []
+    for language in args.languages.split(","):
+        repos += timer("fetch.fetch_top_repos", fetch_top_repos, language, limit=args.repos)
+    for subreddit in args.subreddits.split(","):
+        posts += timer("fetch.fetch_top_posts", fetch_top_posts, subreddit, limit=args.posts)
+    articles = timer("fetch.fetch_tech_news", fetch_tech_news, "bench-key", limit=args.articles)
+
+    # normalize_repos takes the raw search items fetch_top_repos has already formatted
+    raw = requests.get(f"{server.url}/search/repositories", params={"q": "language:python", "per_page": 100},
+                       timeout=30).json().get("items", [])
+    timer("transform.normalize_repos", normalize_repos, raw)
+    posts = timer("transform.normalize_posts", normalize_posts, posts)
+    news = []
+    for article in articles:
+        summary = timer("transform.summarize_text", summarize_text, article["description"])
+        sentiment = timer("transform.get_sentiment_label", get_sentiment_label, article["description"])
+        news.append({"title": article["title"], "summary": summary, "sentiment": sentiment, "url": article["link"],
+                     "source": article.get("source", ""), "published_at": article.get("pubDate", ""),
+                     "topics": article.get("topics", [])})
+
+    for stage, save, items in (("storage.save_github_to_db", save_github_to_db, repos),
+                               ("storage.save_reddit_to_db", save_reddit_to_db, posts),
+                               ("storage.save_news_to_db", save_news_to_db, news)):
+        start = time.perf_counter()
+        save(items)
+        timer.calls[stage].append((time.perf_counter() - start, len(items)))
+
+    # Bypass the panel cache: this measures the SQL itself
+    panels = {
+        "dashboard.dashboard_stats": lambda: queries.dashboard_stats.uncached(),
+        "dashboard.repo_languages": lambda: queries.repo_languages.uncached(),
+        "dashboard.top_repos": lambda: queries.top_repos.uncached(None, 5),
+        "dashboard.top_repos_by_language": lambda: queries.top_repos.uncached(args.languages.split(",")[0], 5),
+        "dashboard.top_posts": lambda: queries.top_posts.uncached(5),
+        "dashboard.latest_news": lambda: queries.latest_news.uncached(6),
+        "dashboard.search_content": lambda: queries.search_content.uncached("build tool"),
+    }
+    for stage, panel in panels.items():
+        timer(stage, panel)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5, help="Ingestion cycles to time")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per mock API call")
+    parser.add_argument("--fixtures", help="Directory of recorded responses to replay instead of synthetic ones")
+    parser.add_argument("--languages", default="python,rust,go")
+    parser.add_argument("--repos", type=int, default=30, help="Repos per language (fetch_top_repos limit)")
+    parser.add_argument("--subreddits", default="programming,python")
+    parser.add_argument("--posts", type=int, default=100, help="Posts per subreddit")
+    parser.add_argument("--articles", type=int, default=10, help="News articles per cycle")
+    parser.add_argument("--output", default=f"bench_suite_{datetime.now():%Y%m%d_%H%M%S}.json")
+    parser.add_argument("--baseline", help="Earlier --output file to compare p50s against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed p50 slowdown vs --baseline (0.25 = 25%%)")
+    parser.add_argument("--profile", action="store_true", help="Record the rounds as a profile run under runs/")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp()
+    # A quota that never binds, on a window that ends after the limiter's own, so its budget is adopted
+    server_options = {"latency": args.latency, "search_limit": 1_000_000, "window": 3600,
+                      "search_total": args.repos * 10, "news_size": args.articles * 2,
+                      "news_total": args.articles * 100, "reddit_size": args.posts, "fixtures": args.fixtures}
+    with MockAPIServer(**server_options) as server:
+        # Module-level URLs and the database are read at import time, so set them first
+        os.environ.update({
+            "GITHUB_API_URL": server.url,
+            "NEWSDATA_API_URL": f"{server.url}/api/1",
+            "REDDIT_OAUTH_URL": server.url,
+            "REDDIT_URL": server.url,
+            "DATABASE_URL": f"sqlite:///{os.path.join(tmpdir, 'bench.db')}",
+            "DEVRADAR_GITHUB_HTTP_CACHE": "",  # every call should reach the mock
+            "DEVRADAR_NLP_CACHE": "",
+            "DEVRADAR_ARCHIVE_DIR": "",
+        })
+        for name in ("REDDIT_CLIENT_ID", "REDDIT_CLIENT_SECRET", "REDDIT_USER_AGENT"):
+            os.environ.setdefault(name, "devradar-bench")
+        logging.disable(logging.WARNING)
+
+        from db.create_tables import init_db
+        from utils.profiling import profiled
+        init_db()
+
+        timer = StageTimer()
+        started = time.perf_counter()
+        with profiled("bench-suite", args.profile):
+            for _ in range(args.rounds):
+                run_cycle(timer, server, args)
+        elapsed = time.perf_counter() - started
+        requests_made = server.hits
+
+    stages = timer.summary()
+    result = {
+        "suite": "bench_suite",
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": vars(args),
+        "seconds": round(elapsed, 2),
+        "requests": requests_made,
+        "stages": stages,
+    }
+    with open(args.output, "w") as f:
+        json.dump(result, f, indent=2)
+
+    print(f"{'stage':<36} {'calls':>6} {'items':>7} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'items/s':>10}")
+    for stage, s in stages.items():
+        rate = f"{s['items_per_s']:,.0f}" if s["items_per_s"] is not None else "-"
+        print(f"{stage:<36} {s['calls']:>6} {s['items']:>7} {s['p50_ms']:>9.2f} {s['p95_ms']:>9.2f} "
+              f"{s['max_ms']:>9.2f} {rate:>10}")
+    print(f"\n{args.rounds} cycles in {elapsed:.1f}s, {requests_made} mock API requests; results in {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            slower = regressions(stages, json.load(f), args.tolerance)
+        for stage, before, after in slower:
+            print(f"REGRESSION {stage}: p50 {before:.2f}ms -> {after:.2f}ms")
+        if slower:
+            sys.exit(1)
+        print(f"no stage slower than {args.baseline} by more than {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
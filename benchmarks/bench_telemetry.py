@@ -0,0 +1,69 @@
+# benchmarks/bench_telemetry.py
+
+"""What the always-on telemetry costs per instrumented call.
+
+Times utils.telemetry.stage() around an empty block (histogram plus the
+default no-op tracer), then with an SDK tracer provider whose spans go to a
+BatchSpanProcessor and are dropped, and a bare histogram observation. Every
+fetch, transform and save call pays one stage(); compare with the
+per-stage latencies of bench_suite.py.
+
+    python benchmarks/bench_telemetry.py --calls 200000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+
+def per_call(fn, calls):
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    from utils import telemetry
+
+    def staged():
+        with telemetry.stage("bench.empty"):
+            pass
+
+    def observed():
+        telemetry.ROWS_WRITTEN.labels("bench").observe(100)
+
+    print(f"{'case':<28} {'us/call':>9}")
+    print(f"{'histogram observe':<28} {per_call(observed, args.calls):>9.2f}")
+    print(f"{'stage(), no tracer':<28} {per_call(staged, args.calls):>9.2f}")
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult
+    except ImportError:
+        print("opentelemetry-sdk is not installed, skipping the traced case")
+        return
+
+    class DropExporter(SpanExporter):
+        def export(self, spans):
+            return SpanExportResult.SUCCESS
+
+    provider = TracerProvider()
+    provider.add_span_processor(BatchSpanProcessor(DropExporter()))
+    trace.set_tracer_provider(provider)
+    telemetry._tracer = trace.get_tracer("devradar")
+    print(f"{'stage(), SDK + batch export':<28} {per_call(staged, args.calls):>9.2f}")
+    provider.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+# benchmarks/mock_server.py
+
+"""Local stand-in for the GitHub search, Reddit (as praw calls it) and NewsData APIs.
+
+Every request sleeps ``latency`` seconds before answering, so benchmarks can
+measure how much of a cycle is spent waiting on the network. Responses carry
+an ETag; a matching If-None-Match gets an empty 304, like GitHub's. Search
+calls are metered like GitHub's: ``search_limit`` per ``window`` seconds,
+then 403 until the window resets.
+
+Answers are synthetic (``search_total`` repos, ``news_total`` articles,
+``reddit_size`` posts per listing) unless a ``fixtures`` directory is given:
+recorded responses found there are replayed instead. With ``record=True``
+each request is forwarded to the real API and its answer saved there
+(see record_fixtures.py).
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlparse
+
+import requests
+
+
+NEWS_EPOCH = datetime(2025, 6, 1)
+
+
+def fake_repo(i, language="Python"):
+    return {
+        "name": f"repo-{i}",
+        "full_name": f"owner{i}/{language.lower()}-repo-{i}",
+        "html_url": f"https://github.com/owner{i}/{language.lower()}-repo-{i}",
+        "stargazers_count": 10_000 - i,
+        "description": f"Synthetic repository number {i}",
+        "language": language,
+    }
+
+
+def fake_article(i):
+    """Article `i`; higher numbers are published later"""
+    return {
+        "article_id": f"article-{i}",
+        "title": f"Developer tools update {i}",
+        "link": f"https://news.example.com/{i}",
+        "description": f"A new software framework release for developers, issue {i}.",
+        "pubDate": (NEWS_EPOCH + timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S"),
+        "source_id": "mocknews",
+    }
+
+
+REDDIT_TOP_RE = re.compile(r"^/r/([^/]+)/top/?$")
+
+# Where record mode forwards each route (the client keeps its own credentials)
+UPSTREAMS = {
+    "github-search": "https://api.github.com",
+    "news": "https://newsdata.io",
+    "reddit-token": "https://www.reddit.com",
+    "reddit-top": "https://oauth.reddit.com",
+}
+KEPT_HEADERS = ("x-ratelimit-", "link")  # recorded and replayed; nothing else is stored
+
+
+def route_of(path):
+    if path.endswith("/search/repositories"):
+        return "github-search"
+    if path.endswith("/news"):
+        return "news"
+    if path.endswith("/api/v1/access_token"):
+        return "reddit-token"
+    if REDDIT_TOP_RE.match(path):
+        return "reddit-top"
+    return None
+
+
+POST_WORDS = ("rust python compiler release faster build tool async runtime database query engine open source "
+              "library framework cache memory leak benchmark kernel linux container cloud deploy testing "
+              "parser syntax editor plugin terminal shell package manager security audit").split()
+
+
+def fake_post(i, subreddit="programming"):
+    """Listing child `i` in Reddit's wire format (praw builds its Submission from it)"""
+    return {"kind": "t3", "data": {
+        "id": f"post{i}",
+        "name": f"t3_post{i}",
+        "title": " ".join(random.Random(i).sample(POST_WORDS, 6)) + f" #{i}",
+        "score": 5_000 - i,
+        "url": f"https://example.com/{subreddit}/{i}",
+        "permalink": f"/r/{subreddit}/comments/post{i}/",
+        "created_utc": 1_750_000_000.0 + i,
+        "num_comments": i % 300,
+        "author": f"user{i % 97}",
+        "subreddit": subreddit,
+    }}
+
+
+class FixtureStore:
+    """Recorded responses, one JSON file per request in `directory`.
+
+    A request replays the recording of the same method, path and query; if
+    there is none, recordings of the same route stand in, in turn (GitHub
+    searches embed today's date, so they never repeat exactly).
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._by_target = {}
+        self._by_route = defaultdict(list)
+        self._turn = Counter()
+        self._lock = threading.Lock()
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".json"):
+                with open(os.path.join(directory, name)) as f:
+                    self._add(json.load(f))
+
+    def _add(self, fixture):
+        self._by_target[(fixture["method"], fixture["target"])] = fixture
+        self._by_route[fixture["route"]].append(fixture)
+
+    def __len__(self):
+        return len(self._by_target)
+
+    def replay(self, route, method, target):
+        with self._lock:
+            fixture = self._by_target.get((method, target))
+            candidates = self._by_route.get(route)
+            if fixture is None and candidates:
+                fixture = candidates[self._turn[route] % len(candidates)]
+                self._turn[route] += 1
+            return fixture
+
+    def record(self, route, method, target, status, headers, body):
+        fixture = {"route": route, "method": method, "target": target, "status": status,
+                   "headers": headers, "body": body}
+        name = f"{route}-{hashlib.sha1(f'{method} {target}'.encode()).hexdigest()[:12]}.json"
+        with self._lock:
+            with open(os.path.join(self.directory, name), "w") as f:
+                json.dump(fixture, f, indent=1)
+            self._add(fixture)
+
+
+def canonical_target(parsed):
+    """Path plus sorted query, so parameter order doesn't split recordings"""
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return f"{parsed.path}?{query}" if query else parsed.path
+
+
+class MockAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.handle_api("GET")
+
+    def do_POST(self):
+        self.handle_api("POST")
+
+    def handle_api(self, method):
+        time.sleep(self.server.latency)
+        parsed = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        self.server.hits += 1
+        length = int(self.headers.get("Content-Length") or 0)
+        data = self.rfile.read(length) if length else b""
+        route = route_of(parsed.path)
+        if route is None:
+            self.send_error(404)
+            return
+
+        if self.server.record:
+            status, headers, body = self.forward(route, method, data)
+            # Token responses hold a live credential: passed through, never written down
+            if route != "reddit-token" and status == 200:
+                self.server.fixtures.record(route, method, canonical_target(parsed), status, headers, body)
+            self.send_json(status, body, headers)
+            return
+        if self.server.fixtures is not None:
+            fixture = self.server.fixtures.replay(route, method, canonical_target(parsed))
+            if fixture is not None:
+                self.send_json(fixture["status"], fixture["body"], fixture["headers"])
+                return
+
+        if route == "github-search":
+            per_page = int(params.get("per_page", 30))
+            first = (int(params.get("page", 1)) - 1) * per_page
+            language = params.get("q", "language:python").split()[0].split(":")[-1]
+            items = range(first, min(first + per_page, self.server.search_total))
+            body = {"total_count": self.server.search_total, "items": [fake_repo(i, language) for i in items]}
+            remaining, reset_at = self.server.take_search_quota()
+            headers = {
+                "X-RateLimit-Limit": str(self.server.search_limit),
+                "X-RateLimit-Remaining": str(max(remaining, 0)),
+                "X-RateLimit-Reset": str(reset_at),
+                "X-RateLimit-Resource": "search",
+            }
+            if remaining < 0:
+                self.server.rejected += 1
+                self.send_json(403, {"message": "API rate limit exceeded"}, headers, etag=False)
+                return
+        elif route == "news":
+            # Newest first, news_size per page, nextPage is an opaque token like NewsData's
+            offset = int(params.get("page", 0))
+            newest = self.server.news_total - 1 - offset
+            ids = range(newest, max(newest - self.server.news_size, -1), -1)
+            next_offset = offset + self.server.news_size
+            body = {
+                "results": [fake_article(i) for i in ids],
+                "nextPage": str(next_offset) if next_offset < self.server.news_total else None,
+            }
+            headers = {}
+        elif route == "reddit-token":
+            body = {"access_token": "mock-token", "token_type": "bearer", "expires_in": 86400, "scope": "*"}
+            headers = {}
+        else:
+            # reddit_size posts per listing, paged by `after` like Reddit's
+            subreddit = REDDIT_TOP_RE.match(parsed.path).group(1).split("+")[0]
+            first = int(params["after"][len("t3_post"):]) + 1 if params.get("after") else 0
+            ids = range(first, min(first + int(params.get("limit", 25)), self.server.reddit_size))
+            children = [fake_post(i, subreddit) for i in ids]
+            after = children[-1]["data"]["name"] if children and ids[-1] + 1 < self.server.reddit_size else None
+            body = {"kind": "Listing", "data": {"after": after, "dist": len(children), "children": children}}
+            headers = {}
+        self.send_json(200, body, headers)
+
+    def forward(self, route, method, data):
+        """The upstream API's answer to this request: (status, kept headers, JSON body)"""
+        headers = {key: value for key, value in self.headers.items()
+                   if key.lower() not in ("host", "content-length", "accept-encoding", "connection")}
+        response = requests.request(method, UPSTREAMS[route] + self.path, headers=headers, data=data or None,
+                                    timeout=30)
+        kept = {key: value for key, value in response.headers.items() if key.lower().startswith(KEPT_HEADERS)}
+        try:
+            body = response.json()
+        except ValueError:
+            body = {"message": response.text}
+        return response.status_code, kept, body
+
+    def send_json(self, status, body, headers=None, etag=True):
+        payload = json.dumps(body).encode()
+        headers = headers or {}
+        if status == 200 and etag:
+            tag = f'"{hashlib.sha1(payload).hexdigest()}"'
+            if self.headers.get("If-None-Match") == tag:
+                self.server.not_modified += 1
+                self.send_response(304)
+                self.send_header("ETag", tag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            headers = {**headers, "ETag": tag}
+            self.server.bytes_sent += len(payload)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockAPIServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, latency=0.2, news_size=20, port=0, search_limit=30, window=60, search_total=1000,
+                 news_total=200, reddit_size=100, fixtures=None, record=False):
+        super().__init__(("127.0.0.1", port), MockAPIHandler)
+        self.latency = latency
+        self.news_size = news_size
+        self.reddit_size = reddit_size  # posts per top listing
+        self.fixtures = FixtureStore(fixtures) if fixtures else None
+        self.record = record  # forward to UPSTREAMS and save what comes back into `fixtures`
+        self.news_total = news_total  # grow it to "publish" new articles
+        self.search_total = search_total
+        self.search_limit = search_limit
+        self.window = window
+        self.rejected = 0
+        self._window_start = time.time()
+        self._window_used = 0
+        self._quota_lock = threading.Lock()
+        self.hits = 0
+        self.not_modified = 0
+        self.bytes_sent = 0
+        self._thread = None
+
+    def take_search_quota(self):
+        """Count one search call; returns (remaining after it, window reset epoch)"""
+        with self._quota_lock:
+            now = time.time()
+            if now >= self._window_start + self.window:
+                self._window_start, self._window_used = now, 0
+            self._window_used += 1
+            return self.search_limit - self._window_used, int(self._window_start + self.window) + 1
+
+    @property
+    def url(self):
+        host, port = self.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
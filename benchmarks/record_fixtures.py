@@ -0,0 +1,54 @@
+# benchmarks/record_fixtures.py
+
+"""Record live GitHub, Reddit and NewsData responses as fixtures for the mock server.
+
+Runs the real ingest functions through mock_server.MockAPIServer in record
+mode: each request is forwarded to the live API with the credentials from
+.env (GITHUB_TOKEN, REDDIT_CLIENT_ID / _SECRET / USER_AGENT, NEWSDATA_API_KEY)
+and the answer is saved under --fixtures, minus every header but the rate
+limit ones. Reddit access tokens are passed through, never saved. Replay
+them with `bench_suite.py --fixtures <dir>`.
+
+    python benchmarks/record_fixtures.py --fixtures benchmarks/fixtures --languages python,rust
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_server import MockAPIServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=os.path.join(ROOT, "benchmarks", "fixtures"))
+    parser.add_argument("--languages", default="python", help="Comma-separated languages for fetch_top_repos")
+    parser.add_argument("--subreddits", default="programming", help="Comma-separated subreddits for fetch_top_posts")
+    parser.add_argument("--posts", type=int, default=25, help="Posts per subreddit")
+    args = parser.parse_args()
+
+    with MockAPIServer(latency=0, fixtures=args.fixtures, record=True) as server:
+        os.environ["GITHUB_API_URL"] = server.url
+        os.environ["NEWSDATA_API_URL"] = f"{server.url}/api/1"
+        os.environ["REDDIT_OAUTH_URL"] = os.environ["REDDIT_URL"] = server.url
+        os.environ["DEVRADAR_GITHUB_HTTP_CACHE"] = ""  # every call should reach the API
+
+        from ingest.github_ingest import fetch_top_repos
+        from ingest.news_ingest import fetch_tech_news
+        from ingest.reddit_ingest import fetch_top_posts
+
+        for language in args.languages.split(","):
+            fetch_top_repos(language)
+        for subreddit in args.subreddits.split(","):
+            fetch_top_posts(subreddit, limit=args.posts)
+        if os.getenv("NEWSDATA_API_KEY"):
+            fetch_tech_news(os.getenv("NEWSDATA_API_KEY"))
+        print(f"{len(server.fixtures)} fixtures in {args.fixtures} ({server.hits} requests)")
+
+
+if __name__ == "__main__":
+    main()
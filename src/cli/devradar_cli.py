@@ -1,18 +1,39 @@
 # src/cli/devradar_cli.py
 
 import argparse
+import asyncio
 import os  # ✅ Fix: import os to use os.getenv
+from datetime import date
 from ingest.github_ingest import fetch_top_repos
 from ingest.reddit_ingest import fetch_top_posts
 from ingest.news_ingest import fetch_tech_news
 from transform.reddit_transform import normalize_posts
-from transform.news_transform import summarize_text, get_sentiment_label
+from transform.news_transform import enrich_texts
+from utils.profiling import compare_runs, profiled
+from utils.telemetry import configure_tracing
 
 def show_github():
     repos = fetch_top_repos(limit=5)
     for repo in repos:
         print(f"{repo['name']} - ⭐ {repo['stars']} - {repo['url']}")
 
+def sweep_github(pages=None):
+    from flows.devradar_flow import page_saver
+    from ingest.async_ingest import sweep_languages_async
+
+    kwargs = {"pages": pages} if pages else {}
+    report = asyncio.run(sweep_languages_async(page_saver(), **kwargs))
+    print(f"Stored {report['repos']} repos across {report['languages']} languages in {report['seconds']}s "
+          f"({report['repos_per_sec']} repos/s, {report['search_quota_used']} search requests)")
+
+def replay_archive(sources, since=None, until=None, workers=None, chunk_size=None, fresh=False):
+    from flows.replay import replay
+
+    kwargs = {key: value for key, value in (("workers", workers), ("chunk_size", chunk_size)) if value}
+    for report in replay(sources, since=since, until=until, fresh=fresh, **kwargs):
+        print(f"{report['source']}: {report['records']} records from {report['inputs']} files -> "
+              f"{report['rows']} rows in {report['seconds']}s")
+
 def show_reddit():
     posts = normalize_posts(fetch_top_posts(limit=5))
     for post in posts:
@@ -25,9 +46,8 @@ def show_news():
         return
 
     news = fetch_tech_news(api_key=api_key, limit=5)
-    for article in news:
-        summary = summarize_text(article["description"])
-        sentiment = get_sentiment_label(article["description"])
+    enriched = enrich_texts([article["description"] for article in news])
+    for article, (summary, sentiment) in zip(news, enriched):
         print(f"\n📌 {article['title']} ({sentiment})")
         print(f"🧠 {summary}")
         print(f"🔗 {article['link']}\n")
@@ -35,19 +55,51 @@ def show_news():
 def main():
     parser = argparse.ArgumentParser(description="DevRadar CLI - Get quick trends from GitHub, Reddit, News")
     parser.add_argument("--github", action="store_true", help="Show top GitHub repos")
+    parser.add_argument("--github-sweep", action="store_true", help="Ingest repos for every language into the database")
+    parser.add_argument("--pages", type=int, help="Pages per language for --github-sweep")
     parser.add_argument("--reddit", action="store_true", help="Show top Reddit posts")
     parser.add_argument("--news", action="store_true", help="Show top tech news")
+    parser.add_argument("--replay", action="store_true", help="Rebuild the database from archived records, no API calls")
+    parser.add_argument("--source", action="append", choices=["github", "reddit", "news"],
+                        help="Source for --replay (repeatable; default all)")
+    parser.add_argument("--since", type=date.fromisoformat, help="First fetch date (YYYY-MM-DD) for --replay")
+    parser.add_argument("--until", type=date.fromisoformat, help="Last fetch date (YYYY-MM-DD) for --replay")
+    parser.add_argument("--workers", type=int, help="Worker processes for --replay (default one per CPU)")
+    parser.add_argument("--chunk-size", type=int, help="Records per chunk for --replay")
+    parser.add_argument("--fresh", action="store_true", help="Ignore --replay checkpoints and start from the oldest file")
+    parser.add_argument("--profile", action="store_true",
+                        help="Record sampled per-stage profiles and allocations of the command under runs/")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"),
+                        help="Show what changed between two --profile runs (directories or run names)")
 
     args = parser.parse_args()
+    configure_tracing()
 
-    if args.github:
-        show_github()
-    elif args.reddit:
-        show_reddit()
-    elif args.news:
-        show_news()
-    else:
+    if args.compare:
+        try:
+            print("\n".join(compare_runs(*args.compare)))
+        except FileNotFoundError as e:
+            parser.error(str(e))
+        return
+
+    action = next((name for name in ("github", "github_sweep", "replay", "reddit", "news") if getattr(args, name)),
+                  None)
+    if action is None:
         parser.print_help()
+        return
+
+    with profiled(f"cli-{action.replace('_', '-')}", args.profile):
+        if args.github:
+            show_github()
+        elif args.github_sweep:
+            sweep_github(args.pages)
+        elif args.replay:
+            replay_archive(args.source or ["github", "reddit", "news"], args.since, args.until, args.workers,
+                           args.chunk_size, args.fresh)
+        elif args.reddit:
+            show_reddit()
+        elif args.news:
+            show_news()
 
 if __name__ == "__main__":
     main()
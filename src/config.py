@@ -0,0 +1,69 @@
+# src/config.py
+
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Rows sent per INSERT ... ON CONFLICT statement by the bulk storage path
+UPSERT_BATCH_SIZE = int(os.getenv("DEVRADAR_UPSERT_BATCH_SIZE", "500"))
+
+# Dashboard panel cache, shared by every connected client
+PANEL_CACHE_TTL = float(os.getenv("DEVRADAR_PANEL_CACHE_TTL", "300"))
+PANEL_CACHE_SIZE = int(os.getenv("DEVRADAR_PANEL_CACHE_SIZE", "256"))
+
+# Worker threads the dashboard uses for database reads
+DASHBOARD_DB_WORKERS = int(os.getenv("DEVRADAR_DASHBOARD_DB_WORKERS", "4"))
+
+# Seconds between the dashboard's checks for newly committed ingests
+CHANGE_POLL_INTERVAL = float(os.getenv("DEVRADAR_CHANGE_POLL_INTERVAL", "0.5"))
+
+# On-disk conditional (ETag / Last-Modified) cache for GitHub API responses; empty disables it
+GITHUB_HTTP_CACHE_PATH = os.getenv("DEVRADAR_GITHUB_HTTP_CACHE", ".cache/github_http.sqlite3")
+
+# Depth of the all-languages GitHub sweep: pages per language and repos per page (max 100)
+GITHUB_SWEEP_PAGES = int(os.getenv("DEVRADAR_GITHUB_SWEEP_PAGES", "3"))
+GITHUB_SWEEP_PER_PAGE = int(os.getenv("DEVRADAR_GITHUB_SWEEP_PER_PAGE", "100"))
+
+# News enrichment (LSA summary + sentiment): process-pool workers (0 = one per CPU) and texts per task
+NLP_WORKERS = int(os.getenv("DEVRADAR_NLP_WORKERS", "0"))
+NLP_BATCH_SIZE = int(os.getenv("DEVRADAR_NLP_BATCH_SIZE", "64"))
+
+# Persistent memo of enrichment results shared by every entry point; empty path disables it
+NLP_CACHE_PATH = os.getenv("DEVRADAR_NLP_CACHE", ".cache/nlp_memo.sqlite3")
+NLP_CACHE_SIZE = int(os.getenv("DEVRADAR_NLP_CACHE_SIZE", "50000"))
+
+# Most NewsData pages one incremental run walks back before giving up on reaching known articles
+NEWS_MAX_PAGES = int(os.getenv("DEVRADAR_NEWS_MAX_PAGES", "5"))
+
+# JSON file of {topic: [keywords]} for the news topic matcher; empty uses transform.topics.DEFAULT_TOPICS
+TOPICS_FILE = os.getenv("DEVRADAR_TOPICS_FILE", "")
+
+# Subreddits covered by Reddit ingestion (comma-separated) and how deep each one goes
+REDDIT_SUBREDDITS = [name.strip() for name in os.getenv(
+    "DEVRADAR_SUBREDDITS", "programming,python,javascript,golang,rust,webdev,machinelearning,devops"
+).split(",") if name.strip()]
+REDDIT_POSTS_PER_SUBREDDIT = int(os.getenv("DEVRADAR_REDDIT_POSTS_PER_SUBREDDIT", "10"))
+REDDIT_TIME_FILTER = os.getenv("DEVRADAR_REDDIT_TIME_FILTER", "day")
+
+# Full-text search ranks (BM25) only this many of the newest matches, bounding the cost of common terms
+SEARCH_CANDIDATES = int(os.getenv("DEVRADAR_SEARCH_CANDIDATES", "2000"))
+
+# Estimated title word-set similarity (Jaccard, 0-1) at which posts or articles count as the same story
+NEAR_DUP_THRESHOLD = float(os.getenv("DEVRADAR_NEAR_DUP_THRESHOLD", "0.7"))
+
+# Root of the Parquet archive of raw ingested records (source=/date= partitions); empty disables archiving
+ARCHIVE_DIR = os.getenv("DEVRADAR_ARCHIVE_DIR", "data/archive")
+
+# Replay of archived records (flows.replay): process-pool workers (0 = one per CPU) and records per chunk
+REPLAY_WORKERS = int(os.getenv("DEVRADAR_REPLAY_WORKERS", "0"))
+REPLAY_CHUNK_SIZE = int(os.getenv("DEVRADAR_REPLAY_CHUNK_SIZE", "5000"))
+
+# Span exporter for utils.telemetry: "console", "otlp" (OTEL_EXPORTER_OTLP_* settings) or empty for none
+TRACING_EXPORTER = os.getenv("DEVRADAR_TRACING", "")
+
+# --profile runs (utils.profiling): where they are written, seconds between stack samples and
+# traceback depth of tracemalloc allocation sites (0 turns allocation tracking off)
+PROFILE_DIR = os.getenv("DEVRADAR_PROFILE_DIR", "runs")
+PROFILE_INTERVAL = float(os.getenv("DEVRADAR_PROFILE_INTERVAL", "0.005"))
+PROFILE_TRACEMALLOC_FRAMES = int(os.getenv("DEVRADAR_PROFILE_TRACEMALLOC_FRAMES", "1"))
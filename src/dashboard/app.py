@@ -1,9 +1,23 @@
-from nicegui import ui
-import pandas as pd
-from sqlalchemy import create_engine
+from nicegui import app, ui
+from starlette.responses import Response
 from datetime import datetime
+from html import escape
 import asyncio
 import logging
+import os
+import sys
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from config import CHANGE_POLL_INTERVAL, REDDIT_SUBREDDITS
+from dashboard import queries
+from dashboard.components import (KeyedList, StatsBar, loading_card, message_card, news_card, post_card, repo_card,
+                                  search_result_card, subreddit_badge)
+from dashboard.live import ChangeWatcher
+from utils.cache import panel_cache
+from utils.profiling import Profiler
+from utils.telemetry import configure_tracing, metrics_payload, stage
 # from flows.devradar_flow import devradar_pipeline
 
 # Setup logging
@@ -58,52 +72,53 @@ ui.add_head_html('''
 </style>
 ''')
 
-engine = create_engine("sqlite:///devradar.db")
+configure_tracing()
+
+# `python src/dashboard/app.py --profile` records every refresh until shutdown (see utils.profiling)
+if "--profile" in sys.argv[1:]:
+    app.on_shutdown(Profiler("dashboard").start(track_caller=False).stop)
+
+
+@app.get("/metrics")
+def metrics():
+    """Prometheus scrape endpoint (see utils.telemetry)"""
+    body, content_type = metrics_payload()
+    return Response(body, media_type=content_type)
 
 # Global state for auto-refresh
 last_update_time = datetime.now()
 is_refreshing = False
 
 # Safe data loading with error handling
-def safe_load_data(query, fallback_message="No data available"):
-    """Safely load data from database with error handling"""
+async def safe_load_data(query_fn, *args, fallback_message="No data available"):
+    """Safely run a dashboard query off the event loop with error handling"""
     try:
-        df = pd.read_sql(query, engine)
-        if df.empty:
-            logger.warning(f"Empty result for query: {query[:50]}...")
+        rows = await queries.run_query(query_fn, *args)
+        if not rows:
+            logger.warning(f"Empty result for query: {query_fn.__name__}")
             return None
-        return df
+        return rows
     except Exception as e:
         logger.error(f"Database error: {str(e)}")
         ui.notify(f"⚠️ {fallback_message}", type="warning", timeout=3000)
         return None
 
 # Get stats with error handling
-def get_dashboard_stats():
+async def get_dashboard_stats():
     """Get dashboard statistics safely"""
     try:
-        stats = {}
-        
-        # GitHub stats
-        github_df = safe_load_data("SELECT COUNT(*) as count, MAX(timestamp) as last_update FROM github_repos")
-        stats['github_count'] = github_df.iloc[0]['count'] if github_df is not None else 0
-        stats['github_last_update'] = github_df.iloc[0]['last_update'] if github_df is not None else "Never"
-        
-        # Reddit stats  
-        reddit_df = safe_load_data("SELECT COUNT(*) as count FROM reddit_posts")
-        stats['reddit_count'] = reddit_df.iloc[0]['count'] if reddit_df is not None else 0
-        
-        # News stats
-        news_df = safe_load_data("SELECT COUNT(*) as count FROM tech_news")
-        stats['news_count'] = news_df.iloc[0]['count'] if news_df is not None else 0
-        
+        stats = await safe_load_data(queries.dashboard_stats)
+        if stats is None:
+            return {'github_count': 0, 'reddit_count': 0, 'news_count': 0, 'last_update': 'Never'}
+        stats = dict(stats)  # cached rows are shared between clients
+        stats['last_update'] = stats['last_update'] or "Never"
         return stats
     except Exception as e:
         logger.error(f"Error getting stats: {str(e)}")
-        return {'github_count': 0, 'reddit_count': 0, 'news_count': 0, 'github_last_update': 'Error'}
+        return {'github_count': 0, 'reddit_count': 0, 'news_count': 0, 'last_update': 'Error'}
 
-# Initialize stats
-dashboard_stats = get_dashboard_stats()
+# Initialize stats (filled in by the first refresh once the event loop runs)
+dashboard_stats = {'github_count': 0, 'reddit_count': 0, 'news_count': 0, 'last_update': 'Never'}
 
 # === HEADER WITH STATS ===
 with ui.row().classes("w-full justify-between items-center mb-8 p-6"):
@@ -113,52 +128,52 @@ with ui.row().classes("w-full justify-between items-center mb-8 p-6"):
     
     # Live stats cards with refresh indicator
     stats_container = ui.row().classes("gap-4")
+    stats_bar = StatsBar(stats_container)
     
     def update_stats_display():
         """Update the stats display"""
-        global dashboard_stats
-        stats_container.clear()
-        
-        with stats_container:
-            with ui.card().classes("glass-card p-3 text-center"):
-                ui.label(str(dashboard_stats['github_count'])).classes("text-2xl font-bold text-blue-400")
-                ui.label("Repos Tracked").classes("text-xs text-gray-400")
-            
-            with ui.card().classes("glass-card p-3 text-center"):
-                ui.label(str(dashboard_stats['reddit_count'])).classes("text-2xl font-bold text-orange-400")
-                ui.label("Reddit Posts").classes("text-xs text-gray-400")
-            
-            with ui.card().classes("glass-card p-3 text-center"):
-                ui.label(str(dashboard_stats['news_count'])).classes("text-2xl font-bold text-green-400")
-                ui.label("News Articles").classes("text-xs text-gray-400")
-            
-            # Last updated indicator
-            with ui.card().classes("glass-card p-3 text-center"):
-                last_update_str = dashboard_stats.get('github_last_update', 'Never')
-                if last_update_str and last_update_str != 'Never':
-                    try:
-                        last_update_dt = datetime.fromisoformat(str(last_update_str).replace('Z', '+00:00'))
-                        time_diff = datetime.now() - last_update_dt.replace(tzinfo=None)
-                        if time_diff.seconds < 300:  # Less than 5 minutes
-                            status_color = "text-green-400"
-                            status_text = "LIVE"
-                        elif time_diff.seconds < 3600:  # Less than 1 hour
-                            status_color = "text-yellow-400" 
-                            status_text = f"{time_diff.seconds//60}m ago"
-                        else:
-                            status_color = "text-red-400"
-                            status_text = "STALE"
-                    except:
-                        status_color = "text-gray-400"
-                        status_text = "Unknown"
-                else:
-                    status_color = "text-gray-400"
-                    status_text = "No data"
-                
-                ui.label(status_text).classes(f"text-lg font-bold {status_color}")
-                ui.label("Data Status").classes("text-xs text-gray-400")
+        stats_bar.update(dashboard_stats)
+
+async def refresh_stats():
+    """Reload stats and update the header cards"""
+    global dashboard_stats
+    dashboard_stats = await get_dashboard_stats()
+    update_stats_display()
+
+# === SEARCH ===
+with ui.column().classes("w-full px-6 gap-3"):
+    with ui.row().classes("w-full items-center gap-4"):
+        search_box = ui.input(placeholder="Search repos, posts and news...").classes("flex-grow").props(
+            "dark outlined clearable debounce=250")
+        search_kind = ui.select({"all": "Everything", "repo": "GitHub", "post": "Reddit", "news": "News"},
+                                value="all").classes("w-40").props("dark outlined")
+    search_container = ui.column().classes("w-full gap-2")
+    search_results = KeyedList(search_container, key=lambda row: (row["kind"], row["url"]), render=search_result_card)
 
-update_stats_display()
+    async def update_search():
+        """Show the best matches for the search box, or nothing when it's empty"""
+        query = (search_box.value or "").strip()
+        if not query:
+            search_results.update([])
+            return
+        try:
+            rows = await queries.run_query(queries.search_content, query,
+                                          None if search_kind.value == "all" else search_kind.value)
+            if rows:
+                search_results.update(rows)
+            else:
+                search_results.show_message(("none", query), lambda: message_card(
+                    f"No matches for “{query}”", "text-gray-400"))
+        except Exception as e:
+            logger.error(f"Search failed: {str(e)}")
+            search_results.show_message(("error", query), lambda: message_card(
+                "❌ Search failed", "text-red-400"))
+
+    search_box.on("update:model-value", lambda _: update_search())
+    search_kind.on("update:model-value", lambda _: update_search())
+
+# Panels render incrementally: each card is keyed by its item, and a refresh
+# only rebuilds cards whose content changed (see dashboard/components.py).
 
 # === MAIN DASHBOARD GRID ===
 with ui.grid(columns="1fr 1fr").classes("w-full gap-6 p-6"):
@@ -169,125 +184,69 @@ with ui.grid(columns="1fr 1fr").classes("w-full gap-6 p-6"):
             ui.label("🔥 Trending This Week").classes("text-2xl font-bold text-white")
             ui.html('<span class="trending-badge">LIVE</span>')
         
-        # Language filter with modern styling
+        # Language filter with modern styling (runs once at import, before any client connects)
         try:
-            lang_df = safe_load_data("SELECT DISTINCT language FROM github_repos WHERE language IS NOT NULL")
-            languages = ["All"] + sorted(lang_df["language"].dropna().unique()) if lang_df is not None else ["All"]
+            lang_rows = queries.repo_languages()
+            languages = ["All"] + lang_rows if lang_rows else ["All"]
         except:
             languages = ["All", "Python", "JavaScript", "Go", "Rust"]
         
         selected_lang = ui.select(languages, value="All", label="Language").classes("w-full").props("dark outlined")
         github_container = ui.column().classes("gap-3 mt-4")
+        github_cards = KeyedList(github_container, key=lambda row: row["full_name"], render=repo_card)
+        github_cards.show_message("loading", lambda: loading_card("Loading trending repos..."))
 
-        def update_github():
+        async def update_github():
             """Update GitHub repos section with error handling"""
-            github_container.clear()
-            
             try:
-                # Show loading state
-                with github_container:
-                    ui.html('<div class="loading-spinner"></div>')
-                    ui.label("Loading trending repos...").classes("text-center text-gray-400")
+                rows = await safe_load_data(queries.top_repos, selected_lang.value, 5)
                 
-                # Load data
-                query = "SELECT name, url, stars, description, language, timestamp FROM github_repos"
-                if selected_lang.value != "All":
-                    query += f" WHERE language = '{selected_lang.value}'"
-                
-                df = safe_load_data(query)
-                
-                # Clear loading state
-                github_container.clear()
-                
-                if df is None or df.empty:
-                    with github_container:
-                        with ui.card().classes("error-state p-4 text-center"):
-                            ui.label("⚠️ No GitHub data available").classes("text-yellow-400 font-bold")
-                            ui.label("Try refreshing or check your data pipeline").classes("text-gray-400 text-sm")
+                if rows is None:
+                    github_cards.show_message("empty", lambda: message_card(
+                        "⚠️ No GitHub data available", "text-yellow-400",
+                        "Try refreshing or check your data pipeline"))
                     return
                 
-                # Process data
-                df = df.sort_values("stars", ascending=False).drop_duplicates("name").head(5)
-
-                for i, row in df.iterrows():
-                    with github_container:
-                        with ui.card().classes("bg-gray-800 p-4 hover:bg-gray-700 transition-colors"):
-                            with ui.row().classes("w-full justify-between items-start"):
-                                with ui.column().classes("flex-grow"):
-                                    # Repo name and stars
-                                    with ui.row().classes("items-center gap-2"):
-                                        ui.html(f'<a href="{row["url"]}" target="_blank" class="text-blue-400 hover:text-blue-300 font-bold text-lg no-underline">{row["name"]}</a>')
-                                        ui.html(f'<span class="bg-yellow-500 text-black px-2 py-1 rounded text-sm">⭐ {row["stars"]:,}</span>')
-                                    
-                                    # Description
-                                    if row["description"]:
-                                        desc = str(row["description"])[:100] + "..." if len(str(row["description"])) > 100 else str(row["description"])
-                                        ui.label(desc).classes("text-gray-300 text-sm mt-1")
-                                    
-                                    # Language and time
-                                    ui.html(f'<span class="text-xs text-gray-500">{row["language"]} • {str(row["timestamp"])[:19]}</span>')
-                                
-                                # Trending indicator
-                                ui.html('<div class="text-2xl">📈</div>')
+                github_cards.update(rows)
+                
+                # New languages show up as ingests land, not only at startup
+                lang_rows = await queries.run_query(queries.repo_languages)
+                options = ["All"] + lang_rows
+                if options != selected_lang.options:
+                    selected_lang.set_options(options, value=selected_lang.value if selected_lang.value in options else "All")
                         
             except Exception as e:
                 logger.error(f"Error updating GitHub section: {str(e)}")
-                github_container.clear()
-                with github_container:
-                    with ui.card().classes("error-state p-4 text-center"):
-                        ui.label("❌ Error loading GitHub data").classes("text-red-400 font-bold")
-                        ui.label(f"Error: {str(e)[:100]}").classes("text-gray-400 text-sm")
+                github_cards.show_message(("error", str(e)), lambda: message_card(
+                    "❌ Error loading GitHub data", "text-red-400", f"Error: {str(e)[:100]}"))
 
         selected_lang.on("update:model-value", lambda _: update_github())
-        update_github()
 
     # === REDDIT HOT TAKES ===
     with ui.card().classes("glass-card p-6"):
         with ui.row().classes("w-full justify-between items-center mb-4"):
             ui.label("💬 Dev Community Buzz").classes("text-2xl font-bold text-white")
-            ui.html('<span style="background: linear-gradient(45deg, #ff4500, #ff8c00); border-radius: 20px; padding: 4px 12px; font-size: 12px; font-weight: bold;">r/programming</span>')
+            ui.html(f'<span style="background: linear-gradient(45deg, #ff4500, #ff8c00); border-radius: 20px; padding: 4px 12px; font-size: 12px; font-weight: bold;">{escape(subreddit_badge(REDDIT_SUBREDDITS))}</span>')
         
         reddit_container = ui.column().classes("gap-3")
+        reddit_cards = KeyedList(reddit_container, key=lambda row: row["post_id"], render=post_card)
         
-        def update_reddit():
+        async def update_reddit():
             """Update Reddit section with error handling"""
-            reddit_container.clear()
-            
             try:
-                df = safe_load_data("SELECT title, url, subreddit, score, created_utc FROM reddit_posts ORDER BY score DESC")
+                rows = await safe_load_data(queries.top_posts, 5)
                 
-                if df is None or df.empty:
-                    with reddit_container:
-                        with ui.card().classes("error-state p-4 text-center"):
-                            ui.label("⚠️ No Reddit data available").classes("text-yellow-400 font-bold")
+                if rows is None:
+                    reddit_cards.show_message("empty", lambda: message_card(
+                        "⚠️ No Reddit data available", "text-yellow-400"))
                     return
                 
-                df = df.drop_duplicates(subset="title").head(5)
-                
-                for i, row in df.iterrows():
-                    with reddit_container:
-                        with ui.card().classes("bg-gray-800 p-4 hover:bg-gray-700 transition-colors"):
-                            with ui.row().classes("w-full justify-between items-start"):
-                                with ui.column().classes("flex-grow"):
-                                    title = str(row["title"])[:80] + "..." if len(str(row["title"])) > 80 else str(row["title"])
-                                    ui.html(f'<a href="{row["url"]}" target="_blank" class="text-orange-400 hover:text-orange-300 font-semibold no-underline">{title}</a>')
-                                    ui.html(f'<span class="text-xs text-gray-500">r/{row["subreddit"]} • Score: {row["score"]}</span>')
-                                
-                                # Score-based indicator
-                                if row["score"] > 500:
-                                    ui.html('<div class="text-xl">🔥</div>')
-                                elif row["score"] > 200:
-                                    ui.html('<div class="text-xl">📈</div>')
-                                else:
-                                    ui.html('<div class="text-xl">💬</div>')
+                reddit_cards.update(rows)
                     
             except Exception as e:
                 logger.error(f"Error updating Reddit section: {str(e)}")
-                with reddit_container:
-                    with ui.card().classes("error-state p-4 text-center"):
-                        ui.label("❌ Error loading Reddit data").classes("text-red-400 font-bold")
-
-        update_reddit()
+                reddit_cards.show_message("error", lambda: message_card(
+                    "❌ Error loading Reddit data", "text-red-400"))
 
 # === NEWS SECTION (Full Width) ===
 with ui.card().classes("glass-card p-6 mx-6 mb-6"):
@@ -296,55 +255,37 @@ with ui.card().classes("glass-card p-6 mx-6 mb-6"):
         ui.html('<span style="background: linear-gradient(45deg, #00ff88, #00d4ff); border-radius: 20px; padding: 4px 12px; font-size: 12px; font-weight: bold; color: black;">AI • BLOCKCHAIN • STARTUPS</span>')
     
     news_container = ui.grid(columns=2).classes("gap-4")
+    news_cards = KeyedList(news_container, key=lambda row: row["url"], render=news_card)
     
-    def update_news():
+    async def update_news():
         """Update news section with error handling"""
-        news_container.clear()
-        
         try:
-            df = safe_load_data("SELECT title, url, summary, source, published_at, sentiment FROM tech_news ORDER BY published_at DESC")
+            rows = await safe_load_data(queries.latest_news, 6)
             
-            if df is None or df.empty:
-                with news_container:
-                    with ui.card().classes("error-state p-4 text-center col-span-2"):
-                        ui.label("⚠️ No tech news available").classes("text-yellow-400 font-bold")
+            if rows is None:
+                news_cards.show_message("empty", lambda: message_card(
+                    "⚠️ No tech news available", "text-yellow-400", extra_classes="col-span-2"))
                 return
             
-            df = df.drop_duplicates("title").head(6)
-            
-            for i, row in df.iterrows():
-                with news_container:
-                    with ui.card().classes("bg-gray-800 p-4 hover:bg-gray-700 transition-colors"):
-                        # Sentiment badge
-                        sentiment = str(row.get("sentiment", "Neutral"))
-                        sentiment_colors = {"Positive": "green", "Negative": "red", "Neutral": "yellow"}
-                        color = sentiment_colors.get(sentiment, "gray")
-                        ui.html(f'<span class="bg-{color}-500 text-white px-2 py-1 rounded text-xs mb-2 inline-block">{sentiment}</span>')
-                        
-                        # Title
-                        title = str(row["title"])[:100] + "..." if len(str(row["title"])) > 100 else str(row["title"])
-                        ui.html(f'<a href="{row["url"]}" target="_blank" class="text-green-400 hover:text-green-300 font-semibold no-underline block mb-2">{title}</a>')
-                        
-                        # Summary
-                        if row["summary"]:
-                            summary = str(row["summary"])[:120] + "..." if len(str(row["summary"])) > 120 else str(row["summary"])
-                            ui.label(summary).classes("text-gray-300 text-sm mb-2")
-                        
-                        # Time
-                        ui.html(f'<span class="text-xs text-gray-500">{str(row["published_at"])[:19]}</span>')
+            news_cards.update(rows)
         
         except Exception as e:
             logger.error(f"Error updating news section: {str(e)}")
-            with news_container:
-                with ui.card().classes("error-state p-4 text-center col-span-2"):
-                    ui.label("❌ Error loading news data").classes("text-red-400 font-bold")
-
-    update_news()
+            news_cards.show_message("error", lambda: message_card(
+                "❌ Error loading news data", "text-red-400", extra_classes="col-span-2"))
 
 # === AUTO-REFRESH FUNCTIONALITY ===
+async def refresh_panels():
+    """Reload every panel; the queries run concurrently on the DB thread pool"""
+    with stage("dashboard.refresh"):
+        await asyncio.gather(refresh_stats(), update_github(), update_reddit(), update_news())
+
+# First load as soon as the event loop is up
+ui.timer(0, refresh_panels, once=True)
+
 async def auto_refresh_data():
-    """Auto refresh data every 5 minutes"""
-    global is_refreshing, dashboard_stats, last_update_time
+    """Reload every panel, e.g. after a manual refresh"""
+    global is_refreshing, last_update_time
     
     if is_refreshing:
         return
@@ -354,14 +295,8 @@ async def auto_refresh_data():
     try:
         logger.info("Auto-refreshing dashboard data...")
         
-        # Update stats
-        dashboard_stats = get_dashboard_stats()
-        update_stats_display()
-        
-        # Update sections
-        update_github()
-        update_reddit() 
-        update_news()
+        # Update stats and sections
+        await refresh_panels()
         
         last_update_time = datetime.now()
         ui.notify("📊 Dashboard updated", type="positive", timeout=2000)
@@ -373,8 +308,29 @@ async def auto_refresh_data():
     finally:
         is_refreshing = False
 
-# Set up auto-refresh timer (5 minutes = 300 seconds)
-ui.timer(300, auto_refresh_data)
+# === LIVE UPDATES ===
+# The pipeline bumps data_versions on every commit; one watcher per process
+# picks that up and refreshes only the panels whose source changed.
+change_watcher = ChangeWatcher()
+# Repo cards show mention counts, so posts and news refresh them too
+PANEL_UPDATERS = {"github": [update_github], "reddit": [update_reddit, update_github],
+                  "news": [update_news, update_github]}
+
+async def apply_changes():
+    """Refresh the panels of sources committed since the last check"""
+    changed = await queries.run_query(change_watcher.poll)
+    if not changed:
+        return
+    logger.info(f"New data committed for: {', '.join(sorted(changed))}")
+    panel_cache.invalidate(*changed)  # the commit may come from another process
+    updaters = {updater for source in changed for updater in PANEL_UPDATERS.get(source, ())}
+    with stage("dashboard.live_update", sources=sorted(changed)):
+        await asyncio.gather(refresh_stats(), update_search(), *(updater() for updater in updaters))
+
+ui.timer(CHANGE_POLL_INTERVAL, apply_changes)
+
+# The freshness badge ages between commits; re-deriving it reads no data
+ui.timer(60, update_stats_display)
 
 # === MANUAL REFRESH BUTTON ===
 def manual_refresh():
@@ -394,6 +350,7 @@ def manual_refresh():
             try:
                 # Run pipeline if available
                 # devradar_pipeline()  # Uncomment when ready
+                panel_cache.invalidate()  # an explicit refresh always goes to the database
                 await auto_refresh_data()
                 ui.notify("✅ Manual refresh complete!", type="positive")
             except Exception as e:
@@ -409,6 +366,6 @@ ui.button("🔄 Refresh Live Data", on_click=manual_refresh).classes("fixed bott
 # === FOOTER WITH STATUS ===
 with ui.row().classes("w-full justify-between items-center p-4 text-gray-400 text-sm"):
     ui.label("Built with 💻 Python • NiceGUI • Prefect • Real-time APIs")
-    ui.label(f"Last auto-refresh: {last_update_time.strftime('%H:%M:%S')}")
+    ui.label(f"Dashboard started: {last_update_time.strftime('%H:%M:%S')}")
 
 ui.run(title="DevRadar - Live Developer Intelligence", dark=True, reload=False)
\ No newline at end of file
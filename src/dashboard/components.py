@@ -0,0 +1,268 @@
+# src/dashboard/components.py
+
+"""Card builders and keyed, incremental rendering for the dashboard panels.
+
+Each builder creates one card inside the current NiceGUI context and returns
+its root element, so a KeyedList can move, replace or delete it on its own.
+"""
+
+from datetime import datetime
+from html import escape
+
+from nicegui import ui
+
+
+def truncate(text, length):
+    text = str(text)
+    return text[:length] + "..." if len(text) > length else text
+
+
+def safe_url(url):
+    """`url` escaped for an href; anything but http(s) becomes "#" so stored data can't inject javascript: links"""
+    url = str(url or "").strip()
+    return escape(url) if url.lower().startswith(("http://", "https://")) else "#"
+
+
+def link_html(url, text, classes):
+    """External link markup; titles and URLs come from third-party data, so both are escaped"""
+    return f'<a href="{safe_url(url)}" target="_blank" rel="noopener noreferrer" class="{classes}">{escape(text)}</a>'
+
+
+def details_html(details):
+    return f'<span class="text-xs text-gray-500">{escape(" • ".join(str(d) for d in details if d))}</span>'
+
+
+def fingerprint(item):
+    """Everything a card displays; equal fingerprints mean an identical card"""
+    return tuple(sorted(item.items()))
+
+
+class KeyedList:
+    """Keeps one card per item key inside `container` in sync with a list of items.
+
+    On update, unchanged cards are left alone, changed cards are rebuilt in
+    place, vanished ones deleted and new ones inserted at their position. A
+    refresh that changes nothing enqueues nothing for the websocket.
+    """
+
+    def __init__(self, container, key, render):
+        self.container = container
+        self.key = key
+        self.render = render
+        self.cards = {}  # key -> (fingerprint, element)
+        self.message_key = None
+        self.message = None
+
+    def update(self, items):
+        self._drop_message()
+        wanted = [(self.key(item), fingerprint(item), item) for item in items]
+        wanted_keys = {key for key, _, _ in wanted}
+
+        for key in [key for key in self.cards if key not in wanted_keys]:
+            self.cards.pop(key)[1].delete()
+
+        for index, (key, print_, item) in enumerate(wanted):
+            current = self.cards.get(key)
+            if current is not None and current[0] == print_:
+                element = current[1]
+            else:
+                if current is not None:
+                    current[1].delete()
+                with self.container:
+                    element = self.render(item)
+                self.cards[key] = (print_, element)
+
+            if self.container.default_slot.children.index(element) != index:
+                element.move(target_index=index)
+
+    def show_message(self, key, build):
+        """Replace every card with a single placeholder (loading, empty or error state)"""
+        if self.message_key == key:
+            return
+        for _, element in self.cards.values():
+            element.delete()
+        self.cards.clear()
+        self._drop_message()
+        with self.container:
+            self.message = build()
+        self.message_key = key
+
+    def _drop_message(self):
+        if self.message is not None:
+            self.message.delete()
+        self.message = None
+        self.message_key = None
+
+
+def message_card(title, title_classes, detail=None, extra_classes=""):
+    with ui.card().classes(f"error-state p-4 text-center {extra_classes}") as card:
+        ui.label(title).classes(f"{title_classes} font-bold")
+        if detail:
+            ui.label(detail).classes("text-gray-400 text-sm")
+    return card
+
+
+def loading_card(text):
+    with ui.column().classes("w-full") as column:
+        ui.html('<div class="loading-spinner"></div>')
+        ui.label(text).classes("text-center text-gray-400")
+    return column
+
+
+def velocity_label(velocity, unit):
+    """Signed per-hour rate, e.g. +42★/h; empty until an item has two observations"""
+    if not velocity:
+        return ""
+    return f"{velocity:+,.0f}{unit}/h" if abs(velocity) >= 1 else f"{velocity:+.1f}{unit}/h"
+
+
+def trend_icon(row):
+    """🚀 accelerating, 📈 rising, 💬 flat or not yet measured"""
+    if row.get("velocity", 0) > 0 and row.get("acceleration", 0) > 0:
+        return "🚀"
+    if row.get("velocity", 0) > 0:
+        return "📈"
+    return "💬"
+
+
+def repo_card(row):
+    with ui.card().classes("bg-gray-800 p-4 hover:bg-gray-700 transition-colors") as card:
+        with ui.row().classes("w-full justify-between items-start"):
+            with ui.column().classes("flex-grow"):
+                # Repo name and stars
+                with ui.row().classes("items-center gap-2"):
+                    ui.html(link_html(row["url"], row["name"],
+                                      "text-blue-400 hover:text-blue-300 font-bold text-lg no-underline"))
+                    ui.html(f'<span class="bg-yellow-500 text-black px-2 py-1 rounded text-sm">⭐ {row["stars"]:,}</span>')
+                    if velocity := velocity_label(row.get("velocity"), "★"):
+                        ui.html(f'<span class="text-green-400 text-sm">{velocity}</span>')
+
+                # Description
+                if row["description"]:
+                    ui.label(truncate(row["description"], 100)).classes("text-gray-300 text-sm mt-1")
+
+                # Cross-source buzz
+                buzz = [f"{row[key]}× {label}" for key, label in (("reddit_mentions", "Reddit"), ("news_mentions", "news"))
+                        if row.get(key)]
+                if buzz:
+                    ui.html(f'<span class="text-xs text-purple-300">🗣️ {" • ".join(buzz)}</span>')
+
+                # Language, why it was picked up, and time
+                ui.html(details_html([row["language"], row.get("trending_reason"), str(row["timestamp"])[:19]]))
+
+            # Trending indicator
+            ui.html(f'<div class="text-2xl">{trend_icon(row)}</div>')
+    return card
+
+
+def post_card(row):
+    with ui.card().classes("bg-gray-800 p-4 hover:bg-gray-700 transition-colors") as card:
+        with ui.row().classes("w-full justify-between items-start"):
+            with ui.column().classes("flex-grow"):
+                ui.html(link_html(row["url"], truncate(row["title"], 80),
+                                  "text-orange-400 hover:text-orange-300 font-semibold no-underline"))
+                ui.html(details_html([f"r/{row['subreddit']}", f"Score: {row['score']}",
+                                      velocity_label(row.get("velocity"), "")]))
+
+            # Trend indicator
+            if row["score"] > 500 and row.get("velocity", 0) > 0:
+                ui.html('<div class="text-xl">🔥</div>')
+            else:
+                ui.html(f'<div class="text-xl">{trend_icon(row)}</div>')
+    return card
+
+
+def subreddit_badge(subreddits, shown=3):
+    """Header badge text for the ingested subreddits, e.g. r/python • r/rust +4"""
+    badge = " • ".join(f"r/{name}" for name in subreddits[:shown])
+    return f"{badge} +{len(subreddits) - shown}" if len(subreddits) > shown else badge
+
+
+SEARCH_KIND_LABELS = {"repo": ("GitHub", "text-blue-400"), "post": ("Reddit", "text-orange-400"),
+                      "news": ("News", "text-green-400")}
+
+
+def search_result_card(row):
+    label, color = SEARCH_KIND_LABELS.get(row["kind"], (row["kind"], "text-gray-300"))
+    with ui.card().classes("bg-gray-800 p-3 hover:bg-gray-700 transition-colors w-full") as card:
+        with ui.row().classes("items-center gap-2"):
+            ui.html(f'<span class="text-xs text-gray-400 uppercase">{escape(label)}</span>')
+            ui.html(link_html(row["url"], truncate(row["title"], 90), f"{color} font-semibold no-underline"))
+        if row["body"]:
+            ui.label(truncate(row["body"], 140)).classes("text-gray-300 text-sm")
+    return card
+
+
+SENTIMENT_COLORS = {"Positive": "green", "Negative": "red", "Neutral": "yellow"}
+
+
+def news_card(row):
+    with ui.card().classes("bg-gray-800 p-4 hover:bg-gray-700 transition-colors") as card:
+        # Sentiment badge
+        sentiment = str(row.get("sentiment") or "Neutral")
+        color = SENTIMENT_COLORS.get(sentiment, "gray")
+        ui.html(f'<span class="bg-{color}-500 text-white px-2 py-1 rounded text-xs mb-2 inline-block">{escape(sentiment)}</span>')
+
+        # Title
+        ui.html(link_html(row["url"], truncate(row["title"], 100),
+                          "text-green-400 hover:text-green-300 font-semibold no-underline block mb-2"))
+
+        # Summary
+        if row["summary"]:
+            ui.label(truncate(row["summary"], 120)).classes("text-gray-300 text-sm mb-2")
+
+        # Time
+        ui.html(details_html([str(row["published_at"])[:19]]))
+    return card
+
+
+def data_status(last_update, now=None):
+    """Freshness badge text and colour for the latest ingest time (stored in UTC)"""
+    if not last_update or last_update in ('Never', 'Error'):
+        return "No data", "text-gray-400"
+    try:
+        last_update_dt = datetime.fromisoformat(str(last_update).replace('Z', '+00:00'))
+        age = ((now or datetime.utcnow()) - last_update_dt.replace(tzinfo=None)).total_seconds()
+    except ValueError:
+        return "Unknown", "text-gray-400"
+
+    if age < 300:  # Less than 5 minutes
+        return "LIVE", "text-green-400"
+    if age < 3600:  # Less than 1 hour
+        return f"{int(age)//60}m ago", "text-yellow-400"
+    return "STALE", "text-red-400"
+
+
+class StatsBar:
+    """Header counters built once; refreshes only touch labels whose text changed"""
+
+    COUNTERS = (
+        ("github_count", "Repos Tracked", "text-blue-400"),
+        ("reddit_count", "Reddit Posts", "text-orange-400"),
+        ("news_count", "News Articles", "text-green-400"),
+    )
+
+    def __init__(self, container):
+        self.labels = {}
+        with container:
+            for key, caption, color in self.COUNTERS:
+                with ui.card().classes("glass-card p-3 text-center"):
+                    self.labels[key] = ui.label("0").classes(f"text-2xl font-bold {color}")
+                    ui.label(caption).classes("text-xs text-gray-400")
+
+            # Last updated indicator
+            with ui.card().classes("glass-card p-3 text-center"):
+                self.status_color = "text-gray-400"
+                self.status = ui.label("No data").classes(f"text-lg font-bold {self.status_color}")
+                ui.label("Data Status").classes("text-xs text-gray-400")
+
+    def update(self, stats):
+        # Label.text only reaches the websocket when the value actually changes
+        for key, label in self.labels.items():
+            label.text = str(stats.get(key, 0))
+
+        status_text, status_color = data_status(stats.get('last_update'))
+        self.status.text = status_text
+        if status_color != self.status_color:
+            self.status.classes(remove=self.status_color, add=status_color)
+            self.status_color = status_color
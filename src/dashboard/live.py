@@ -0,0 +1,70 @@
+# src/dashboard/live.py
+
+"""Change detection between the ingest pipeline and the dashboard.
+
+The storage layer bumps a per-source counter in data_versions on every
+committed ingest (storage/events.py). One ChangeWatcher per dashboard process
+notices those commits and reports which sources changed, so only the affected
+panels are refreshed. Connected clients add no polling of their own.
+
+On SQLite the watcher polls `PRAGMA data_version` on a dedicated connection:
+it only changes when another connection commits, and reading it touches no
+table pages, so an idle database costs one in-memory check per tick. Other
+databases read the (one row per source) data_versions table instead.
+"""
+
+from sqlalchemy import text
+
+from db.database import engine
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+VERSIONS_SQL = text("SELECT source, version FROM data_versions")
+
+
+class ChangeWatcher:
+    """Reports the sources whose data was committed since the previous poll"""
+
+    def __init__(self, bind=None):
+        self.bind = bind if bind is not None else engine
+        self.versions = None  # source -> version seen at the last poll
+        self._data_version = None
+        self._raw = None
+
+    def poll(self):
+        """Return the set of changed sources (blocking; run it off the event loop)"""
+        try:
+            if self.bind.dialect.name == "sqlite" and not self._database_changed():
+                return set()
+            with self.bind.connect() as conn:
+                current = {row.source: row.version for row in conn.execute(VERSIONS_SQL)}
+        except Exception as e:
+            logger.error(f"Change poll failed: {e}")
+            self.close()
+            return set()
+
+        previous, self.versions = self.versions, current
+        if previous is None:
+            return set()
+        return {source for source, version in current.items() if previous.get(source) != version}
+
+    def _database_changed(self):
+        # data_version is per connection, so the same connection must be kept
+        if self._raw is None:
+            self._raw = self.bind.raw_connection()
+        cursor = self._raw.cursor()
+        try:
+            cursor.execute("PRAGMA data_version")
+            data_version = cursor.fetchone()[0]
+        finally:
+            cursor.close()
+        changed = data_version != self._data_version
+        self._data_version = data_version
+        return changed
+
+    def close(self):
+        if self._raw is not None:
+            self._raw.close()
+        self._raw = None
+        self._data_version = None
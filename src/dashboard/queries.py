@@ -0,0 +1,174 @@
+# src/dashboard/queries.py
+
+"""Parameterized top-N queries behind the dashboard panels.
+
+Every query is bounded by LIMIT and served from an index, so its cost does not
+grow with table size. Panels get plain lists of dicts, never whole tables.
+
+Results go through the process-wide panel cache, tagged with the source they
+read, so all connected clients share one query per refresh window. Treat the
+returned rows as read-only: they are shared between clients.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from sqlalchemy import text
+
+from config import DASHBOARD_DB_WORKERS
+from db.database import engine
+from storage.search import search
+from utils.cache import cached
+from utils.telemetry import stage
+
+# Blocking DB calls run here so a slow read never stalls NiceGUI's event loop
+_db_executor = ThreadPoolExecutor(max_workers=DASHBOARD_DB_WORKERS, thread_name_prefix="dashboard-db")
+
+# Panels dedup near the top of the ranking only: fetch this many candidates per
+# requested row through the index, then keep one row per near-duplicate story
+# (cluster_id, see storage.clusters) among them.
+DEDUP_FANOUT = 4
+
+STATS_SQL = text("""
+    SELECT
+        (SELECT COUNT(*) FROM github_repos) AS github_count,
+        (SELECT MAX(committed_at) FROM data_versions) AS last_update,
+        (SELECT COUNT(*) FROM reddit_posts) AS reddit_count,
+        (SELECT COUNT(*) FROM tech_news) AS news_count
+""")
+
+# Loose index scan over ix_github_repos_language_stars: one seek per language
+LANGUAGES_SQL = text("""
+    WITH RECURSIVE langs(language) AS (
+        SELECT MIN(language) FROM github_repos WHERE language > ''
+        UNION ALL
+        SELECT (SELECT MIN(language) FROM github_repos WHERE language > langs.language)
+        FROM langs WHERE langs.language IS NOT NULL
+    )
+    SELECT language FROM langs WHERE language IS NOT NULL
+""")
+
+# Repos and posts rank by trend_score, read straight off the materialized
+# trending tables (see storage.trending); both orderings are served by an index.
+# Their stars / score are the last rate sample, which may be up to
+# MIN_INTERVAL_HOURS old, so the displayed counts come from the source rows.
+# Mention counts are index range counts on ix_mentions_slug_source, per shown repo.
+TOP_REPOS_SQL = text("""
+    SELECT r.full_name, r.name, r.url, r.stars, r.description, t.language, r.timestamp,
+           r.trending_reason, t.velocity, t.acceleration, t.trend_score,
+           (SELECT COUNT(*) FROM mentions m WHERE m.slug = r.slug AND m.source = 'reddit') AS reddit_mentions,
+           (SELECT COUNT(*) FROM mentions m WHERE m.slug = r.slug AND m.source = 'news') AS news_mentions
+    FROM trending_repos t
+    JOIN github_repos r ON r.id = t.repo_id
+    ORDER BY t.trend_score DESC, t.stars DESC
+    LIMIT :limit
+""")
+
+TOP_REPOS_BY_LANGUAGE_SQL = text("""
+    SELECT r.full_name, r.name, r.url, r.stars, r.description, t.language, r.timestamp,
+           r.trending_reason, t.velocity, t.acceleration, t.trend_score,
+           (SELECT COUNT(*) FROM mentions m WHERE m.slug = r.slug AND m.source = 'reddit') AS reddit_mentions,
+           (SELECT COUNT(*) FROM mentions m WHERE m.slug = r.slug AND m.source = 'news') AS news_mentions
+    FROM trending_repos t
+    JOIN github_repos r ON r.id = t.repo_id
+    WHERE t.language = :language
+    ORDER BY t.trend_score DESC, t.stars DESC
+    LIMIT :limit
+""")
+
+TOP_POSTS_SQL = text("""
+    WITH candidates AS (
+        SELECT p.post_id, p.title, p.url, p.subreddit, p.score, p.created_utc,
+               t.velocity, t.acceleration, t.trend_score, COALESCE(p.cluster_id, p.id) AS story
+        FROM trending_posts t
+        JOIN reddit_posts p ON p.id = t.post_id
+        ORDER BY t.trend_score DESC, t.score DESC
+        LIMIT :candidates
+    ), ranked AS (
+        SELECT candidates.*,
+               ROW_NUMBER() OVER (PARTITION BY story ORDER BY trend_score DESC, score DESC) AS rn
+        FROM candidates
+    )
+    SELECT post_id, title, url, subreddit, score, created_utc, velocity, acceleration, trend_score
+    FROM ranked
+    WHERE rn = 1
+    ORDER BY trend_score DESC, score DESC
+    LIMIT :limit
+""")
+
+LATEST_NEWS_SQL = text("""
+    WITH candidates AS (
+        SELECT title, url, summary, source, published_at, sentiment, COALESCE(cluster_id, id) AS story
+        FROM tech_news
+        ORDER BY published_at DESC
+        LIMIT :candidates
+    ), ranked AS (
+        SELECT candidates.*, ROW_NUMBER() OVER (PARTITION BY story ORDER BY published_at DESC) AS rn
+        FROM candidates
+    )
+    SELECT title, url, summary, source, published_at, sentiment
+    FROM ranked
+    WHERE rn = 1
+    ORDER BY published_at DESC
+    LIMIT :limit
+""")
+
+
+def _fetch_all(statement, bind=None, **params):
+    with (bind if bind is not None else engine).connect() as conn:
+        return [dict(row) for row in conn.execute(statement, params).mappings()]
+
+
+@cached("github", "reddit", "news")
+def dashboard_stats(bind=None):
+    """Row counts per source and the time of the latest committed ingest"""
+    rows = _fetch_all(STATS_SQL, bind)
+    return rows[0] if rows else {}
+
+
+@cached("github")
+def repo_languages(bind=None):
+    """Distinct non-empty repo languages, sorted"""
+    return [row["language"] for row in _fetch_all(LANGUAGES_SQL, bind)]
+
+
+@cached("github", "reddit", "news")  # mention counts move with posts and news
+def top_repos(language=None, limit=5, bind=None):
+    """Fastest-rising repos (ties broken by stars), optionally for a single language"""
+    if language and language != "All":
+        return _fetch_all(TOP_REPOS_BY_LANGUAGE_SQL, bind, language=language, limit=limit)
+    return _fetch_all(TOP_REPOS_SQL, bind, limit=limit)
+
+
+@cached("reddit")
+def top_posts(limit=5, bind=None):
+    """Fastest-rising Reddit posts (ties broken by score), one per story"""
+    return _fetch_all(TOP_POSTS_SQL, bind, limit=limit, candidates=limit * DEDUP_FANOUT)
+
+
+@cached("news")
+def latest_news(limit=6, bind=None):
+    """Most recently published articles, one per story"""
+    return _fetch_all(LATEST_NEWS_SQL, bind, limit=limit, candidates=limit * DEDUP_FANOUT)
+
+
+@cached("github", "reddit", "news")
+def search_content(query, kind=None, limit=10, bind=None):
+    """BM25-ranked repos, posts and news matching free text (see storage.search)"""
+    return search(query, kind, limit, bind)
+
+
+def _staged(name, query_fn, *args, **kwargs):
+    with stage(name):
+        return query_fn(*args, **kwargs)
+
+
+async def run_query(query_fn, *args, **kwargs):
+    """Await a query function on the bounded DB thread pool"""
+    loop = asyncio.get_running_loop()
+    # The stage is opened on the worker thread doing the work, so --profile samples it there, and in a
+    # copy of the caller's context, so its span keeps the caller's parent
+    call = partial(contextvars.copy_context().run, _staged, f"dashboard.{query_fn.__name__}", query_fn, *args, **kwargs)
+    return await loop.run_in_executor(_db_executor, call)
@@ -1,7 +1,31 @@
+import os
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
 from db.database import engine
 from db import models  # This imports all models so their tables are registered
 
-# Create tables
-models.Base.metadata.create_all(bind=engine)
+ALEMBIC_INI = os.path.join(os.path.dirname(__file__), "..", "..", "alembic.ini")
+
+
+def init_db():
+    """Create a fresh schema, or migrate an existing database to the latest layout"""
+    config = Config(ALEMBIC_INI)
+    tables = set(inspect(engine).get_table_names())
+
+    if not tables:
+        models.Base.metadata.create_all(bind=engine)
+        command.stamp(config, "head")
+        return
+
+    if "alembic_version" not in tables:
+        # Created before migrations existed: that's the baseline layout
+        command.stamp(config, "0001_baseline")
+    command.upgrade(config, "head")
+
 
-print("✅ Tables created in devradar.db")
+if __name__ == "__main__":
+    init_db()
+    print("✅ Tables created in devradar.db")
@@ -1,13 +1,15 @@
 # src/db/database.py
 
+import os
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-# SQLite URL for local dev (can later be swapped for Postgres/MySQL)
-DATABASE_URL = "sqlite:///./devradar.db"
+# SQLite URL for local dev; point DATABASE_URL at Postgres in production
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./devradar.db")
 
 # Engine creation
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+engine = create_engine(DATABASE_URL, connect_args=connect_args)
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -0,0 +1,54 @@
+# src/db/migrations/env.py
+
+import os
+import sys
+from logging.config import fileConfig
+
+from alembic import context
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from db.database import engine  # noqa: E402
+from db import models  # noqa: E402,F401  (registers every table on Base.metadata)
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = models.Base.metadata
+
+
+def include_name(name, type_, parent_names):
+    # The FTS5 index and its shadow tables are managed by hand (SEARCH_INDEX_DDL)
+    return not (type_ == "table" and name.startswith("search_index"))
+
+
+def run_migrations_offline():
+    context.configure(
+        url=str(engine.url),
+        target_metadata=target_metadata,
+        include_name=include_name,
+        literal_binds=True,
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    with engine.connect() as connection:
+        # SQLite can't ALTER constraints in place; batch mode rebuilds the table
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
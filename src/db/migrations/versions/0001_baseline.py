@@ -0,0 +1,54 @@
+"""Baseline: the original append-only layout
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2025-06-20
+
+Databases created before migrations existed already have these tables;
+`alembic stamp 0001_baseline` marks them before upgrading.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "github_repos",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("name", sa.String()),
+        sa.Column("url", sa.String()),
+        sa.Column("stars", sa.Integer()),
+        sa.Column("description", sa.Text()),
+        sa.Column("language", sa.String()),
+        sa.Column("timestamp", sa.DateTime()),
+    )
+    op.create_table(
+        "reddit_posts",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("title", sa.String()),
+        sa.Column("score", sa.Integer()),
+        sa.Column("url", sa.String()),
+        sa.Column("subreddit", sa.String()),
+        sa.Column("timestamp", sa.DateTime()),
+    )
+    op.create_table(
+        "tech_news",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("title", sa.String()),
+        sa.Column("summary", sa.Text()),
+        sa.Column("sentiment", sa.String()),
+        sa.Column("url", sa.String()),
+        sa.Column("published_at", sa.String()),
+    )
+
+
+def downgrade():
+    op.drop_table("tech_news")
+    op.drop_table("reddit_posts")
+    op.drop_table("github_repos")
@@ -0,0 +1,122 @@
+"""Natural keys, composite indexes and append-only snapshot tables
+
+Revision ID: 0002_natural_keys_and_snapshots
+Revises: 0001_baseline
+Create Date: 2025-06-20
+
+The old layout appended a full row per entity on every ingest. This collapses
+each entity to its latest row and moves the accumulated history into
+repo_star_snapshots / post_score_snapshots.
+
+Reddit's post ids were never stored, so old posts get the placeholder key
+'legacy-<id>'. Saving a post later adopts the legacy row with its url and
+title (see storage/legacy_posts.py); posts saved again before that matching
+existed are stored twice until `python -m storage.legacy_posts` merges them.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_natural_keys_and_snapshots"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # --- github_repos: `name` held owner/name in the old flow ---
+    op.add_column("github_repos", sa.Column("full_name", sa.String(), nullable=True))
+    op.execute("UPDATE github_repos SET full_name = name")
+    op.execute("DELETE FROM github_repos WHERE full_name IS NULL")
+
+    op.create_table(
+        "repo_star_snapshots",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("repo_id", sa.Integer(), sa.ForeignKey("github_repos.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("stars", sa.Integer(), nullable=False),
+        sa.Column("captured_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_repo_star_snapshots_repo_captured", "repo_star_snapshots", ["repo_id", "captured_at"])
+
+    # Every historical row becomes a snapshot of the surviving (latest) row
+    op.execute("""
+        INSERT INTO repo_star_snapshots (repo_id, stars, captured_at)
+        SELECT keeper.id, r.stars, r.timestamp
+        FROM github_repos r
+        JOIN (SELECT full_name, MAX(id) AS id FROM github_repos GROUP BY full_name) keeper
+          ON keeper.full_name = r.full_name
+        WHERE r.stars IS NOT NULL AND r.timestamp IS NOT NULL
+    """)
+    op.execute("DELETE FROM github_repos WHERE id NOT IN (SELECT MAX(id) FROM github_repos GROUP BY full_name)")
+
+    with op.batch_alter_table("github_repos") as batch:
+        batch.alter_column("full_name", existing_type=sa.String(), nullable=False)
+        batch.create_unique_constraint("uq_github_repos_full_name", ["full_name"])
+        batch.create_index("ix_github_repos_language_stars", ["language", "stars"])
+
+    # --- reddit_posts: Reddit's id was never stored, so old rows dedup on title ---
+    op.add_column("reddit_posts", sa.Column("post_id", sa.String(), nullable=True))
+    op.add_column("reddit_posts", sa.Column("author", sa.String(), nullable=True))
+    op.add_column("reddit_posts", sa.Column("num_comments", sa.Integer(), nullable=True))
+    op.add_column("reddit_posts", sa.Column("created_utc", sa.Float(), nullable=True))
+
+    op.create_table(
+        "post_score_snapshots",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("post_id", sa.Integer(), sa.ForeignKey("reddit_posts.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("score", sa.Integer(), nullable=False),
+        sa.Column("num_comments", sa.Integer(), nullable=True),
+        sa.Column("captured_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_post_score_snapshots_post_captured", "post_score_snapshots", ["post_id", "captured_at"])
+
+    op.execute("""
+        INSERT INTO post_score_snapshots (post_id, score, captured_at)
+        SELECT keeper.id, p.score, p.timestamp
+        FROM reddit_posts p
+        JOIN (SELECT title, MAX(id) AS id FROM reddit_posts GROUP BY title) keeper
+          ON keeper.title = p.title
+        WHERE p.score IS NOT NULL AND p.timestamp IS NOT NULL
+    """)
+    op.execute("DELETE FROM reddit_posts WHERE id NOT IN (SELECT MAX(id) FROM reddit_posts GROUP BY title)")
+    op.execute("UPDATE reddit_posts SET post_id = 'legacy-' || id")
+
+    with op.batch_alter_table("reddit_posts") as batch:
+        batch.alter_column("post_id", existing_type=sa.String(), nullable=False)
+        batch.create_unique_constraint("uq_reddit_posts_post_id", ["post_id"])
+        batch.create_index("ix_reddit_posts_subreddit_score", ["subreddit", "score"])
+
+    # --- tech_news: url becomes the key ---
+    op.add_column("tech_news", sa.Column("source", sa.String(), nullable=True))
+    op.execute("DELETE FROM tech_news WHERE url IS NULL OR url = ''")
+    op.execute("DELETE FROM tech_news WHERE id NOT IN (SELECT MAX(id) FROM tech_news GROUP BY url)")
+
+    with op.batch_alter_table("tech_news") as batch:
+        batch.alter_column("url", existing_type=sa.String(), nullable=False)
+        batch.create_unique_constraint("uq_tech_news_url", ["url"])
+        batch.create_index("ix_tech_news_published_at", ["published_at"])
+
+
+def downgrade():
+    with op.batch_alter_table("tech_news") as batch:
+        batch.drop_index("ix_tech_news_published_at")
+        batch.drop_constraint("uq_tech_news_url", type_="unique")
+        batch.alter_column("url", existing_type=sa.String(), nullable=True)
+        batch.drop_column("source")
+
+    op.drop_index("ix_post_score_snapshots_post_captured", table_name="post_score_snapshots")
+    op.drop_table("post_score_snapshots")
+    with op.batch_alter_table("reddit_posts") as batch:
+        batch.drop_index("ix_reddit_posts_subreddit_score")
+        batch.drop_constraint("uq_reddit_posts_post_id", type_="unique")
+        batch.drop_column("created_utc")
+        batch.drop_column("num_comments")
+        batch.drop_column("author")
+        batch.drop_column("post_id")
+
+    op.drop_index("ix_repo_star_snapshots_repo_captured", table_name="repo_star_snapshots")
+    op.drop_table("repo_star_snapshots")
+    with op.batch_alter_table("github_repos") as batch:
+        batch.drop_index("ix_github_repos_language_stars")
+        batch.drop_constraint("uq_github_repos_full_name", type_="unique")
+        batch.drop_column("full_name")
@@ -0,0 +1,29 @@
+"""Indexes for the dashboard's unfiltered top-N queries
+
+Revision ID: 0003_dashboard_top_n_indexes
+Revises: 0002_natural_keys_and_snapshots
+Create Date: 2025-06-22
+
+The composite (language, stars) and (subreddit, score) indexes only serve
+filtered panels; "All" needs stars/score alone, and the freshness badge reads
+MAX(timestamp).
+"""
+
+from alembic import op
+
+revision = "0003_dashboard_top_n_indexes"
+down_revision = "0002_natural_keys_and_snapshots"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_github_repos_stars", "github_repos", ["stars"])
+    op.create_index("ix_github_repos_timestamp", "github_repos", ["timestamp"])
+    op.create_index("ix_reddit_posts_score", "reddit_posts", ["score"])
+
+
+def downgrade():
+    op.drop_index("ix_reddit_posts_score", table_name="reddit_posts")
+    op.drop_index("ix_github_repos_timestamp", table_name="github_repos")
+    op.drop_index("ix_github_repos_stars", table_name="github_repos")
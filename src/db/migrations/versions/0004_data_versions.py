@@ -0,0 +1,28 @@
+"""Per-source change counter for push-style dashboard refreshes
+
+Revision ID: 0004_data_versions
+Revises: 0003_dashboard_top_n_indexes
+Create Date: 2025-06-24
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_data_versions"
+down_revision = "0003_dashboard_top_n_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "data_versions",
+        sa.Column("source", sa.String(), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("rows", sa.Integer()),
+        sa.Column("committed_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("data_versions")
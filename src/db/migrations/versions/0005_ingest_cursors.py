@@ -0,0 +1,27 @@
+"""High-water marks for incremental ingests
+
+Revision ID: 0005_ingest_cursors
+Revises: 0004_data_versions
+Create Date: 2025-06-25
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_ingest_cursors"
+down_revision = "0004_data_versions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "ingest_cursors",
+        sa.Column("name", sa.String(), primary_key=True),
+        sa.Column("value", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("ingest_cursors")
@@ -0,0 +1,29 @@
+"""Topic tags for news articles
+
+Revision ID: 0006_news_topics
+Revises: 0005_ingest_cursors
+Create Date: 2025-06-26
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006_news_topics"
+down_revision = "0005_ingest_cursors"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "news_topics",
+        sa.Column("news_id", sa.Integer(), sa.ForeignKey("tech_news.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("topic", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("news_id", "topic"),
+    )
+    op.create_index("ix_news_topics_topic_news", "news_topics", ["topic", "news_id"])
+
+
+def downgrade():
+    op.drop_index("ix_news_topics_topic_news", table_name="news_topics")
+    op.drop_table("news_topics")
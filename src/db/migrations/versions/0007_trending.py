@@ -0,0 +1,68 @@
+"""Materialized trending tables and the repo's trending_reason
+
+Revision ID: 0007_trending
+Revises: 0006_news_topics
+Create Date: 2025-06-27
+
+Existing repos and posts are seeded as a first observation (no velocity yet);
+the next ingest of each item gives it a velocity.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007_trending"
+down_revision = "0006_news_topics"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("github_repos", sa.Column("trending_reason", sa.String(), nullable=True))
+
+    op.create_table(
+        "trending_repos",
+        sa.Column("repo_id", sa.Integer(), sa.ForeignKey("github_repos.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("language", sa.String()),
+        sa.Column("stars", sa.Integer(), nullable=False),
+        sa.Column("captured_at", sa.DateTime(), nullable=False),
+        sa.Column("observations", sa.Integer(), nullable=False),
+        sa.Column("velocity", sa.Float(), nullable=False),
+        sa.Column("acceleration", sa.Float(), nullable=False),
+        sa.Column("trend_score", sa.Float(), nullable=False),
+    )
+    op.create_index("ix_trending_repos_score", "trending_repos", ["trend_score", "stars"])
+    op.create_index("ix_trending_repos_language_score", "trending_repos", ["language", "trend_score", "stars"])
+
+    op.create_table(
+        "trending_posts",
+        sa.Column("post_id", sa.Integer(), sa.ForeignKey("reddit_posts.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("score", sa.Integer(), nullable=False),
+        sa.Column("captured_at", sa.DateTime(), nullable=False),
+        sa.Column("observations", sa.Integer(), nullable=False),
+        sa.Column("velocity", sa.Float(), nullable=False),
+        sa.Column("acceleration", sa.Float(), nullable=False),
+        sa.Column("trend_score", sa.Float(), nullable=False),
+    )
+    op.create_index("ix_trending_posts_score", "trending_posts", ["trend_score", "score"])
+
+    op.execute("""
+        INSERT INTO trending_repos (repo_id, language, stars, captured_at, observations, velocity, acceleration, trend_score)
+        SELECT id, language, stars, timestamp, 1, 0, 0, 0
+        FROM github_repos WHERE stars IS NOT NULL AND timestamp IS NOT NULL
+    """)
+    op.execute("""
+        INSERT INTO trending_posts (post_id, score, captured_at, observations, velocity, acceleration, trend_score)
+        SELECT id, score, timestamp, 1, 0, 0, 0
+        FROM reddit_posts WHERE score IS NOT NULL AND timestamp IS NOT NULL
+    """)
+
+
+def downgrade():
+    op.drop_index("ix_trending_posts_score", table_name="trending_posts")
+    op.drop_table("trending_posts")
+    op.drop_index("ix_trending_repos_language_score", table_name="trending_repos")
+    op.drop_index("ix_trending_repos_score", table_name="trending_repos")
+    op.drop_table("trending_repos")
+    with op.batch_alter_table("github_repos") as batch:
+        batch.drop_column("trending_reason")
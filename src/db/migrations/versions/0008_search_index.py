@@ -0,0 +1,46 @@
+"""Full-text search index over repos, posts and news
+
+Revision ID: 0008_search_index
+Revises: 0007_trending
+Create Date: 2025-06-30
+
+SQLite only (FTS5); the index is filled from the existing rows.
+"""
+
+from alembic import op
+
+revision = "0008_search_index"
+down_revision = "0007_trending"
+branch_labels = None
+depends_on = None
+
+CREATE_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+        kind UNINDEXED, url UNINDEXED, title, body,
+        tokenize = 'porter unicode61', detail = column, prefix = '2 3'
+    )
+"""
+
+# rowid = entity id * 4 + kind code; keep in step with storage.search.SEARCH_KINDS
+SEED_SQL = """
+    INSERT INTO search_index (rowid, kind, url, title, body)
+    SELECT id * 4 + 1, 'repo', url, full_name, COALESCE(description, '') FROM github_repos
+    UNION ALL
+    SELECT id * 4 + 2, 'post', url, title, '' FROM reddit_posts
+    UNION ALL
+    SELECT id * 4 + 3, 'news', url, title, COALESCE(summary, '') FROM tech_news
+"""
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.execute(CREATE_SQL)
+    op.execute(SEED_SQL)
+    op.execute("INSERT INTO search_index (search_index) VALUES ('optimize')")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.execute("DROP TABLE IF EXISTS search_index")
@@ -0,0 +1,41 @@
+"""Repo slugs and cross-source mentions
+
+Revision ID: 0009_mentions
+Revises: 0008_search_index
+Create Date: 2025-07-02
+
+Mentions start empty; `python -m storage.mentions` links the posts and
+articles already stored.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009_mentions"
+down_revision = "0008_search_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("github_repos", sa.Column("slug", sa.String(), nullable=True))
+    op.execute("UPDATE github_repos SET slug = LOWER(full_name)")
+    op.create_index("ix_github_repos_slug", "github_repos", ["slug"], postgresql_using="hash")
+
+    op.create_table(
+        "mentions",
+        sa.Column("slug", sa.String(), nullable=False),
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("mentioned_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("source", "item_id", "slug"),
+    )
+    op.create_index("ix_mentions_slug_source", "mentions", ["slug", "source"])
+
+
+def downgrade():
+    op.drop_index("ix_mentions_slug_source", table_name="mentions")
+    op.drop_table("mentions")
+    op.drop_index("ix_github_repos_slug", table_name="github_repos")
+    with op.batch_alter_table("github_repos") as batch:
+        batch.drop_column("slug")
@@ -0,0 +1,42 @@
+"""MinHash signatures, LSH buckets and story clusters for posts and news
+
+Revision ID: 0010_near_duplicates
+Revises: 0009_mentions
+Create Date: 2025-07-04
+
+Existing rows start unclustered (panels fall back to the row's own id);
+`python -m storage.clusters` signs and clusters them.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010_near_duplicates"
+down_revision = "0009_mentions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    for table in ("reddit_posts", "tech_news"):
+        with op.batch_alter_table(table) as batch:
+            batch.add_column(sa.Column("minhash", sa.LargeBinary(), nullable=True))
+            batch.add_column(sa.Column("cluster_id", sa.Integer(), nullable=True))
+
+    op.create_table(
+        "minhash_buckets",
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("bucket", sa.BigInteger(), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("source", "bucket", "item_id"),
+    )
+    op.create_index("ix_minhash_buckets_item", "minhash_buckets", ["source", "item_id"])
+
+
+def downgrade():
+    op.drop_index("ix_minhash_buckets_item", table_name="minhash_buckets")
+    op.drop_table("minhash_buckets")
+    for table in ("reddit_posts", "tech_news"):
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column("cluster_id")
+            batch.drop_column("minhash")
@@ -1,26 +1,54 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import DDL, event
+from sqlalchemy import Column, Integer, BigInteger, LargeBinary, String, Text, DateTime, Float, ForeignKey, Index, PrimaryKeyConstraint, UniqueConstraint
 from db.database import Base  # ✅ Use shared Base
 
+# Entity tables hold one row per natural key (the latest state); history lives
+# in the append-only *_snapshots tables so entity scans stay flat over time.
+
 class GitHubRepo(Base):
     __tablename__ = "github_repos"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
+    full_name = Column(String, nullable=False)  # owner/name, natural key
     name = Column(String)
     url = Column(String)
     stars = Column(Integer)
     description = Column(Text)
     language = Column(String)
-    timestamp = Column(DateTime)
+    trending_reason = Column(String)  # search strategy that surfaced the repo
+    slug = Column(String)  # lowercased full_name, what mentions link on (transform.links.normalize_slug)
+    timestamp = Column(DateTime)  # last time ingestion saw the repo
+
+    __table_args__ = (
+        UniqueConstraint("full_name", name="uq_github_repos_full_name"),
+        Index("ix_github_repos_language_stars", "language", "stars"),
+        Index("ix_github_repos_stars", "stars"),
+        Index("ix_github_repos_timestamp", "timestamp"),
+        # Equality lookups only; Postgres gets a hash index, SQLite a B-tree
+        Index("ix_github_repos_slug", "slug", postgresql_using="hash"),
+    )
 
 class RedditPost(Base):
     __tablename__ = "reddit_posts"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
+    post_id = Column(String, nullable=False)  # Reddit's base36 id, natural key
     title = Column(String)
     score = Column(Integer)
     url = Column(String)
     subreddit = Column(String)
-    timestamp = Column(DateTime)
+    author = Column(String)
+    num_comments = Column(Integer)
+    created_utc = Column(Float)
+    timestamp = Column(DateTime)  # last time ingestion saw the post
+    minhash = Column(LargeBinary)  # title signature, see transform.near_dup
+    cluster_id = Column(Integer)  # id of the first post of its near-duplicate story
+
+    __table_args__ = (
+        UniqueConstraint("post_id", name="uq_reddit_posts_post_id"),
+        Index("ix_reddit_posts_subreddit_score", "subreddit", "score"),
+        Index("ix_reddit_posts_score", "score"),
+    )
 
 class TechNews(Base):
     __tablename__ = "tech_news"
@@ -29,5 +57,144 @@ class TechNews(Base):
     title = Column(String)
     summary = Column(Text)
     sentiment = Column(String)
-    url = Column(String)
+    url = Column(String, nullable=False)  # natural key
+    source = Column(String)
     published_at = Column(String)
+    minhash = Column(LargeBinary)  # title signature, see transform.near_dup
+    cluster_id = Column(Integer)  # id of the first article of its near-duplicate story
+
+    __table_args__ = (
+        UniqueConstraint("url", name="uq_tech_news_url"),
+        Index("ix_tech_news_published_at", "published_at"),
+    )
+
+class NewsTopic(Base):
+    """Topic tags matched on an article; one row per (article, topic)"""
+    __tablename__ = "news_topics"
+
+    news_id = Column(Integer, ForeignKey("tech_news.id", ondelete="CASCADE"), nullable=False)
+    topic = Column(String, nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("news_id", "topic"),
+        Index("ix_news_topics_topic_news", "topic", "news_id"),
+    )
+
+class Mention(Base):
+    """A Reddit post or news article referencing a repo, by normalized owner/name.
+
+    Keyed by slug rather than repo id so a github.com link counts even when
+    the repo is ingested later; panels join on github_repos.slug.
+    """
+    __tablename__ = "mentions"
+
+    slug = Column(String, nullable=False)
+    source = Column(String, nullable=False)  # "reddit" or "news"
+    item_id = Column(Integer, nullable=False)  # reddit_posts.id or tech_news.id
+    mentioned_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("source", "item_id", "slug"),
+        Index("ix_mentions_slug_source", "slug", "source"),
+    )
+
+class MinHashBucket(Base):
+    """LSH buckets of post and news signatures: items sharing one are near-duplicate candidates"""
+    __tablename__ = "minhash_buckets"
+
+    source = Column(String, nullable=False)  # "reddit" or "news"
+    bucket = Column(BigInteger, nullable=False)
+    item_id = Column(Integer, nullable=False)  # reddit_posts.id or tech_news.id
+
+    __table_args__ = (
+        PrimaryKeyConstraint("source", "bucket", "item_id"),
+        Index("ix_minhash_buckets_item", "source", "item_id"),
+    )
+
+class RepoStarSnapshot(Base):
+    __tablename__ = "repo_star_snapshots"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    repo_id = Column(Integer, ForeignKey("github_repos.id", ondelete="CASCADE"), nullable=False)
+    stars = Column(Integer, nullable=False)
+    captured_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_repo_star_snapshots_repo_captured", "repo_id", "captured_at"),
+    )
+
+class PostScoreSnapshot(Base):
+    __tablename__ = "post_score_snapshots"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    post_id = Column(Integer, ForeignKey("reddit_posts.id", ondelete="CASCADE"), nullable=False)
+    score = Column(Integer, nullable=False)
+    num_comments = Column(Integer)
+    captured_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_post_score_snapshots_post_captured", "post_id", "captured_at"),
+    )
+
+class DataVersion(Base):
+    """One row per source, bumped by the storage layer on every committed ingest"""
+    __tablename__ = "data_versions"
+
+    source = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False)
+    rows = Column(Integer)
+    committed_at = Column(DateTime, nullable=False)
+
+class IngestCursor(Base):
+    """Where an incremental ingest left off (e.g. the newest NewsData article seen)"""
+    __tablename__ = "ingest_cursors"
+
+    name = Column(String, primary_key=True)
+    value = Column(Text, nullable=False)  # JSON, shape owned by the ingest
+    updated_at = Column(DateTime, nullable=False)
+
+# Materialized trending state, one row per item, advanced by the storage layer
+# on every ingest from the previous row alone (see storage/trending.py).
+
+class TrendingRepo(Base):
+    __tablename__ = "trending_repos"
+
+    repo_id = Column(Integer, ForeignKey("github_repos.id", ondelete="CASCADE"), primary_key=True)
+    language = Column(String)  # copied from the repo so per-language panels stay index-only
+    stars = Column(Integer, nullable=False)  # last observation
+    captured_at = Column(DateTime, nullable=False)
+    observations = Column(Integer, nullable=False)
+    velocity = Column(Float, nullable=False)  # smoothed stars/hour
+    acceleration = Column(Float, nullable=False)  # change in velocity per hour
+    trend_score = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("ix_trending_repos_score", "trend_score", "stars"),
+        Index("ix_trending_repos_language_score", "language", "trend_score", "stars"),
+    )
+
+class TrendingPost(Base):
+    __tablename__ = "trending_posts"
+
+    post_id = Column(Integer, ForeignKey("reddit_posts.id", ondelete="CASCADE"), primary_key=True)
+    score = Column(Integer, nullable=False)  # last observation
+    captured_at = Column(DateTime, nullable=False)
+    observations = Column(Integer, nullable=False)
+    velocity = Column(Float, nullable=False)  # smoothed score/hour
+    acceleration = Column(Float, nullable=False)
+    trend_score = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("ix_trending_posts_score", "trend_score", "score"),
+    )
+
+# Full-text index over repos, posts and news: an SQLite FTS5 virtual table, so
+# it isn't a mapped model. storage.search keeps it in step with the entity
+# tables; the prefix indexes make search-as-you-type queries cheap.
+SEARCH_INDEX_DDL = DDL("""
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+        kind UNINDEXED, url UNINDEXED, title, body,
+        tokenize = 'porter unicode61', detail = column, prefix = '2 3'
+    )
+""")
+event.listen(Base.metadata, "after_create", SEARCH_INDEX_DDL.execute_if(dialect="sqlite"))
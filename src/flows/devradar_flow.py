@@ -1,51 +1,120 @@
 # src/flows/devradar_flow.py
 
 import os
+import argparse
+import asyncio
 from dotenv import load_dotenv
 from prefect import flow, task
-from ingest.github_ingest import fetch_top_repos
-from ingest.reddit_ingest import fetch_top_posts
-from ingest.news_ingest import fetch_tech_news
-from transform.reddit_transform import normalize_posts
-from transform.news_transform import summarize_text, get_sentiment_label
-from storage.db_helpers import save_github_to_db, save_reddit_to_db, save_news_to_db
+from ingest.async_ingest import http_cache, fetch_top_repos_async, fetch_new_tech_news_async, sweep_languages_async
+from ingest.news_ingest import NEWS_CURSOR
+from ingest.reddit_ingest import stream_top_posts
+from transform.reddit_transform import normalize_post
+from transform.news_transform import enrich_texts
+from storage.archive import ArchiveWriter, archive_records, compact_archive
+from storage.db_helpers import save_github_to_db, save_post_stream, save_news_to_db
+from storage.cursors import load_cursor, save_cursor
+from utils.logger import get_logger
+from utils.profiling import profiled
+from utils.telemetry import configure_tracing, stage
 load_dotenv()
+logger = get_logger(__name__)
+
+# Fetches run concurrently on the event loop; blocking work (LSA summaries,
+# SQLite commits) is pushed to worker threads so it never stalls the others.
 
 @task
-def ingest_github():
-    repos = fetch_top_repos()
-    save_github_to_db(repos)
+async def ingest_github():
+    with stage("ingest.github"):
+        raw = []
+        repos = await fetch_top_repos_async(raw=raw)
+        await asyncio.to_thread(archive_records, "github", raw)
+        await asyncio.to_thread(save_github_to_db, repos)
+    logger.info(f"GitHub HTTP cache (lifetime): {http_cache.stats()}")
+
+def page_saver(archive=None):
+    """Save sweep pages as they arrive, one write at a time, without stalling the fetches"""
+    write_lock = asyncio.Lock()
+
+    async def save_page(repos, items):
+        async with write_lock:
+            if archive is not None:
+                await asyncio.to_thread(archive.write, items)  # the search items as fetched
+            await asyncio.to_thread(save_github_to_db, repos)
+
+    return save_page
 
 @task
-def ingest_reddit():
-    posts = normalize_posts(fetch_top_posts())
-    save_reddit_to_db(posts)
+async def ingest_github_languages(pages=None):
+    kwargs = {"pages": pages} if pages else {}
+    with stage("ingest.github_sweep"), ArchiveWriter("github") as archive:
+        return await sweep_languages_async(page_saver(archive), **kwargs)
 
 @task
-def ingest_news():
-    api_key = os.getenv("NEWSDATA_API_KEY")
-    articles = fetch_tech_news(api_key=api_key, limit=5)
+async def ingest_reddit():
+    # Listings are consumed on the worker thread; each page is archived and saved as it arrives
+    with stage("ingest.reddit"), ArchiveWriter("reddit") as archive:
+        posts = map(normalize_post, archive.tee(stream_top_posts()))
+        await asyncio.to_thread(save_post_stream, posts)
 
+@stage("transform.clean_articles")
+def clean_articles(articles):
     cleaned_articles = []
-    for article in articles:
-        summary = summarize_text(article.get("description", ""))
-        sentiment = get_sentiment_label(article.get("description", ""))
+    enriched = enrich_texts([article.get("description", "") for article in articles])
+    for article, (summary, sentiment) in zip(articles, enriched):
         cleaned_articles.append({
             "title": article.get("title", ""),
             "summary": summary,
             "sentiment": sentiment,
             "url": article.get("link", ""),  # map correctly
-            "published_at": article.get("pubDate", "")
+            "source": article.get("source", ""),
+            "published_at": article.get("pubDate", ""),
+            "topics": article.get("topics", [])
         })
+    return cleaned_articles
+
+@task
+async def ingest_news():
+    api_key = os.getenv("NEWSDATA_API_KEY")
+    with stage("ingest.news"):
+        cursor = await asyncio.to_thread(load_cursor, NEWS_CURSOR)
+        raw = []
+        articles, new_cursor = await fetch_new_tech_news_async(api_key=api_key, cursor=cursor, raw=raw)
+
+        if raw:
+            # Every unseen article as fetched, the topic filter's rejects too, so backfills can re-filter
+            await asyncio.to_thread(archive_records, "news", raw)
+        if articles:
+            # Articles without a link can't be stored; the cursor still moves past them
+            cleaned_articles = [article for article in await asyncio.to_thread(clean_articles, articles)
+                                if article["url"]]
+            if cleaned_articles and not await asyncio.to_thread(save_news_to_db, cleaned_articles):
+                return  # the write failed: keep the old mark so the next run retries these
+        if new_cursor != cursor:
+            await asyncio.to_thread(save_cursor, NEWS_CURSOR, new_cursor)
 
-    save_news_to_db(cleaned_articles)
+
+@task
+async def compact_raw_archive():
+    """Merge the small per-cycle archive files of days that are over"""
+    compacted = await asyncio.to_thread(compact_archive)
+    if compacted:
+        logger.info(f"Compacted {compacted} archive partitions")
 
 
 @flow(name="DevRadar Ingestion Flow")
-def devradar_pipeline():
-    ingest_github()
-    ingest_reddit()
-    ingest_news()
+async def devradar_pipeline():
+    await asyncio.gather(ingest_github(), ingest_reddit(), ingest_news())
+    await compact_raw_archive()
+
+@flow(name="DevRadar GitHub Language Sweep")
+async def github_language_sweep(pages: int = None):
+    """Every language from get_repo_languages(), several pages deep"""
+    return await ingest_github_languages(pages)
 
 if __name__ == "__main__":
-    devradar_pipeline()
+    parser = argparse.ArgumentParser(description="Run one DevRadar ingestion cycle")
+    parser.add_argument("--profile", action="store_true", help="Record a sampled profile of the run (utils.profiling)")
+    args = parser.parse_args()
+    configure_tracing()
+    with profiled("pipeline", args.profile):
+        asyncio.run(devradar_pipeline())
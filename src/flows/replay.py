@@ -0,0 +1,240 @@
+# src/flows/replay.py
+
+"""Rebuild the database from what ingestion already fetched, without any API call.
+
+Every input of a source is replayed oldest first: the legacy JSON dumps under
+data/<source>/ (fetch time taken from the file name), then the Parquet
+archive (storage.archive), file by file and in fetch order within each file.
+Records are read `chunk_size` at a time, decoded and put through the current
+transforms (normalize_repo, normalize_post, topic matching, summaries and
+sentiment) by a process pool, and written through the regular save functions,
+so snapshots, trending, search, mentions and clusters are rebuilt with them.
+Each fetch cycle is written with its original timestamp, so star and score
+history comes out as if it had been ingested live.
+
+At most a few chunks are in flight, which bounds memory whatever the size of
+the archive. After each chunk is committed the position is saved as the
+"replay:<source>" cursor; an interrupted replay resumes from there. Writes
+are upserts, so replaying a chunk twice only repeats its snapshots.
+
+    python -m cli.devradar_cli --replay --source github --since 2025-06-01
+"""
+
+import json
+import multiprocessing
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
+
+import pyarrow.parquet as pq
+
+from config import ARCHIVE_DIR, REPLAY_CHUNK_SIZE, REPLAY_WORKERS
+from flows.devradar_flow import clean_articles
+from storage.cursors import load_cursor, save_cursor
+from storage.db_helpers import save_github_to_db, save_news_to_db, save_reddit_to_db
+from transform.github_transform import normalize_repo
+from transform.news_transform import get_sentiment_label
+from transform.reddit_transform import normalize_post
+from transform.topics import topic_matcher
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SOURCES = ("github", "reddit", "news")
+LEGACY_DIR = "data"
+LEGACY_NAME_RE = re.compile(r"_(\d{8}_\d{6})\.json$")  # github_repos_20250611_001214.json
+
+
+def checkpoint_name(source):
+    return f"replay:{source}"
+
+
+def replay_inputs(source, since=None, until=None, archive_root=ARCHIVE_DIR, legacy_root=LEGACY_DIR):
+    """(sort key, path) of every input of `source` fetched between `since` and `until` (dates), oldest first.
+
+    The sort key is (0 for legacy JSON / 1 for the archive, fetch date, file
+    name); within an archive partition, compacted files come before the
+    per-cycle files written after them, and those sort by fetch time.
+    """
+    inputs = []
+    legacy_dir = os.path.join(legacy_root, source) if legacy_root else None
+    if legacy_dir and os.path.isdir(legacy_dir):
+        for entry in os.scandir(legacy_dir):
+            match = LEGACY_NAME_RE.search(entry.name)
+            if match:
+                day = datetime.strptime(match.group(1), "%Y%m%d_%H%M%S").date().isoformat()
+                inputs.append(((0, day, entry.name), entry.path))
+    source_dir = os.path.join(archive_root, f"source={source}") if archive_root else None
+    if source_dir and os.path.isdir(source_dir):
+        for date_dir in os.scandir(source_dir):
+            if not (date_dir.is_dir() and date_dir.name.startswith("date=")):
+                continue
+            for entry in os.scandir(date_dir.path):
+                if entry.name.endswith(".parquet") and not entry.name.startswith("."):
+                    inputs.append(((1, date_dir.name[5:], entry.name), entry.path))
+    since, until = since and since.isoformat(), until and until.isoformat()
+    return sorted((key, path) for key, path in inputs
+                  if (not since or key[1] >= since) and (not until or key[1] <= until))
+
+
+def read_chunks(path, chunk_size, skip=0):
+    """(rows read so far, fetch times, payloads) of one input, `chunk_size` records at a time, after the first `skip`
+
+    Payloads are the archive's JSON strings, or the records themselves for a
+    legacy dump; either way they are decoded by the workers.
+    """
+    if path.endswith(".json"):
+        fetched_at = datetime.strptime(LEGACY_NAME_RE.search(path).group(1), "%Y%m%d_%H%M%S")
+        with open(path) as f:
+            records = json.load(f)
+        for start in range(skip, len(records), chunk_size):
+            payloads = records[start:start + chunk_size]
+            yield start + len(payloads), [fetched_at] * len(payloads), payloads
+        return
+
+    parquet = pq.ParquetFile(path, memory_map=True)
+    offset = 0
+    for batch in parquet.iter_batches(batch_size=chunk_size, columns=["fetched_at", "payload"]):
+        offset += batch.num_rows
+        if offset <= skip:
+            continue
+        batch = batch.slice(max(skip - (offset - batch.num_rows), 0))
+        yield offset, batch.column("fetched_at").to_pylist(), batch.column("payload").to_pylist()
+
+
+def prepare_github(record, fetched_at):
+    if "html_url" in record:
+        # A raw search item: the current transform is applied
+        return {**normalize_repo(record), "timestamp": fetched_at}
+    # Old dumps and early archives hold already formatted repos, some with the short name
+    return {**record, "name": record.get("full_name") or record.get("name"), "timestamp": fetched_at}
+
+
+def prepare_news(record, fetched_at):
+    if "description" in record:
+        # A raw NewsData article: re-matched here, summarized by the writer (clean_articles)
+        topics = topic_matcher.match(record.get("title"), record.get("description"))
+        if not (record["description"] and record.get("link") and topics):
+            return None
+        return {**record, "source": record.get("source") or record.get("source_id", ""), "topics": topics}
+    # Old news_summary dumps only kept the summary: re-score and re-tag it
+    summary = record.get("summary") or ""
+    if not (record.get("url") or record.get("link")):
+        return None  # url is the key; live ingestion couldn't have stored it either
+    return {
+        "title": record.get("title", ""),
+        "summary": summary,
+        "sentiment": get_sentiment_label(summary),
+        "url": record.get("url") or record.get("link", ""),
+        "source": record.get("source", ""),
+        "published_at": record.get("published_at") or record.get("published") or fetched_at.isoformat(),
+        "topics": topic_matcher.match(record.get("title"), summary),
+    }
+
+
+PREPARE = {
+    "github": prepare_github,
+    "reddit": lambda record, fetched_at: normalize_post(record),
+    "news": prepare_news,
+}
+
+
+def prepare_chunk(source, fetched_at, payloads):
+    """(fetch time, transformed item) per payload; the unit of work sent to pool workers"""
+    prepare = PREPARE[source]
+    items = []
+    for captured_at, payload in zip(fetched_at, payloads):
+        item = prepare(json.loads(payload) if isinstance(payload, str) else payload, captured_at)
+        if item is not None:
+            items.append((captured_at, item))
+    return items
+
+
+def write_chunk(source, items):
+    """Save one prepared chunk, one call per fetch cycle so history keeps its timestamps; returns rows written"""
+    if source == "news":
+        # Articles carry no fetch time of their own; summaries come from the shared enricher
+        cleaned = iter(clean_articles([item for _, item in items if "description" in item]))
+        cycles = [(None, [next(cleaned) if "description" in item else item for _, item in items])]
+    else:
+        cycles = [(captured_at, [item for _, item in cycle]) for captured_at, cycle in groupby(items, key=itemgetter(0))]
+
+    written = 0
+    for captured_at, batch in cycles:
+        if source == "github":
+            saved = save_github_to_db(batch)
+        elif source == "reddit":
+            saved = save_reddit_to_db(batch, timestamp=captured_at)
+        else:
+            saved = save_news_to_db(batch)
+        if batch and not saved:
+            # The save functions log and swallow their errors; stop before the checkpoint moves past them
+            raise RuntimeError(f"Replay of {source} stopped: saving a chunk failed (see the log above)")
+        written += saved
+    return written
+
+
+def replay_source(source, since=None, until=None, workers=REPLAY_WORKERS, chunk_size=REPLAY_CHUNK_SIZE,
+                  fresh=False, archive_root=ARCHIVE_DIR, legacy_root=LEGACY_DIR):
+    """Replay every input of `source` not replayed yet (all of them if `fresh`); returns a report dict"""
+    started = time.perf_counter()
+    inputs = replay_inputs(source, since, until, archive_root, legacy_root)
+    checkpoint = None if fresh else load_cursor(checkpoint_name(source))
+    resume, resume_rows = (tuple(checkpoint["input"]), checkpoint["rows"]) if checkpoint else ((), 0)
+    if resume and resume not in {key for key, _ in inputs}:
+        # Compacted (or removed) since the checkpoint: start over at its partition
+        logger.warning(f"Replay checkpoint {resume} is gone, replaying {source} from {resume[1]} again")
+        resume, resume_rows = resume[:2], 0
+
+    workers = workers or os.cpu_count() or 1
+    # Spawned: forking a process that already runs threads (Prefect, the DB pool) can deadlock the children
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    pending = deque()  # (input key, rows read, future or prepared items), in input order
+    report = {"source": source, "inputs": 0, "records": 0, "rows": 0}
+
+    def write_next():
+        key, rows_read, work = pending.popleft()
+        report["rows"] += write_chunk(source, work.result() if pool else work)
+        save_cursor(checkpoint_name(source), {"input": list(key), "rows": rows_read})
+
+    try:
+        for key, path in inputs:
+            if key[:len(resume)] < resume:
+                continue
+            skip = resume_rows if key == resume else 0
+            report["inputs"] += 1
+            for rows_read, fetched_at, payloads in read_chunks(path, chunk_size, skip):
+                report["records"] += len(payloads)
+                if pool:
+                    pending.append((key, rows_read, pool.submit(prepare_chunk, source, fetched_at, payloads)))
+                else:
+                    pending.append((key, rows_read, prepare_chunk(source, fetched_at, payloads)))
+                # A few chunks ahead keeps every worker busy while the writer commits
+                while len(pending) > (2 * workers if pool else 0):
+                    write_next()
+        while pending:
+            write_next()
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+
+    report["seconds"] = round(time.perf_counter() - started, 1)
+    logger.info(f"Replayed {report['records']} {source} records from {report['inputs']} inputs "
+                f"into {report['rows']} rows in {report['seconds']}s")
+    return report
+
+
+def replay(sources=SOURCES, **kwargs):
+    """replay_source() for each of `sources`; returns their reports"""
+    return [replay_source(source, **kwargs) for source in sources]
+
+
+if __name__ == "__main__":
+    replay()
@@ -3,25 +3,22 @@
 import os
 from dotenv import load_dotenv
 
-from ingest.github_ingest import fetch_trending_repos
-from storage.github_storage import save_repos_to_json
-from transform.github_transform import normalize_repos
+from ingest.github_ingest import fetch_top_repos
+from storage.archive import archive_records
 
 load_dotenv()
 
 def main():
-    # Step 1: Fetch raw GitHub repos
-    raw_repos = fetch_trending_repos()
+    # Step 1: Fetch GitHub repos (in storage shape, see format_repos) and the search items behind them
+    raw = []
+    repos = fetch_top_repos(raw=raw)
 
-    # Step 2: Normalize repo data
-    normalized = normalize_repos(raw_repos)
-
-    # Step 3: Print summary
-    for repo in normalized:
+    # Step 2: Print summary
+    for repo in repos:
         print(f"{repo['full_name']} - ⭐ {repo['stars']} stars")
 
-    # Step 4: Save to JSON
-    save_repos_to_json(normalized)
+    # Step 3: Archive the raw search items, as the flow does
+    archive_records("github", raw)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,234 @@
+# src/ingest/async_ingest.py
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import httpx
+from dotenv import load_dotenv
+
+from config import GITHUB_SWEEP_PAGES, GITHUB_SWEEP_PER_PAGE, NEWS_MAX_PAGES
+from ingest.github_ingest import (
+    HEADERS,
+    SEARCH_URL,
+    check_github_response,
+    format_repos,
+    get_repo_languages,
+    http_cache,
+    new_trending_params,
+    popular_params,
+    rate_limited_response,
+    rate_limiter,
+    recently_active_params,
+    tag_repos,
+)
+from ingest.news_ingest import (
+    NEWS_PARAMS,
+    NEWS_URL,
+    NewsPager,
+    filter_tech_articles,
+    news_headers,
+)
+from ingest.rate_limit import backoff_delay
+from utils.logger import get_logger
+from utils.telemetry import httpx_event_hooks, observe_rate_limit_wait, stage
+
+load_dotenv()
+logger = get_logger(__name__)
+
+HTTP_TIMEOUT = 30
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+
+def github_client():
+    """One pooled client shared by every GitHub call of a cycle"""
+    return httpx.AsyncClient(headers=HEADERS, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS,
+                             event_hooks=httpx_event_hooks("github"))
+
+
+def news_client():
+    """One pooled client shared by every NewsData call of a cycle"""
+    return httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS, event_hooks=httpx_event_hooks("newsdata"))
+
+
+@asynccontextmanager
+async def _use_client(client, factory):
+    """Reuse the caller's client, or open (and close) a fresh one"""
+    if client is not None:
+        yield client
+        return
+    async with factory() as owned:
+        yield owned
+
+
+async def make_github_request_async(client, url, params, max_retries=3):
+    """Async twin of make_github_request; sleeps without blocking the loop"""
+
+    cache_key = http_cache.key(url, params)
+    cached = http_cache.fresh(cache_key)
+    if cached is not None:
+        return cached.get("items", [])
+
+    resource = rate_limiter.resource_for(url)
+    for attempt in range(max_retries):
+        try:
+            await rate_limiter.acquire_async(resource)
+            response = await client.get(url, params=params, headers=http_cache.validators(cache_key))
+            items, wait_time = check_github_response(response, attempt, max_retries, cache_key)
+
+            if wait_time:
+                if rate_limited_response(response):  # server-error backoffs aren't rate-limit waits
+                    observe_rate_limit_wait(resource, wait_time)
+                await asyncio.sleep(wait_time)
+            if items is None:
+                continue
+            return items
+
+        except httpx.TimeoutException:
+            logger.error(f"GitHub API timeout (attempt {attempt + 1}/{max_retries})")
+            if attempt < max_retries - 1:
+                await asyncio.sleep(backoff_delay(attempt))
+                continue
+            return []
+
+        except httpx.HTTPError as e:
+            logger.error(f"GitHub API request failed: {str(e)}")
+            if attempt < max_retries - 1:
+                await asyncio.sleep(backoff_delay(attempt))
+                continue
+            return []
+
+    return []
+
+
+async def fetch_top_repos_async(language="python", limit=5, client=None, raw=None):
+    """Same strategies as fetch_top_repos, with the searches run concurrently
+
+    Every search item fetched is also appended, unmodified, to `raw` when given (for the archive).
+    """
+    logger.info(f"Fetching trending repos for language: {language}")
+
+    with stage("fetch.github", language=language):
+        async with _use_client(client, github_client) as gh:
+            new_trending, active_repos = await asyncio.gather(
+                make_github_request_async(gh, SEARCH_URL, new_trending_params(language, 3)),
+                make_github_request_async(gh, SEARCH_URL, recently_active_params(language, 3)),
+            )
+            fetched = new_trending + active_repos
+            all_repos = tag_repos(new_trending, "new_trending") + tag_repos(active_repos, "recently_active")
+
+            # Fallback only costs a round trip when the first two came up short
+            if len(all_repos) < limit:
+                popular_repos = await make_github_request_async(gh, SEARCH_URL, popular_params(language, limit))
+                fetched += popular_repos
+                all_repos.extend(tag_repos(popular_repos, "popular"))
+            if raw is not None:
+                raw.extend(fetched)
+
+        return format_repos(all_repos, limit)
+
+
+async def fetch_language_pages_async(client, language, pages, per_page, on_page):
+    """Page through a language's most-starred repos, awaiting `on_page(repos, items)` as each page lands
+
+    `items` are the page's search items as the API returned them, for the archive.
+    """
+    fetched = 0
+    for page in range(1, pages + 1):
+        params = {**popular_params(language, per_page), "page": page}
+        with stage("fetch.github_page", language=language, page=page):
+            items = await make_github_request_async(client, SEARCH_URL, params)
+        repos = format_repos(tag_repos(items, "popular"), len(items))
+        if repos:
+            await on_page(repos, items)
+        fetched += len(repos)
+        if len(items) < per_page:
+            break  # last page (or the request failed)
+    return fetched
+
+
+async def sweep_languages_async(on_page, languages=None, pages=GITHUB_SWEEP_PAGES, per_page=GITHUB_SWEEP_PER_PAGE):
+    """Ingest `pages` pages of repos for every language, languages in parallel.
+
+    Concurrency is bounded by the shared rate limiter, not by a worker count:
+    requests go out as fast as the search budget allows. Returns a run report
+    with throughput and the search quota consumed.
+    """
+    languages = list(languages or get_repo_languages())
+    per_page = min(per_page, 100)  # GitHub's maximum
+    quota_before = rate_limiter.stats()["search"]["requests"]
+    start = time.perf_counter()
+
+    async with github_client() as gh:
+        counts = await asyncio.gather(*(
+            fetch_language_pages_async(gh, language, pages, per_page, on_page) for language in languages
+        ))
+
+    elapsed = time.perf_counter() - start
+    report = {
+        "languages": len(languages),
+        "repos": sum(counts),
+        "seconds": round(elapsed, 2),
+        "repos_per_sec": round(sum(counts) / elapsed, 1) if elapsed else 0.0,
+        "search_quota_used": rate_limiter.stats()["search"]["requests"] - quota_before,
+    }
+    logger.info(f"GitHub language sweep: {report}")
+    return report
+
+
+async def fetch_tech_news_async(api_key, limit=5, client=None):
+    try:
+        with stage("fetch.news"):
+            async with _use_client(client, news_client) as http:
+                response = await http.get(NEWS_URL, params=NEWS_PARAMS, headers=news_headers(api_key))
+        data = response.json()
+        news = filter_tech_articles(data.get("results", []), limit)
+        logger.info(f"Fetched {len(news)} tech news articles.")
+        return news
+
+    except Exception as e:
+        logger.error(f"Error fetching tech news: {e}")
+        return []
+
+
+async def fetch_new_tech_news_async(api_key, cursor=None, max_pages=NEWS_MAX_PAGES, client=None, raw=None):
+    """Async twin of fetch_new_tech_news: pages back only until the high-water mark"""
+    pager = NewsPager(cursor, max_pages)
+    try:
+        with stage("fetch.news"):
+            async with _use_client(client, news_client) as http:
+                while not pager.done:
+                    response = await http.get(NEWS_URL, params=pager.params(), headers=news_headers(api_key))
+                    response.raise_for_status()
+                    pager.add(response.json())
+    except Exception as e:
+        logger.error(f"Error fetching tech news: {e}")
+        return [], cursor
+    return pager.result(raw)
+
+
+async def fetch_top_posts_async(subreddit_name="programming", limit=10, time_filter="day"):
+    """praw is synchronous, so run it on a worker thread next to the HTTP fan-out"""
+    from ingest.reddit_ingest import fetch_top_posts
+
+    return await asyncio.to_thread(fetch_top_posts, subreddit_name, limit, time_filter)
+
+
+async def ingest_all(api_key, languages=("python",), github_limit=5, reddit_limit=10, news_limit=5,
+                     include_reddit=True):
+    """Fetch every source concurrently; a cycle takes about as long as its slowest call"""
+    async with github_client() as gh, news_client() as http:
+        jobs = [
+            asyncio.gather(*(fetch_top_repos_async(lang, github_limit, client=gh) for lang in languages)),
+            fetch_tech_news_async(api_key, news_limit, client=http),
+        ]
+        if include_reddit:
+            jobs.append(fetch_top_posts_async(limit=reddit_limit))
+        results = await asyncio.gather(*jobs)
+
+    repos = [repo for per_language in results[0] for repo in per_language]
+    return {
+        "github": repos,
+        "news": results[1],
+        "reddit": results[2] if include_reddit else [],
+    }
@@ -19,43 +19,70 @@ except ImportError:
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
 
+from config import GITHUB_HTTP_CACHE_PATH
+from ingest.rate_limit import GitHubRateLimiter, backoff_delay
+from utils.http_cache import ConditionalCache
+from utils.telemetry import observe_rate_limit_wait, requests_hook, stage
+
 load_dotenv()
 
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+SEARCH_URL = f"{GITHUB_API_URL}/search/repositories"
 HEADERS = {
     "Authorization": f"Bearer {GITHUB_TOKEN}",
     "Accept": "application/vnd.github+json",
     "X-GitHub-Api-Version": "2022-11-28"
 }
 
-def fetch_top_repos(language="python", limit=5):
-    """Main function that combines different trending strategies"""
+# Conditional requests: identical searches come back as 304s, which cost no quota
+http_cache = ConditionalCache(GITHUB_HTTP_CACHE_PATH)
+
+# Paces every GitHub call in the process against the search / core quotas
+rate_limiter = GitHubRateLimiter()
+
+# Times every GitHub response into the HTTP latency histogram
+HOOKS = {"response": requests_hook("github")}
+
+@stage("fetch.github")
+def fetch_top_repos(language="python", limit=5, raw=None):
+    """Main function that combines different trending strategies
+
+    Every search item fetched is also appended, unmodified, to `raw` when given (for the archive).
+    """
     logger.info(f"Fetching trending repos for language: {language}")
     
     all_repos = []
     
     # Strategy 1: Recently created repos with good traction
-    new_trending = fetch_new_trending_repos(language=language, limit=3)
+    new_trending = fetch_new_trending_repos(language=language, limit=3, raw=raw)
     all_repos.extend(new_trending)
     
     # Strategy 2: Recently active established repos  
-    active_repos = fetch_recently_active_repos(language=language, limit=3)
+    active_repos = fetch_recently_active_repos(language=language, limit=3, raw=raw)
     all_repos.extend(active_repos)
     
     # Strategy 3: Fallback to most starred if above strategies fail
     if len(all_repos) < limit:
-        popular_repos = fetch_popular_repos(language=language, limit=limit)
+        popular_repos = fetch_popular_repos(language=language, limit=limit, raw=raw)
         all_repos.extend(popular_repos)
     
-    # Remove duplicates and format
+    return format_repos(all_repos, limit)
+
+
+def format_repos(all_repos, limit):
+    """Remove duplicates across strategies and format for storage"""
     seen_repos = set()
     formatted_repos = []
     
     for repo in all_repos:
-        if repo["name"] not in seen_repos:
-            seen_repos.add(repo["name"])
+        # Short names collide across owners ("awesome", "dotfiles"), full names don't
+        key = repo.get("full_name") or repo["name"]
+        if key not in seen_repos:
+            seen_repos.add(key)
             formatted_repos.append({
                 "name": repo.get("full_name"),
+                "full_name": repo.get("full_name"),
                 "url": repo.get("html_url"),
                 "stars": repo.get("stargazers_count", 0),
                 "description": repo.get("description", ""),
@@ -67,131 +94,180 @@ def fetch_top_repos(language="python", limit=5):
     return formatted_repos[:limit]
 
 
-def fetch_new_trending_repos(language="python", limit=5):
-    """Get repos created in the last 30 days that are gaining traction"""
-    logger.info(f"Fetching new trending repos for {language}")
-    
-    # Look at last 30 days for new repos
+def tag_repos(repos, reason):
+    """Copies of `repos` tagged with the strategy that surfaced them; the API items stay as fetched"""
+    return [{**repo, "trending_reason": reason} for repo in repos]
+
+
+def new_trending_params(language="python", limit=5):
+    """Search params for repos created in the last 30 days"""
     thirty_days_ago = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-    
-    url = "https://api.github.com/search/repositories"
-    params = {
+    return {
         "q": f"language:{language} created:>{thirty_days_ago} stars:>10",
         "sort": "stars",
         "order": "desc",
         "per_page": limit
     }
-    
-    repos = make_github_request(url, params)
-    
-    # Add trending reason
-    for repo in repos:
-        repo["trending_reason"] = "new_trending"
-    
-    return repos
 
 
-def fetch_recently_active_repos(language="python", limit=5):
-    """Get established repos that have been active recently"""
-    logger.info(f"Fetching recently active repos for {language}")
-    
-    # Look for repos updated in last 7 days with good star count
+def recently_active_params(language="python", limit=5):
+    """Search params for established repos pushed in the last 7 days"""
     last_week = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-    
-    url = "https://api.github.com/search/repositories"
-    params = {
+    return {
         "q": f"language:{language} pushed:>{last_week} stars:>100",
         "sort": "updated",
         "order": "desc",
         "per_page": limit
     }
-    
-    repos = make_github_request(url, params)
-    
-    # Add trending reason
-    for repo in repos:
-        repo["trending_reason"] = "recently_active"
-    
-    return repos
 
 
-def fetch_popular_repos(language="python", limit=5):
-    """Fallback: Get most popular repos (your original logic)"""
-    logger.info(f"Fetching popular repos for {language}")
-    
-    url = "https://api.github.com/search/repositories"
-    params = {
+def popular_params(language="python", limit=5):
+    """Search params for the most starred repos"""
+    return {
         "q": f"language:{language}",
         "sort": "stars",
         "order": "desc",
         "per_page": limit
     }
+
+
+def fetch_new_trending_repos(language="python", limit=5, raw=None):
+    """Get repos created in the last 30 days that are gaining traction"""
+    logger.info(f"Fetching new trending repos for {language}")
     
-    repos = make_github_request(url, params)
+    repos = make_github_request(SEARCH_URL, new_trending_params(language, limit))
+    if raw is not None:
+        raw.extend(repos)
+    return tag_repos(repos, "new_trending")
+
+
+def fetch_recently_active_repos(language="python", limit=5, raw=None):
+    """Get established repos that have been active recently"""
+    logger.info(f"Fetching recently active repos for {language}")
     
-    # Add trending reason
-    for repo in repos:
-        repo["trending_reason"] = "popular"
+    repos = make_github_request(SEARCH_URL, recently_active_params(language, limit))
+    if raw is not None:
+        raw.extend(repos)
+    return tag_repos(repos, "recently_active")
+
+
+def fetch_popular_repos(language="python", limit=5, raw=None):
+    """Fallback: Get most popular repos (your original logic)"""
+    logger.info(f"Fetching popular repos for {language}")
     
-    return repos
+    repos = make_github_request(SEARCH_URL, popular_params(language, limit))
+    if raw is not None:
+        raw.extend(repos)
+    return tag_repos(repos, "popular")
+
+
+def is_rate_limited(response):
+    """Primary or secondary rate limit, as opposed to a permissions 403"""
+    return (response.headers.get("X-RateLimit-Remaining") == "0"
+            or "Retry-After" in response.headers
+            or "rate limit" in response.text.lower())
+
+
+def rate_limited_response(response):
+    """A 403 / 429 GitHub sent because of a rate limit"""
+    return response.status_code in (403, 429) and is_rate_limited(response)
+
+
+def rate_limit_wait(response, attempt):
+    """Seconds until GitHub will accept requests again"""
+    if "Retry-After" in response.headers:
+        return backoff_delay(attempt, response.headers["Retry-After"])
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        resource = response.headers.get("X-RateLimit-Resource", "core")
+        return rate_limiter.seconds_until_reset(resource) + 1
+    return backoff_delay(attempt, cap=60)
+
+
+def check_github_response(response, attempt, max_retries=3, cache_key=None):
+    """Interpret a GitHub search response.
+
+    Works for both ``requests`` and ``httpx`` responses. Returns a tuple of
+    ``(items, wait_seconds)``: ``items`` is a list when the call is finished
+    (successfully or not) and ``None`` when the caller should sleep
+    ``wait_seconds`` and retry. With ``cache_key``, 200s are stored in
+    ``http_cache`` and 304s are answered from it. Rate-limit headers feed
+    ``rate_limiter``; retries wait out Retry-After or a jittered backoff.
+    """
+    # Keep the shared budget in step with what GitHub reports
+    budget = rate_limiter.update(response.headers)
+    if budget:
+        logger.info(f"GitHub API rate limit: {budget[1]} {budget[0]} requests remaining")
+    
+    # Handle different response codes
+    if response.status_code == 200:
+        data = response.json()
+        if cache_key is not None:
+            http_cache.store(cache_key, response.headers, response.text)
+        return data.get("items", []), 0
+    
+    elif response.status_code == 304 and cache_key is not None:
+        data = http_cache.revalidated(cache_key, response.headers)
+        if data is None:
+            logger.error("GitHub API returned 304 for a response that is no longer cached")
+            return [], 0
+        return data.get("items", []), 0
+    
+    elif rate_limited_response(response):
+        logger.error("Rate limit exceeded")
+        if attempt < max_retries - 1:
+            return None, rate_limit_wait(response, attempt)
+        return [], 0
+    
+    elif response.status_code == 403:
+        logger.error(f"GitHub API forbidden: {response.text}")
+        return [], 0
+    
+    elif response.status_code == 422:
+        logger.error(f"GitHub API validation failed: {response.text}")
+        return [], 0
+    
+    else:
+        logger.error(f"GitHub API error: {response.status_code} - {response.text}")
+        if attempt < max_retries - 1:
+            return None, backoff_delay(attempt, response.headers.get("Retry-After"))
+        return [], 0
 
 
 def make_github_request(url, params, max_retries=3):
     """Make GitHub API request with proper error handling and rate limiting"""
     
+    cache_key = http_cache.key(url, params)
+    cached = http_cache.fresh(cache_key)
+    if cached is not None:
+        return cached.get("items", [])
+    
+    resource = rate_limiter.resource_for(url)
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, headers=HEADERS, params=params, timeout=30)
-            
-            # Check rate limits
-            if 'X-RateLimit-Remaining' in response.headers:
-                remaining = int(response.headers['X-RateLimit-Remaining'])
-                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                
-                logger.info(f"GitHub API rate limit: {remaining} requests remaining")
-                
-                if remaining < 5:
-                    wait_time = max(0, reset_time - int(time.time())) + 5
-                    logger.warning(f"Rate limit low. Waiting {wait_time} seconds...")
-                    time.sleep(wait_time)
+            rate_limiter.acquire(resource)
+            headers = {**HEADERS, **http_cache.validators(cache_key)}
+            response = requests.get(url, headers=headers, params=params, timeout=30, hooks=HOOKS)
+            items, wait_time = check_github_response(response, attempt, max_retries, cache_key)
             
-            # Handle different response codes
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("items", [])
-            
-            elif response.status_code == 403:
-                if 'rate limit' in response.text.lower():
-                    logger.error("Rate limit exceeded")
-                    if attempt < max_retries - 1:
-                        time.sleep(60)  # Wait 1 minute before retry
-                        continue
-                else:
-                    logger.error(f"GitHub API forbidden: {response.text}")
-                return []
-            
-            elif response.status_code == 422:
-                logger.error(f"GitHub API validation failed: {response.text}")
-                return []
-            
-            else:
-                logger.error(f"GitHub API error: {response.status_code} - {response.text}")
-                if attempt < max_retries - 1:
-                    time.sleep(5)  # Wait 5 seconds before retry
-                    continue
-                return []
+            if wait_time:
+                if rate_limited_response(response):  # server-error backoffs aren't rate-limit waits
+                    observe_rate_limit_wait(resource, wait_time)
+                time.sleep(wait_time)
+            if items is None:
+                continue
+            return items
                 
         except requests.exceptions.Timeout:
             logger.error(f"GitHub API timeout (attempt {attempt + 1}/{max_retries})")
             if attempt < max_retries - 1:
-                time.sleep(5)
+                time.sleep(backoff_delay(attempt))
                 continue
             return []
             
         except requests.exceptions.RequestException as e:
             logger.error(f"GitHub API request failed: {str(e)}")
             if attempt < max_retries - 1:
-                time.sleep(5)
+                time.sleep(backoff_delay(attempt))
                 continue
             return []
     
@@ -221,7 +297,6 @@ def fetch_trending_by_timeframe(language="python", timeframe="week", limit=5):
     days = timeframe_days.get(timeframe, 7)
     date_threshold = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
     
-    url = "https://api.github.com/search/repositories"
     params = {
         "q": f"language:{language} created:>{date_threshold}",
         "sort": "stars",
@@ -229,12 +304,13 @@ def fetch_trending_by_timeframe(language="python", timeframe="week", limit=5):
         "per_page": limit
     }
     
-    repos = make_github_request(url, params)
+    repos = make_github_request(SEARCH_URL, params)
     
     formatted_repos = []
     for repo in repos:
         formatted_repos.append({
             "name": repo.get("full_name"),
+            "full_name": repo.get("full_name"),
             "url": repo.get("html_url"),
             "stars": repo.get("stargazers_count", 0),
             "description": repo.get("description", ""),
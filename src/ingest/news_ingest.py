@@ -2,47 +2,162 @@
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
+from config import NEWS_MAX_PAGES
+from transform.topics import topic_matcher
 from utils.logger import get_logger
+from utils.telemetry import requests_hook, stage
 
 load_dotenv()
 logger = get_logger(__name__)
 
+NEWSDATA_API_URL = os.getenv("NEWSDATA_API_URL", "https://newsdata.io/api/1")
+NEWS_URL = f"{NEWSDATA_API_URL}/news"
+NEWS_PARAMS = {"category": "technology", "language": "en"}
+
+# Name of the persisted high-water mark (see storage/cursors.py)
+NEWS_CURSOR = "newsdata"
+
+_session = None
+
+def news_session():
+    """Keep-alive session reused by every NewsData call of the process"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=10)
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+        _session.hooks["response"].append(requests_hook("newsdata"))
+    return _session
+
+def news_headers(api_key):
+    """The key goes in a header, so it never ends up in URLs, logs or proxies"""
+    return {"X-ACCESS-KEY": api_key or ""}
+
+@stage("fetch.news")
 def fetch_tech_news(api_key, limit=5):
-    url = f"https://newsdata.io/api/1/news?apikey={api_key}&category=technology&language=en"
     try:
-        response = requests.get(url)
+        response = news_session().get(NEWS_URL, params=NEWS_PARAMS, headers=news_headers(api_key), timeout=30)
         data = response.json()
-        articles = data.get("results", [])[:limit * 2]  # fetch more and filter
-
-        tech_keywords = [
-            "ai", "machine learning", "nvidia", "intel", "microsoft", "google",
-            "meta", "apple", "iphone", "android", "chip", "cpu", "gpu",
-            "software", "cloud", "developer", "devops", "openai", "quantum",
-            "processor", "framework", "llama", "transformer", "coding", "chatgpt",
-            "artificial intelligence", "blockchain", "cybersecurity"
-        ]
-
-        news = []
-        for item in articles:
-            title = (item.get("title") or "").lower()
-            description = (item.get("description") or "").lower()
-            if not description:
-                continue
-
-            if any(keyword in title or keyword in description for keyword in tech_keywords):
-                news.append({
-                    "title": item.get("title", ""),
-                    "link": item.get("link", ""),
-                    "description": item.get("description", ""),
-                    "pubDate": item.get("pubDate", "")
-                })
-            if len(news) >= limit:
-                break
-
+        news = filter_tech_articles(data.get("results", []), limit)
         logger.info(f"Fetched {len(news)} tech news articles.")
         return news
 
     except Exception as e:
         logger.error(f"Error fetching tech news: {e}")
         return []
+
+def unseen_articles(results, cursor):
+    """Split a newest-first page at the high-water mark.
+
+    Returns ``(unseen, reached_known)``; ``reached_known`` means older pages
+    hold nothing new, so paging can stop.
+    """
+    if not cursor:
+        return list(results), False
+    unseen = []
+    for item in results:
+        published = item.get("pubDate") or ""
+        if published < cursor["published_at"]:
+            return unseen, True
+        if published == cursor["published_at"] and item.get("article_id") in cursor["ids"]:
+            continue  # same timestamp as the mark; others at it may still be new
+        unseen.append(item)
+    return unseen, False
+
+def advance_cursor(cursor, results):
+    """High-water mark once `results` have been ingested: newest pubDate and the ids at it"""
+    if not results:
+        return cursor
+    newest = max(item.get("pubDate") or "" for item in results)
+    if cursor and cursor["published_at"] > newest:
+        return cursor
+    ids = {item.get("article_id") for item in results if (item.get("pubDate") or "") == newest}
+    if cursor and cursor["published_at"] == newest:
+        ids |= set(cursor["ids"])
+    return {"published_at": newest, "ids": sorted(ids)}
+
+class NewsPager:
+    """Paging state of one incremental NewsData fetch, shared by fetch_new_tech_news
+    and its async twin so they only differ in how a page is requested.
+
+    Feed each page's JSON body to add() until `done`, then take result().
+    """
+
+    def __init__(self, cursor=None, max_pages=NEWS_MAX_PAGES):
+        self.cursor = cursor
+        self.max_pages = max_pages
+        self.pages = 0
+        self.page = None  # NewsData's nextPage token
+        self.unseen = []
+        self.done = max_pages <= 0
+
+    def params(self):
+        return {**NEWS_PARAMS, "page": self.page} if self.page else NEWS_PARAMS
+
+    def add(self, data):
+        fresh, reached_known = unseen_articles(data.get("results", []), self.cursor)
+        self.unseen.extend(fresh)
+        self.page = data.get("nextPage")
+        self.pages += 1
+        if reached_known or not self.page:
+            self.done = True
+        elif self.pages >= self.max_pages:
+            self.done = True
+            if self.cursor:
+                logger.warning(f"Stopped after {self.max_pages} news pages before reaching known articles")
+
+    def result(self, raw=None):
+        """``(tech articles, new cursor)`` once paging is done; every unseen article,
+        as NewsData returned it, is also appended to `raw` when given (for the archive)"""
+        if raw is not None:
+            raw.extend(self.unseen)
+        news = filter_tech_articles(self.unseen, limit=None)
+        logger.info(f"Fetched {len(self.unseen)} unseen articles, {len(news)} tech news articles.")
+        return news, advance_cursor(self.cursor, self.unseen)
+
+@stage("fetch.news")
+def fetch_new_tech_news(api_key, cursor=None, max_pages=NEWS_MAX_PAGES, raw=None):
+    """Page back from the newest article until reaching `cursor`.
+
+    Returns ``(tech articles, new cursor)``. On error nothing is returned and
+    the cursor stays put, so the next run retries the same window. The
+    unfiltered articles go to `raw` when given, see NewsPager.result().
+    """
+    session = news_session()
+    pager = NewsPager(cursor, max_pages)
+    try:
+        while not pager.done:
+            response = session.get(NEWS_URL, params=pager.params(), headers=news_headers(api_key), timeout=30)
+            response.raise_for_status()
+            pager.add(response.json())
+    except Exception as e:
+        logger.error(f"Error fetching tech news: {e}")
+        return [], cursor
+    return pager.result(raw)
+
+def filter_tech_articles(results, limit=5):
+    """Tech articles among `results`, tagged with their topics; `limit=None` keeps every match"""
+    articles = results[:limit * 2] if limit else results  # fetch more and filter
+
+    news = []
+    for item in articles:
+        if not item.get("description"):
+            continue
+
+        topics = topic_matcher.match(item.get("title"), item.get("description"))
+        if topics:
+            news.append({
+                "title": item.get("title", ""),
+                "link": item.get("link", ""),
+                "description": item.get("description", ""),
+                "pubDate": item.get("pubDate", ""),
+                "source": item.get("source_id", ""),
+                "topics": topics
+            })
+        if limit and len(news) >= limit:
+            break
+
+    return news
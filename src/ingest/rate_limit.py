@@ -0,0 +1,147 @@
+# src/ingest/rate_limit.py
+
+"""Client-side pacing for the GitHub API.
+
+GitHub meters each resource (``search``, ``core``, ...) separately and reports
+the budget on every response through ``X-RateLimit-*`` headers. A TokenBucket
+per resource mirrors that budget: requests may burst up to ``burst`` at once,
+and after that tokens refill at the rate that spreads the remaining quota
+evenly until the reset, so a cycle slows down gradually instead of hitting
+403 at the end of a window.
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+from utils.telemetry import observe_rate_limit_wait
+
+
+def backoff_delay(attempt, retry_after=None, base=1.0, cap=60.0):
+    """Seconds to wait before retry `attempt` (0-based): Retry-After if given, else full jitter"""
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass  # HTTP-date form; GitHub sends seconds
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class TokenBucket:
+    """Budget for one rate-limit resource, corrected by the server's headers"""
+
+    def __init__(self, limit, window, burst, clock=time.time):
+        self.limit = limit
+        self.window = window
+        self.burst = burst
+        self.clock = clock
+        now = clock()
+        self.remaining = limit
+        self.reset_at = now + window
+        self.tokens = float(burst)
+        self.updated = now
+        self.requests = 0
+        self.waited = 0.0
+
+    def _refill(self, now):
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = now + self.window
+        rate = self.remaining / max(self.reset_at - now, 1.0)
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        return rate
+
+    def try_acquire(self):
+        """Take a request slot and return 0, or return the seconds to wait before asking again"""
+        now = self.clock()
+        rate = self._refill(now)
+        if self.remaining < 1:
+            return self.reset_at - now + 1
+        if self.tokens < 1:
+            return (1 - self.tokens) / rate
+        self.tokens -= 1
+        self.remaining -= 1
+        self.requests += 1
+        return 0
+
+    def update(self, limit, remaining, reset_at):
+        """Adopt the budget reported by a response"""
+        if reset_at > self.reset_at:
+            # A new window started on the server; its count is authoritative
+            self.remaining = remaining
+        else:
+            # Same window: responses race with requests still in flight
+            self.remaining = min(self.remaining, remaining)
+        self.limit = limit
+        self.reset_at = reset_at
+
+
+class GitHubRateLimiter:
+    """One bucket per GitHub resource, shared by every request of the process"""
+
+    # Authenticated defaults; the first response's headers correct them
+    DEFAULTS = {
+        "search": dict(limit=30, window=60, burst=10),
+        "core": dict(limit=5000, window=3600, burst=20),
+    }
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.buckets = {name: TokenBucket(clock=clock, **spec) for name, spec in self.DEFAULTS.items()}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def resource_for(url):
+        return "search" if "/search/" in url else "core"
+
+    def _bucket(self, resource):
+        if resource not in self.buckets:
+            self.buckets[resource] = TokenBucket(clock=self.clock, **self.DEFAULTS["core"])
+        return self.buckets[resource]
+
+    def _try_acquire(self, resource):
+        with self._lock:
+            return self._bucket(resource).try_acquire()
+
+    def _record_wait(self, resource, seconds):
+        with self._lock:
+            self._bucket(resource).waited += seconds
+        observe_rate_limit_wait(resource, seconds)
+
+    def acquire(self, resource):
+        """Block the calling thread until a `resource` request may be sent"""
+        while (delay := self._try_acquire(resource)) > 0:
+            self._record_wait(resource, delay)
+            time.sleep(delay)
+
+    async def acquire_async(self, resource):
+        """Wait, without blocking the event loop, until a `resource` request may be sent"""
+        while (delay := self._try_acquire(resource)) > 0:
+            self._record_wait(resource, delay)
+            await asyncio.sleep(delay)
+
+    def update(self, headers):
+        """Feed a response's X-RateLimit-* headers into the matching bucket"""
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_at = int(headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return None
+        resource = headers.get("X-RateLimit-Resource", "core")
+        with self._lock:
+            self._bucket(resource).update(limit, remaining, reset_at)
+        return resource, remaining
+
+    def seconds_until_reset(self, resource):
+        with self._lock:
+            return max(0.0, self._bucket(resource).reset_at - self.clock())
+
+    def stats(self):
+        """Requests sent and seconds spent waiting, per resource"""
+        with self._lock:
+            return {name: {"requests": bucket.requests, "remaining": bucket.remaining,
+                           "waited": round(bucket.waited, 3)}
+                    for name, bucket in self.buckets.items()}
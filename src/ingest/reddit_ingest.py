@@ -2,37 +2,80 @@
 
 import os
 import praw
+import requests
 from dotenv import load_dotenv
+from config import REDDIT_POSTS_PER_SUBREDDIT, REDDIT_SUBREDDITS, REDDIT_TIME_FILTER
 from utils.logger import get_logger
+from utils.telemetry import requests_hook, stage
 
 load_dotenv()
 logger = get_logger(__name__)
 
-# Initialize Reddit client
-reddit = praw.Reddit(
-    client_id=os.getenv("REDDIT_CLIENT_ID"),
-    client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-    user_agent=os.getenv("REDDIT_USER_AGENT")
-)
+# Subreddits per combined r/a+b+c listing; keeps the request path a sane length
+COMBINED_LISTING_SIZE = 20
 
+# Overridable like GITHUB_API_URL and NEWSDATA_API_URL, e.g. to point at benchmarks/mock_server.py
+REDDIT_OAUTH_URL = os.getenv("REDDIT_OAUTH_URL", "https://oauth.reddit.com")
+REDDIT_URL = os.getenv("REDDIT_URL", "https://www.reddit.com")
+
+_reddit = None
+
+def get_reddit():
+    """Reddit client, created on first use so importing needs no credentials"""
+    global _reddit
+    if _reddit is None:
+        session = requests.Session()  # praw's HTTP goes through it, so its calls are timed too
+        session.hooks["response"].append(requests_hook("reddit"))
+        _reddit = praw.Reddit(
+            client_id=os.getenv("REDDIT_CLIENT_ID"),
+            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
+            user_agent=os.getenv("REDDIT_USER_AGENT"),
+            oauth_url=REDDIT_OAUTH_URL,
+            reddit_url=REDDIT_URL,
+            requestor_kwargs={"session": session},
+        )
+    return _reddit
+
+def post_to_dict(post):
+    return {
+        "id": post.id,
+        "title": post.title,
+        "score": post.score,
+        "url": post.url,
+        "created_utc": post.created_utc,
+        "num_comments": post.num_comments,
+        "author": str(post.author),
+        # From the listing itself, so it is right for combined r/a+b listings too
+        "subreddit": post.subreddit.display_name
+    }
+
+@stage("fetch.reddit")
 def fetch_top_posts(subreddit_name="programming", limit=10, time_filter="day"):
     logger.info(f"Fetching top {limit} posts from r/{subreddit_name}")
     try:
-        subreddit = reddit.subreddit(subreddit_name)
-        posts = []
-        for post in subreddit.top(limit=limit, time_filter=time_filter):
-            posts.append({
-                "id": post.id,
-                "title": post.title,
-                "score": post.score,
-                "url": post.url,
-                "created_utc": post.created_utc,
-                "num_comments": post.num_comments,
-                "author": str(post.author),
-                "subreddit": subreddit_name
-            })
+        subreddit = get_reddit().subreddit(subreddit_name)
+        posts = [post_to_dict(post) for post in subreddit.top(limit=limit, time_filter=time_filter)]
         logger.info(f"Fetched {len(posts)} posts from r/{subreddit_name}")
         return posts
     except Exception as e:
         logger.error(f"Error fetching posts from r/{subreddit_name}: {e}")
         return []
+
+def stream_top_posts(subreddits=REDDIT_SUBREDDITS, per_subreddit=REDDIT_POSTS_PER_SUBREDDIT,
+                     time_filter=REDDIT_TIME_FILTER):
+    """Yield top posts across `subreddits` as the listings page in.
+
+    Subreddits are fetched through combined r/a+b+c listings, one per
+    COMBINED_LISTING_SIZE names, each asked for `per_subreddit` posts per
+    member (ranked across the group). A failing group is logged and skipped.
+    """
+    for start in range(0, len(subreddits), COMBINED_LISTING_SIZE):
+        group = subreddits[start:start + COMBINED_LISTING_SIZE]
+        combined = "+".join(group)
+        logger.info(f"Streaming top posts from r/{combined}")
+        try:
+            listing = get_reddit().subreddit(combined).top(limit=per_subreddit * len(group), time_filter=time_filter)
+            for post in listing:
+                yield post_to_dict(post)
+        except Exception as e:
+            logger.error(f"Error fetching posts from r/{combined}: {e}")
@@ -1,10 +1,14 @@
 # src/news.py
 
 import os
-from ingest.news_ingest import fetch_tech_news
-from transform.news_transform import summarize_text, get_sentiment_label
+import sys
+from ingest.news_ingest import NEWS_CURSOR, fetch_new_tech_news
+from transform.news_transform import enrich_texts
+from storage.archive import archive_records
 from storage.news_storage import save_news_to_db
+from storage.cursors import load_cursor, save_cursor
 from utils.logger import get_logger
+from utils.profiling import profiled
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -14,31 +18,45 @@ API_KEY = os.getenv("NEWSDATA_API_KEY")
 BASE_URL = "https://newsdata.io/api/1/news"
 
 def main():
-    articles = fetch_tech_news(api_key=API_KEY, limit=5)
+    cursor = load_cursor(NEWS_CURSOR)
+    raw = []
+    articles, new_cursor = fetch_new_tech_news(api_key=API_KEY, cursor=cursor, raw=raw)
 
+    # Archive every unseen article as fetched, before the topic filter
+    if raw:
+        archive_records("news", raw)
 
     if not articles:
-        logger.warning("No news articles fetched.")
+        logger.info("No new tech articles since the last run.")
+        if new_cursor != cursor:
+            save_cursor(NEWS_CURSOR, new_cursor)
         return
 
     results = []
-    for article in articles:
-        summary = summarize_text(article["description"])
-        sentiment = get_sentiment_label(article["description"])
+    enriched = enrich_texts([article["description"] for article in articles])
+    for article, (summary, sentiment) in zip(articles, enriched):
         results.append({
             "title": article["title"],
             "summary": summary,
             "sentiment": sentiment,
-            "url": article["link"]
+            "url": article["link"],
+            "source": article.get("source", ""),
+            "published_at": article.get("pubDate", ""),
+            "topics": article.get("topics", [])
         })
 
+    # Articles without a link can't be stored; the cursor still moves past them
+    results = [item for item in results if item["url"]]
     for item in results:
         print(f"\n📌 {item['title']}")
         print(f"🧠 {item['summary']}")
         print(f"❤️ Sentiment: {item['sentiment']}")
         print(f"🔗 {item['url']}\n")
 
-    save_news_to_db(results)
+    # A failed write keeps the old mark so the next run retries these
+    if not results or save_news_to_db(results):
+        save_cursor(NEWS_CURSOR, new_cursor)
 
 if __name__ == "__main__":
-    main()
+    with profiled("news", "--profile" in sys.argv[1:]):
+        main()
@@ -3,7 +3,7 @@
 import os
 from dotenv import load_dotenv
 from ingest.reddit_ingest import fetch_top_posts
-from storage.reddit_storage import save_posts_to_json
+from storage.archive import archive_records
 from transform.reddit_transform import normalize_posts
 
 load_dotenv()
@@ -19,8 +19,8 @@ def main():
     for post in normalized_posts:
         print(f"{post['title']} - 👍 {post['score']}")
 
-    # Step 4: Save to JSON
-    save_posts_to_json(normalized_posts)
+    # Step 4: Archive the raw posts
+    archive_records("reddit", raw_posts)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,272 @@
+# src/storage/archive.py
+
+"""Columnar archive of every raw record ingestion fetched.
+
+Records land in Parquet under ARCHIVE_DIR/source=<source>/date=<YYYY-MM-DD>/,
+one file per ingestion cycle and source, written through a temporary
+dot-file and renamed into place, so readers never see a partial file. Each
+row keeps the record as JSON (`payload`) next to a few promoted columns that
+readers can filter on without decoding it:
+
+    key       full_name / post id / article link
+    title     repo name / post title / headline
+    category  language / subreddit / news source
+    metric    stars / score (null for news)
+
+compact_archive() merges each closed day's files into one in fetch order, and
+read_archive() / scan_archive() memory-map the files and push partition and
+column predicates down into pyarrow, so history is queried without touching
+the OLTP database.
+
+    read_archive("github", start=date(2025, 6, 1), columns=["key", "metric", "fetched_at"],
+                 where=ds.field("category") == "Rust")
+"""
+
+import json
+import os
+import uuid
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import fs
+
+from config import ARCHIVE_DIR
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ARCHIVE_SCHEMA = pa.schema([
+    ("fetched_at", pa.timestamp("us")),
+    ("key", pa.string()),
+    ("title", pa.string()),
+    ("category", pa.string()),
+    ("metric", pa.int64()),
+    ("payload", pa.string()),
+])
+PARTITION_SCHEMA = pa.schema([("source", pa.string()), ("date", pa.string())])
+PARTITIONING = ds.partitioning(PARTITION_SCHEMA, flavor="hive")
+DATASET_SCHEMA = pa.unify_schemas([ARCHIVE_SCHEMA, PARTITION_SCHEMA])
+
+ROW_GROUP_SIZE = 64_000
+WRITE_BUFFER = 1_000  # records held before they are flushed as a row group
+
+# source -> (key, title, category, metric) of a raw record
+PROMOTED = {
+    "github": lambda r: (r.get("full_name") or r.get("name"), r.get("name"), r.get("language"),
+                         r.get("stargazers_count", r.get("stars"))),
+    "reddit": lambda r: (r.get("id"), r.get("title"), r.get("subreddit"), r.get("score")),
+    "news": lambda r: (r.get("link") or r.get("url"), r.get("title"), r.get("source_id") or r.get("source"), None),
+}
+
+
+def partition_dir(source, day, root=ARCHIVE_DIR):
+    return os.path.join(root, f"source={source}", f"date={day.isoformat()}")
+
+
+class ArchiveWriter:
+    """Appends the raw records of one ingestion cycle of `source` to a new Parquet file.
+
+    Records are buffered and flushed in row groups, so memory stays bounded
+    however many stream through; the file appears on close(). The archive is
+    a side copy: a write error is logged and ends archiving for the cycle
+    instead of failing ingestion. A falsy `root` makes every call a no-op.
+
+        with ArchiveWriter("reddit") as archive:
+            save_post_stream(archive.tee(stream_top_posts()))
+    """
+
+    def __init__(self, source, fetched_at=None, root=ARCHIVE_DIR):
+        self.source = source
+        self.fetched_at = fetched_at or datetime.utcnow()
+        self.root = root
+        self.promote = PROMOTED[source]
+        self.rows = 0
+        self.path = None
+        self._buffer = []
+        self._writer = None
+        self._tmp_path = None
+
+    def write(self, records):
+        if not self.root:
+            return
+        for record in records:
+            self._buffer.append(record)
+            if len(self._buffer) >= WRITE_BUFFER:
+                self._flush()
+
+    def tee(self, records):
+        """Yield `records` unchanged, archiving each one on the way"""
+        for record in records:
+            self.write((record,))
+            yield record
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        try:
+            self._write_buffer()
+        except Exception as e:
+            logger.error(f"Failed to archive {self.source} records, skipping the rest of this cycle: {e}")
+            self.abort()
+            self.root = None
+
+    def _write_buffer(self):
+        columns = list(zip(*(self.promote(record) for record in self._buffer)))
+        table = pa.table({
+            "fetched_at": pa.array([self.fetched_at] * len(self._buffer), pa.timestamp("us")),
+            "key": pa.array([None if key is None else str(key) for key in columns[0]], pa.string()),
+            "title": pa.array(columns[1], pa.string()),
+            "category": pa.array(columns[2], pa.string()),
+            "metric": pa.array(columns[3], pa.int64()),
+            "payload": pa.array([json.dumps(record, default=str) for record in self._buffer], pa.string()),
+        }, schema=ARCHIVE_SCHEMA)
+        if self._writer is None:
+            directory = partition_dir(self.source, self.fetched_at.date(), self.root)
+            os.makedirs(directory, exist_ok=True)
+            name = f"part-{self.fetched_at:%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+            self.path = os.path.join(directory, name)
+            self._tmp_path = os.path.join(directory, "." + name)
+            self._writer = pq.ParquetWriter(self._tmp_path, ARCHIVE_SCHEMA, compression="zstd")
+        self._writer.write_table(table, row_group_size=ROW_GROUP_SIZE)
+        self.rows += len(self._buffer)
+        self._buffer = []
+
+    def close(self):
+        """Publish the file (if anything was written) and return its path"""
+        if not self.root:
+            return None
+        self._flush()
+        if self._writer is None:
+            return None
+        try:
+            self._writer.close()
+            self._writer = None
+            os.replace(self._tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Failed to archive {self.source} records: {e}")
+            self.abort()
+            return None
+        logger.info(f"Archived {self.rows} {self.source} records to {self.path}")
+        return self.path
+
+    def abort(self):
+        """Drop whatever was written; the cycle leaves no file behind"""
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            finally:
+                self._writer = None
+        if self._tmp_path and os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+        self._buffer = []
+        self.path = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Keep what was fetched even if saving it failed: that's what a replay needs
+        self.close()
+
+
+def archive_records(source, records, fetched_at=None, root=ARCHIVE_DIR):
+    """Archive one cycle's raw `records` of `source`; returns the file path (None if nothing written)"""
+    with ArchiveWriter(source, fetched_at, root) as archive:
+        archive.write(records)
+    return archive.path
+
+
+def _drop_repeats(table):
+    """Rows of a (fetched_at, key)-sorted table minus exact repeats of the row before"""
+    if table.num_rows < 2:
+        return table
+    n = table.num_rows
+    key, fetched_at = table["key"], table["fetched_at"]
+    repeat = pc.and_(pc.equal(key.slice(1), key.slice(0, n - 1)),
+                     pc.equal(fetched_at.slice(1), fetched_at.slice(0, n - 1)))
+    keep = pa.concat_arrays([pa.array([True]), pc.invert(pc.fill_null(repeat, False)).combine_chunks()])
+    return table.filter(keep)
+
+
+def compact_archive(root=ARCHIVE_DIR, before=None, min_files=2):
+    """Merge each partition dated before `before` (default today) holding >= `min_files` files into one.
+
+    The merged file is sorted by (fetched_at, key), so it still reads in
+    fetch order (flows.replay depends on it) while its row groups stay tight
+    on fetch time, and is renamed into place before its inputs are deleted;
+    rows an interrupted run left duplicated are dropped by the next one.
+    Returns the number of partitions compacted.
+    """
+    if not root or not os.path.isdir(root):
+        return 0
+    before = (before or datetime.utcnow().date()).isoformat()  # today's partition is still being written
+    compacted = 0
+    for source_dir in sorted(os.scandir(root), key=lambda entry: entry.name):
+        if not (source_dir.is_dir() and source_dir.name.startswith("source=")):
+            continue
+        for date_dir in sorted(os.scandir(source_dir.path), key=lambda entry: entry.name):
+            if not (date_dir.is_dir() and date_dir.name.startswith("date=")) or date_dir.name[5:] >= before:
+                continue
+            files = sorted(entry.path for entry in os.scandir(date_dir.path)
+                           if entry.name.endswith(".parquet") and not entry.name.startswith("."))
+            if len(files) < min_files:
+                continue
+
+            table = pa.concat_tables(pq.read_table(path, memory_map=True, schema=ARCHIVE_SCHEMA) for path in files)
+            table = _drop_repeats(table.sort_by([("fetched_at", "ascending"), ("key", "ascending")]))
+            name = f"compacted-{uuid.uuid4().hex[:8]}.parquet"
+            tmp_path = os.path.join(date_dir.path, "." + name)
+            pq.write_table(table, tmp_path, row_group_size=ROW_GROUP_SIZE, compression="zstd")
+            os.replace(tmp_path, os.path.join(date_dir.path, name))
+            for path in files:
+                os.remove(path)
+            compacted += 1
+            logger.info(f"Compacted {len(files)} files ({table.num_rows} rows) in {date_dir.path}")
+    return compacted
+
+
+def archive_filter(source=None, start=None, end=None, where=None):
+    """Dataset filter for a source, an inclusive date range and any extra column predicate"""
+    conditions = []
+    if source:
+        conditions.append(ds.field("source") == source)
+    if start:
+        conditions.append(ds.field("date") >= start.isoformat())
+    if end:
+        conditions.append(ds.field("date") <= end.isoformat())
+    if where is not None:
+        conditions.append(where)
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def archive_dataset(root=ARCHIVE_DIR):
+    """The whole archive as one memory-mapped pyarrow dataset (None if nothing is archived yet)"""
+    if not root or not os.path.isdir(root):
+        return None
+    return ds.dataset(root, schema=DATASET_SCHEMA, format="parquet", partitioning=PARTITIONING,
+                      filesystem=fs.LocalFileSystem(use_mmap=True))
+
+
+def scan_archive(source=None, start=None, end=None, columns=None, where=None, batch_size=10_000,
+                 root=ARCHIVE_DIR):
+    """Stream matching rows as record batches; only partitions and row groups that can match are read"""
+    dataset = archive_dataset(root)
+    if dataset is None:
+        return
+    yield from dataset.to_batches(columns=columns, filter=archive_filter(source, start, end, where),
+                                  batch_size=batch_size)
+
+
+def read_archive(source=None, start=None, end=None, columns=None, where=None, root=ARCHIVE_DIR):
+    """Matching rows as one pyarrow Table (see scan_archive)"""
+    dataset = archive_dataset(root)
+    if dataset is None:
+        schema = DATASET_SCHEMA if columns is None else pa.schema([DATASET_SCHEMA.field(c) for c in columns])
+        return schema.empty_table()
+    return dataset.to_table(columns=columns, filter=archive_filter(source, start, end, where))
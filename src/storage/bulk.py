@@ -0,0 +1,51 @@
+# src/storage/bulk.py
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from config import UPSERT_BATCH_SIZE
+from db.database import engine
+
+# Dialect-specific INSERT constructs that support ON CONFLICT
+INSERT_BY_DIALECT = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def upsert_rows(table, rows, key, batch_size=None, bind=None, after_batch=None, before_batch=None):
+    """Insert rows in batches, updating the existing row when `key` already exists.
+
+    All rows must share the same columns. `after_batch(conn, batch)` runs inside
+    the same transaction after each batch, e.g. to append snapshot rows;
+    `before_batch(conn, batch)` runs just before it is written.
+    Returns the number of rows written.
+    """
+    if not rows:
+        return 0
+
+    bind = bind if bind is not None else engine
+    batch_size = batch_size or UPSERT_BATCH_SIZE
+
+    insert = INSERT_BY_DIALECT.get(bind.dialect.name)
+    if insert is None:
+        raise NotImplementedError(f"Bulk upsert is not supported on {bind.dialect.name}")
+
+    # A key may only appear once per statement (Postgres rejects it), last one wins
+    rows = list({row[key]: row for row in rows}.values())
+
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[key],
+        set_={column: stmt.excluded[column] for column in rows[0] if column != key},
+    )
+
+    with bind.begin() as conn:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            if before_batch is not None:
+                before_batch(conn, batch)
+            conn.execute(stmt, batch)
+            if after_batch is not None:
+                after_batch(conn, batch)
+
+    return len(rows)
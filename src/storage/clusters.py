@@ -0,0 +1,133 @@
+# src/storage/clusters.py
+
+"""Near-duplicate story clusters for Reddit posts and news articles.
+
+Runs as an after_batch hook of the post and news upserts. Each item's title
+is signed once (transform.near_dup) and re-signed only when it changes; its
+LSH buckets go to minhash_buckets, where an index lookup finds the stored
+items sharing one. The closest candidate at or above NEAR_DUP_THRESHOLD
+lends the item its cluster_id; otherwise the item starts a cluster under
+its own id. Older items are clustered first, so a story is named after its
+first appearance.
+"""
+
+from collections import defaultdict
+
+from sqlalchemy import bindparam, delete, insert, select, update
+
+from config import NEAR_DUP_THRESHOLD, UPSERT_BATCH_SIZE
+from db.database import engine
+from db.models import MinHashBucket, RedditPost, TechNews
+from transform.near_dup import band_buckets, from_bytes, minhash, similarity, to_bytes
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TABLES = {"reddit": RedditPost.__table__, "news": TechNews.__table__}
+
+
+def cluster_items(conn, source, items):
+    """Sign and cluster `items` (rows with id, title, minhash, cluster_id) of `source`"""
+    signed = []
+    for item in sorted(items, key=lambda item: item.id):
+        signature = minhash(item.title)
+        blob = to_bytes(signature) if signature is not None else None
+        if item.cluster_id is not None and blob == item.minhash:
+            continue  # title unchanged since it was clustered
+        signed.append((item.id, signature, blob))
+    if not signed:
+        return
+
+    buckets_of = {item_id: band_buckets(signature) for item_id, signature, _ in signed if signature is not None}
+    members = defaultdict(set)  # bucket -> item ids
+    wanted = {bucket for buckets in buckets_of.values() for bucket in buckets}
+    if wanted:
+        for bucket, item_id in conn.execute(
+            select(MinHashBucket.bucket, MinHashBucket.item_id)
+            .where(MinHashBucket.source == source, MinHashBucket.bucket.in_(wanted))
+        ):
+            members[bucket].add(item_id)
+
+    table = TABLES[source]
+    candidates = set().union(*members.values()) - set(buckets_of)
+    known = {}  # item id -> (signature, cluster_id)
+    if candidates:
+        for row in conn.execute(
+            select(table.c.id, table.c.minhash, table.c.cluster_id)
+            .where(table.c.id.in_(candidates), table.c.cluster_id.is_not(None))
+        ):
+            if row.minhash is not None:
+                known[row.id] = (from_bytes(row.minhash), row.cluster_id)
+
+    updates, new_buckets = [], []
+    for item_id, signature, blob in signed:
+        cluster_id = item_id
+        if signature is not None:
+            best = (NEAR_DUP_THRESHOLD, None)
+            for other in {other for bucket in buckets_of[item_id] for other in members.get(bucket, ())}:
+                if other != item_id and other in known:
+                    score = similarity(signature, known[other][0])
+                    # Closest wins; ties go to the oldest cluster
+                    if score > best[0] or (score == best[0] and (best[1] is None or known[other][1] < best[1])):
+                        best = (score, known[other][1])
+            if best[1] is not None:
+                cluster_id = best[1]
+            # Later items of the same batch can match this one
+            known[item_id] = (signature, cluster_id)
+            for bucket in buckets_of[item_id]:
+                members[bucket].add(item_id)
+                new_buckets.append({"source": source, "bucket": bucket, "item_id": item_id})
+        updates.append({"item": item_id, "signature": blob, "cluster": cluster_id})
+
+    ids = [update_["item"] for update_ in updates]
+    conn.execute(delete(MinHashBucket).where(MinHashBucket.source == source, MinHashBucket.item_id.in_(ids)))
+    if new_buckets:
+        conn.execute(insert(MinHashBucket), new_buckets)
+    conn.execute(
+        update(table).where(table.c.id == bindparam("item"))
+        .values(minhash=bindparam("signature"), cluster_id=bindparam("cluster")),
+        updates,
+    )
+
+
+def _select_items(table):
+    return select(table.c.id, table.c.title, table.c.minhash, table.c.cluster_id)
+
+
+def cluster_posts(conn, rows):
+    """after_batch hook: cluster the posts just written"""
+    table = TABLES["reddit"]
+    items = conn.execute(_select_items(table).where(table.c.post_id.in_([row["post_id"] for row in rows]))).all()
+    cluster_items(conn, "reddit", items)
+
+
+def cluster_news(conn, rows):
+    """after_batch hook: cluster the articles just written"""
+    table = TABLES["news"]
+    items = conn.execute(_select_items(table).where(table.c.url.in_([row["url"] for row in rows]))).all()
+    cluster_items(conn, "news", items)
+
+
+def cluster_existing(bind=None, batch_size=UPSERT_BATCH_SIZE):
+    """Cluster every stored post and article not clustered yet, oldest first; returns items scanned"""
+    bind = bind if bind is not None else engine
+    scanned = 0
+    for source, table in TABLES.items():
+        last_id = 0
+        while True:
+            with bind.begin() as conn:
+                items = conn.execute(
+                    _select_items(table).where(table.c.id > last_id, table.c.cluster_id.is_(None))
+                    .order_by(table.c.id).limit(batch_size)
+                ).all()
+                if not items:
+                    break
+                cluster_items(conn, source, items)
+            scanned += len(items)
+            last_id = items[-1].id
+    logger.info(f"Clustered {scanned} stored posts and articles.")
+    return scanned
+
+
+if __name__ == "__main__":
+    cluster_existing()
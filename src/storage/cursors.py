@@ -0,0 +1,31 @@
+# src/storage/cursors.py
+
+import json
+from datetime import datetime
+
+from db.database import engine
+from db.models import IngestCursor
+from storage.bulk import INSERT_BY_DIALECT
+
+
+def load_cursor(name, bind=None):
+    """The saved cursor for `name`, or None before its first run"""
+    bind = bind if bind is not None else engine
+    table = IngestCursor.__table__
+    with bind.connect() as conn:
+        value = conn.execute(table.select().with_only_columns(table.c.value).where(table.c.name == name)).scalar()
+    return json.loads(value) if value is not None else None
+
+
+def save_cursor(name, value, bind=None):
+    """Persist `value` (JSON-serializable) as the cursor for `name`"""
+    bind = bind if bind is not None else engine
+    table = IngestCursor.__table__
+    insert = INSERT_BY_DIALECT[bind.dialect.name]
+    stmt = insert(table).values(name=name, value=json.dumps(value), updated_at=datetime.utcnow())
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"value": stmt.excluded.value, "updated_at": stmt.excluded.updated_at},
+    )
+    with bind.begin() as conn:
+        conn.execute(stmt)
@@ -0,0 +1,35 @@
+# src/storage/events.py
+
+from datetime import datetime
+
+from db.database import engine
+from db.models import DataVersion
+from storage.bulk import INSERT_BY_DIALECT
+from utils.cache import panel_cache
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def publish_change(source, rows, bind=None):
+    """Announce a committed ingest for `source` to every dashboard process.
+
+    Bumps the source's row in data_versions (which dashboards watch, see
+    dashboard/live.py) and drops this process's cached panels for it.
+    """
+    bind = bind if bind is not None else engine
+    table = DataVersion.__table__
+    insert = INSERT_BY_DIALECT[bind.dialect.name]
+
+    stmt = insert(table).values(source=source, version=1, rows=rows, committed_at=datetime.utcnow())
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["source"],
+        set_={"version": table.c.version + 1, "rows": stmt.excluded.rows, "committed_at": stmt.excluded.committed_at},
+    )
+    try:
+        with bind.begin() as conn:
+            conn.execute(stmt)
+    except Exception as e:
+        # The data itself is committed; dashboards will still see it on their next manual refresh
+        logger.error(f"Failed to publish {source} change: {e}")
+    panel_cache.invalidate(source)
@@ -1,30 +1,58 @@
 # src/storage/github_storage.py
 
-from db.database import SessionLocal
-from db.models import GitHubRepo
+from sqlalchemy import insert, select
+
+from db.models import GitHubRepo, RepoStarSnapshot
+from storage.bulk import upsert_rows
+from storage.events import publish_change
+from storage.search import index_repos
+from storage.trending import update_trending_repos
 from utils.logger import get_logger
+from utils.telemetry import observe_rows, record_error, stage
 from datetime import datetime
 
 logger = get_logger(__name__)
 
-def save_github_to_db(repos):
-    session = SessionLocal()
+def repo_to_row(repo):
+    full_name = repo.get("full_name") or repo["name"]
+    return {
+        "full_name": full_name,
+        "slug": full_name.lower(),
+        "name": repo["name"],
+        "url": repo["url"],
+        "stars": repo["stars"],
+        "description": repo.get("description") or "",
+        "language": repo.get("language") or "",
+        "trending_reason": repo.get("trending_reason"),
+        "timestamp": repo.get("timestamp") or datetime.utcnow()
+    }
+
+def snapshot_stars(conn, rows):
+    """Append the star count just written for each repo in the batch"""
+    keys = [row["full_name"] for row in rows]
+    conn.execute(
+        insert(RepoStarSnapshot).from_select(
+            ["repo_id", "stars", "captured_at"],
+            select(GitHubRepo.id, GitHubRepo.stars, GitHubRepo.timestamp).where(GitHubRepo.full_name.in_(keys))
+        )
+    )
+
+def after_repo_batch(conn, rows):
+    snapshot_stars(conn, rows)
+    update_trending_repos(conn, rows)
+    index_repos(conn, rows)
+
+@stage("save.github")
+def save_github_to_db(repos, batch_size=None):
     try:
-        for repo in repos:
-            db_repo = GitHubRepo(
-                name=repo["name"],
-                url=repo["url"],
-                stars=repo["stars"],
-                description=repo.get("description", ""),
-                language=repo.get("language", ""),
-                timestamp=repo["timestamp"]
-            )
-            session.add(db_repo)
-        session.commit()
-        print(f"✅ Saved {len(repos)} GitHub repos to DB.")
+        rows = [repo_to_row(repo) for repo in repos]
+        written = upsert_rows(GitHubRepo.__table__, rows, "full_name", batch_size, after_batch=after_repo_batch)
+        observe_rows("github", written)
+        if written:
+            publish_change("github", written)
+        logger.info(f"Saved {written} GitHub repos to database.")
+        return written
     except Exception as e:
-        print(f"❌ Error saving GitHub repos: {e}")
-        session.rollback()
-    finally:
-        session.close()
-
+        record_error(e)
+        logger.error(f"Error saving GitHub repos: {e}")
+        return 0
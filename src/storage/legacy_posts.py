@@ -0,0 +1,93 @@
+# src/storage/legacy_posts.py
+
+"""Reddit rows saved before Reddit's post ids were stored.
+
+Migration 0002 gave them the placeholder key 'legacy-<row id>', which no
+ingested post carries. Saving a post first hands its key to the legacy row
+with the same url and title (Reddit titles can't be edited), so the upsert
+updates that row and its history instead of adding a second one.
+
+Posts re-ingested before this matching existed are stored twice;
+`python -m storage.legacy_posts` folds each such legacy row into the keyed
+one: its score history moves over, the rest of the row is dropped.
+"""
+
+from sqlalchemy import and_, bindparam, delete, select, update
+from sqlalchemy.orm import aliased
+
+from db.database import engine
+from db.models import MinHashBucket, Mention, PostScoreSnapshot, RedditPost, TrendingPost
+from storage.events import publish_change
+from storage.search import unindex_documents
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+LEGACY_PREFIX = "legacy-"
+
+
+def is_legacy(column):
+    # A key range rather than LIKE, so the unique index on post_id serves it ("." sorts right after "-")
+    return and_(column >= LEGACY_PREFIX, column < "legacy.")
+
+
+def adopt_legacy_posts(conn, rows):
+    """before_batch hook: give legacy rows matching a post in `rows` that post's key"""
+    legacy = conn.execute(
+        select(RedditPost.id, RedditPost.url, RedditPost.title)
+        .where(is_legacy(RedditPost.post_id), RedditPost.url.in_({row["url"] for row in rows}))
+    ).all()
+    if not legacy:
+        return
+    stored = set(conn.execute(
+        select(RedditPost.post_id).where(RedditPost.post_id.in_([row["post_id"] for row in rows]))
+    ).scalars())
+    legacy_ids = {(url, title): id_ for id_, url, title in legacy}
+    adopted = []
+    for row in rows:
+        legacy_id = legacy_ids.pop((row["url"], row["title"]), None)
+        if legacy_id is not None and row["post_id"] not in stored:
+            adopted.append({"legacy_id": legacy_id, "key": row["post_id"]})
+    if adopted:
+        conn.execute(
+            update(RedditPost).where(RedditPost.id == bindparam("legacy_id")).values(post_id=bindparam("key")),
+            adopted,
+        )
+
+
+def merge_legacy_duplicates(bind=None):
+    """Fold legacy rows into the keyed row of the same post; returns rows merged"""
+    bind = bind if bind is not None else engine
+    keyed = aliased(RedditPost)
+    with bind.begin() as conn:
+        pairs = conn.execute(
+            select(RedditPost.id, keyed.id)
+            .join(keyed, and_(keyed.url == RedditPost.url, keyed.title == RedditPost.title))
+            .where(is_legacy(RedditPost.post_id), ~is_legacy(keyed.post_id))
+        ).all()
+        if pairs:
+            moves = [{"legacy_id": legacy_id, "keyed_id": keyed_id} for legacy_id, keyed_id in pairs]
+            conn.execute(
+                update(PostScoreSnapshot).where(PostScoreSnapshot.post_id == bindparam("legacy_id"))
+                .values(post_id=bindparam("keyed_id")),
+                moves,
+            )
+            conn.execute(
+                update(RedditPost).where(RedditPost.cluster_id == bindparam("legacy_id"))
+                .values(cluster_id=bindparam("keyed_id")),
+                moves,
+            )
+            ids = [legacy_id for legacy_id, _ in pairs]
+            conn.execute(delete(TrendingPost).where(TrendingPost.post_id.in_(ids)))
+            conn.execute(delete(Mention).where(Mention.source == "reddit", Mention.item_id.in_(ids)))
+            conn.execute(delete(MinHashBucket).where(MinHashBucket.source == "reddit", MinHashBucket.item_id.in_(ids)))
+            unindex_documents(conn, "post", ids)
+            conn.execute(delete(RedditPost).where(RedditPost.id.in_(ids)))
+    if pairs:
+        publish_change("reddit", len(pairs), bind)
+    logger.info(f"Merged {len(pairs)} legacy Reddit rows into their keyed posts.")
+    return len(pairs)
+
+
+if __name__ == "__main__":
+    merge_legacy_duplicates()
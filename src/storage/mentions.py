@@ -0,0 +1,93 @@
+# src/storage/mentions.py
+
+"""Links Reddit posts and news articles to the repos they mention.
+
+Runs as an after_batch hook of the post and news upserts, so the mentions
+table changes only for the items just written. github.com links are kept as
+is; bare owner/name mentions only when github_repos knows the slug, looked up
+through ix_github_repos_slug. A mention keeps the time it was first seen.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import and_, delete, insert, or_, select
+
+from config import UPSERT_BATCH_SIZE
+from db.database import engine
+from db.models import GitHubRepo, Mention, RedditPost, TechNews
+from transform.links import extract_repo_links
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def link_mentions(conn, source, items):
+    """Bring the mentions of `items` ((item_id, *texts) tuples) of `source` up to date"""
+    if not items:
+        return
+    found = {item_id: extract_repo_links(*texts) for item_id, *texts in items}
+
+    candidates = set().union(*(mentioned for _, mentioned in found.values()))
+    known = set()
+    if candidates:
+        known = set(conn.execute(select(GitHubRepo.slug).where(GitHubRepo.slug.in_(candidates))).scalars())
+    wanted = {(item_id, slug) for item_id, (linked, mentioned) in found.items()
+              for slug in linked | (mentioned & known)}
+
+    existing = set(conn.execute(
+        select(Mention.item_id, Mention.slug).where(Mention.source == source, Mention.item_id.in_(list(found)))
+    ).all())
+    stale = existing - wanted
+    if stale:
+        conn.execute(delete(Mention).where(Mention.source == source, or_(
+            *(and_(Mention.item_id == item_id, Mention.slug == slug) for item_id, slug in stale)
+        )))
+    new = wanted - existing
+    if new:
+        now = datetime.utcnow()
+        conn.execute(insert(Mention), [
+            {"slug": slug, "source": source, "item_id": item_id, "mentioned_at": now} for item_id, slug in new
+        ])
+
+
+def link_posts(conn, rows):
+    """after_batch hook: mentions in the url and title of the posts just written"""
+    items = conn.execute(
+        select(RedditPost.id, RedditPost.url, RedditPost.title)
+        .where(RedditPost.post_id.in_([row["post_id"] for row in rows]))
+    ).all()
+    link_mentions(conn, "reddit", items)
+
+
+def link_news(conn, rows):
+    """after_batch hook: mentions in the url, title and summary of the articles just written"""
+    items = conn.execute(
+        select(TechNews.id, TechNews.url, TechNews.title, TechNews.summary)
+        .where(TechNews.url.in_([row["url"] for row in rows]))
+    ).all()
+    link_mentions(conn, "news", items)
+
+
+def link_existing(bind=None, batch_size=UPSERT_BATCH_SIZE):
+    """Link every stored post and article, one transaction per batch; returns items scanned"""
+    bind = bind if bind is not None else engine
+    scanned = 0
+    for source, columns in (("reddit", (RedditPost.id, RedditPost.url, RedditPost.title)),
+                            ("news", (TechNews.id, TechNews.url, TechNews.title, TechNews.summary))):
+        last_id = 0
+        while True:
+            with bind.begin() as conn:
+                items = conn.execute(
+                    select(*columns).where(columns[0] > last_id).order_by(columns[0]).limit(batch_size)
+                ).all()
+                if not items:
+                    break
+                link_mentions(conn, source, items)
+            scanned += len(items)
+            last_id = items[-1][0]
+    logger.info(f"Linked mentions for {scanned} stored posts and articles.")
+    return scanned
+
+
+if __name__ == "__main__":
+    link_existing()
@@ -1,27 +1,66 @@
 # src/storage/news_storage.py
 
-from db.database import SessionLocal
-from db.models import TechNews
+from sqlalchemy import delete, insert, select
+
+from db.models import NewsTopic, TechNews
+from storage.bulk import upsert_rows
+from storage.clusters import cluster_news
+from storage.events import publish_change
+from storage.mentions import link_news
+from storage.search import index_news
 from utils.logger import get_logger
+from utils.telemetry import observe_rows, record_error, stage
+from datetime import datetime
 
 logger = get_logger(__name__)
 
-def save_news_to_db(news_items):
-    session = SessionLocal()
+def news_to_row(item):
+    return {
+        "url": item["url"],
+        "title": item["title"],
+        "summary": item["summary"],
+        "sentiment": item["sentiment"],
+        "source": item.get("source") or "",
+        "published_at": item.get("published_at") or datetime.utcnow().isoformat()
+    }
+
+def topic_tagger(topics_by_url):
+    """after_batch hook replacing each article's topic tags with the ones just matched"""
+    def write_tags(conn, rows):
+        urls = [row["url"] for row in rows if row["url"] in topics_by_url]
+        if not urls:
+            return
+        ids = dict(conn.execute(select(TechNews.url, TechNews.id).where(TechNews.url.in_(urls))).all())
+        conn.execute(delete(NewsTopic).where(NewsTopic.news_id.in_(ids.values())))
+        tags = [{"news_id": ids[url], "topic": topic} for url in urls for topic in topics_by_url[url]]
+        if tags:
+            conn.execute(insert(NewsTopic), tags)
+    return write_tags
+
+def after_news_batch(topics_by_url):
+    """after_batch hook: topic tags, the search index, repo mentions and story clusters"""
+    write_tags = topic_tagger(topics_by_url)
+    def hook(conn, rows):
+        write_tags(conn, rows)
+        index_news(conn, rows)
+        link_news(conn, rows)
+        cluster_news(conn, rows)
+    return hook
+
+@stage("save.news")
+def save_news_to_db(news_items, batch_size=None):
     try:
-        for item in news_items:
-            news = TechNews(
-                title=item["title"],
-                summary=item["summary"],
-                sentiment=item["sentiment"],
-                url=item["url"],
-                published_at=item.get("published_at", "")
-            )
-            session.add(news)
-        session.commit()
-        logger.info(f"Saved {len(news_items)} news items to database.")
+        # url is the natural key, so an article without one can't be stored
+        rows = [news_to_row(item) for item in news_items if item.get("url")]
+        # Items without a "topics" key keep whatever tags they already have
+        topics = {item["url"]: item["topics"] for item in news_items if item.get("url") and "topics" in item}
+        written = upsert_rows(TechNews.__table__, rows, "url", batch_size, after_batch=after_news_batch(topics))
+        observe_rows("news", written)
+        if written:
+            publish_change("news", written)
+        logger.info(f"Saved {written} news items to database.")
+        return written
     except Exception as e:
+        record_error(e)
         logger.error(f"Failed to save news: {e}")
-        session.rollback()
-    finally:
-        session.close()
+        return 0
@@ -1,28 +1,83 @@
 # src/storage/reddit_storage.py
 
-from db.database import SessionLocal
-from db.models import RedditPost
+from sqlalchemy import insert, select
+
+from db.models import RedditPost, PostScoreSnapshot
+from storage.bulk import upsert_rows
+from storage.clusters import cluster_posts
+from storage.events import publish_change
+from storage.legacy_posts import adopt_legacy_posts
+from storage.mentions import link_posts
+from storage.search import index_posts
+from storage.trending import update_trending_posts
 from utils.logger import get_logger
+from utils.telemetry import observe_rows, record_error, stage
 from datetime import datetime
 
 logger = get_logger(__name__)
 
-def save_reddit_to_db(posts):
-    session = SessionLocal()
+def post_to_row(post, timestamp=None):
+    return {
+        "post_id": post["id"],
+        "title": post["title"],
+        "score": post["score"],
+        "url": post["url"],
+        "subreddit": post.get("subreddit", ""),
+        "author": post.get("author"),
+        "num_comments": post.get("num_comments"),
+        "created_utc": post.get("created_utc"),
+        "timestamp": timestamp or datetime.utcnow()
+    }
+
+def snapshot_scores(conn, rows):
+    """Append the score just written for each post in the batch"""
+    keys = [row["post_id"] for row in rows]
+    conn.execute(
+        insert(PostScoreSnapshot).from_select(
+            ["post_id", "score", "num_comments", "captured_at"],
+            select(RedditPost.id, RedditPost.score, RedditPost.num_comments, RedditPost.timestamp)
+            .where(RedditPost.post_id.in_(keys))
+        )
+    )
+
+def after_post_batch(conn, rows):
+    snapshot_scores(conn, rows)
+    update_trending_posts(conn, rows)
+    index_posts(conn, rows)
+    link_posts(conn, rows)
+    cluster_posts(conn, rows)
+
+@stage("save.reddit")
+def save_reddit_to_db(posts, batch_size=None, timestamp=None):
+    """Upsert `posts` as seen at `timestamp` (default now; replays pass the original fetch time)"""
     try:
-        for post in posts:
-            record = RedditPost(
-                title=post["title"],
-                score=post["score"],
-                url=post["url"],
-                subreddit=post["subreddit"],
-                timestamp=datetime.utcnow()
-            )
-            session.add(record)
-        session.commit()
-        logger.info(f"Saved {len(posts)} Reddit posts to database.")
+        now = timestamp or datetime.utcnow()
+        rows = [post_to_row(post, now) for post in posts]
+        written = upsert_rows(RedditPost.__table__, rows, "post_id", batch_size,
+                              before_batch=adopt_legacy_posts, after_batch=after_post_batch)
+        observe_rows("reddit", written)
+        if written:
+            publish_change("reddit", written)
+        logger.info(f"Saved {written} Reddit posts to database.")
+        return written
     except Exception as e:
+        record_error(e)
         logger.error(f"Error saving Reddit posts: {e}")
-        session.rollback()
-    finally:
-        session.close()
+        return 0
+
+def save_post_stream(posts, batch_size=100):
+    """Save an iterable of posts as it is consumed, one upsert per `batch_size` posts.
+
+    Memory stays bounded by one batch, and each batch is committed (and
+    announced to dashboards) while the source keeps producing. The default
+    matches one Reddit listing page.
+    """
+    written, batch = 0, []
+    for post in posts:
+        batch.append(post)
+        if len(batch) >= batch_size:
+            written += save_reddit_to_db(batch, batch_size)
+            batch = []
+    if batch:
+        written += save_reddit_to_db(batch, batch_size)
+    return written
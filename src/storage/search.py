@@ -0,0 +1,136 @@
+# src/storage/search.py
+
+"""Full-text search over repos, posts and news.
+
+On SQLite the storage layer mirrors every written row into the FTS5
+`search_index` (see db.models.SEARCH_INDEX_DDL) inside the same transaction,
+so search results are never staler than the panels. Each entity maps to one
+index row with rowid = id * 4 + kind code, which makes re-indexing an upsert.
+
+Ranking is BM25 with titles weighted over bodies, computed over at most
+SEARCH_CANDIDATES matches taken newest-first: a term found in most documents
+costs the same as a rare one, and for rare terms the ranking is exact.
+Other dialects fall back to an unranked ILIKE scan.
+"""
+
+import re
+
+from sqlalchemy import select, text
+
+from config import SEARCH_CANDIDATES
+from db.database import engine
+from db.models import GitHubRepo, RedditPost, TechNews
+
+SEARCH_KINDS = {"repo": 1, "post": 2, "news": 3}
+TITLE_WEIGHT = 5.0  # BM25 weight of title matches relative to body matches
+
+TERM_RE = re.compile(r"\w+")
+
+UPSERT_SQL = text("""
+    INSERT OR REPLACE INTO search_index (rowid, kind, url, title, body)
+    VALUES (:rowid, :kind, :url, :title, :body)
+""")
+
+SEARCH_SQL = text(f"""
+    SELECT kind, url, title, body, score FROM (
+        SELECT kind, url, title, body, -bm25(search_index, 0, 0, {TITLE_WEIGHT}, 1.0) AS score
+        FROM search_index
+        WHERE search_index MATCH :query AND (:kind IS NULL OR kind = :kind)
+        ORDER BY rowid DESC
+        LIMIT :candidates
+    )
+    ORDER BY score DESC
+    LIMIT :limit
+""")
+
+FALLBACK_SQL = text("""
+    SELECT kind, url, title, body, 0.0 AS score FROM (
+        SELECT 'repo' AS kind, url, full_name AS title, COALESCE(description, '') AS body FROM github_repos
+        WHERE full_name ILIKE :pattern OR description ILIKE :pattern
+        UNION ALL
+        SELECT 'post', url, title, '' FROM reddit_posts WHERE title ILIKE :pattern
+        UNION ALL
+        SELECT 'news', url, title, COALESCE(summary, '') FROM tech_news
+        WHERE title ILIKE :pattern OR summary ILIKE :pattern
+    ) hits
+    WHERE :kind IS NULL OR kind = :kind
+    LIMIT :limit
+""")
+
+
+def match_expression(query):
+    """FTS5 query for free text: every word must match, the last one as a prefix.
+
+    Words are quoted so user input can never be parsed as FTS5 syntax.
+    Returns None when the text has no searchable words.
+    """
+    terms = TERM_RE.findall(query.lower())
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    if len(terms[-1]) >= 2:
+        quoted[-1] += "*"  # search-as-you-type; single letters would match half the index
+    return " ".join(quoted)
+
+
+def index_documents(conn, kind, documents):
+    """Upsert (id, url, title, body) tuples of one kind into the index"""
+    if conn.dialect.name != "sqlite" or not documents:
+        return
+    code = SEARCH_KINDS[kind]
+    conn.execute(UPSERT_SQL, [
+        {"rowid": id_ * 4 + code, "kind": kind, "url": url, "title": title or "", "body": body or ""}
+        for id_, url, title, body in documents
+    ])
+
+
+def unindex_documents(conn, kind, ids):
+    """Drop the index rows of deleted entities of one kind"""
+    if conn.dialect.name != "sqlite" or not ids:
+        return
+    code = SEARCH_KINDS[kind]
+    conn.execute(text("DELETE FROM search_index WHERE rowid = :rowid"), [{"rowid": id_ * 4 + code} for id_ in ids])
+
+
+def index_repos(conn, rows):
+    """after_batch hook: re-index the repos just written"""
+    documents = conn.execute(
+        select(GitHubRepo.id, GitHubRepo.url, GitHubRepo.full_name, GitHubRepo.description)
+        .where(GitHubRepo.full_name.in_([row["full_name"] for row in rows]))
+    ).all()
+    index_documents(conn, "repo", documents)
+
+
+def index_posts(conn, rows):
+    """after_batch hook: re-index the posts just written"""
+    documents = conn.execute(
+        select(RedditPost.id, RedditPost.url, RedditPost.title)
+        .where(RedditPost.post_id.in_([row["post_id"] for row in rows]))
+    ).all()
+    index_documents(conn, "post", [(id_, url, title, "") for id_, url, title in documents])
+
+
+def index_news(conn, rows):
+    """after_batch hook: re-index the articles just written"""
+    documents = conn.execute(
+        select(TechNews.id, TechNews.url, TechNews.title, TechNews.summary)
+        .where(TechNews.url.in_([row["url"] for row in rows]))
+    ).all()
+    index_documents(conn, "news", documents)
+
+
+def search(query, kind=None, limit=20, bind=None):
+    """Best matches for free-text `query`, optionally of one kind ("repo", "post", "news")"""
+    bind = bind if bind is not None else engine
+    with bind.connect() as conn:
+        if conn.dialect.name != "sqlite":
+            if not query.strip():
+                return []
+            params = {"pattern": f"%{query.strip()}%", "kind": kind, "limit": limit}
+            return [dict(row) for row in conn.execute(FALLBACK_SQL, params).mappings()]
+
+        expression = match_expression(query)
+        if expression is None:
+            return []
+        params = {"query": expression, "kind": kind, "limit": limit, "candidates": SEARCH_CANDIDATES}
+        return [dict(row) for row in conn.execute(SEARCH_SQL, params).mappings()]
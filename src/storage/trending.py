@@ -0,0 +1,102 @@
+# src/storage/trending.py
+
+"""Incrementally maintained trending state for repos and posts.
+
+Every ingest advances an item's row in trending_repos / trending_posts from
+that row and the new observation alone, never from the snapshot history, so
+the cost of an ingest doesn't grow with how long an item has been tracked.
+The dashboard ranks straight off the trend_score indexes.
+"""
+
+from sqlalchemy import select
+
+from db.models import GitHubRepo, RedditPost, TrendingPost, TrendingRepo
+from storage.bulk import INSERT_BY_DIALECT
+
+SMOOTHING = 0.5  # EWMA weight of the newest velocity sample
+MIN_INTERVAL_HOURS = 0.25  # closer observations are folded into the next one
+LOOKAHEAD_HOURS = 1.0  # trend_score is the velocity projected this far ahead
+
+
+def advance(previous, value, captured_at):
+    """Next (observations, velocity, acceleration, trend_score) for one item.
+
+    `previous` is the item's trending row (None on first sight). Returns None
+    when the observation is too close to the previous one to measure a rate;
+    the row is then left alone and the change counts toward the next sample.
+    """
+    if previous is None:
+        return {"observations": 1, "velocity": 0.0, "acceleration": 0.0, "trend_score": 0.0}
+
+    hours = (captured_at - previous.captured_at).total_seconds() / 3600
+    if hours < MIN_INTERVAL_HOURS:
+        return None
+
+    sample = (value - previous.value) / hours
+    if previous.observations == 1:
+        velocity, acceleration = sample, 0.0  # first rate: nothing to smooth or compare against
+    else:
+        velocity = previous.velocity + SMOOTHING * (sample - previous.velocity)
+        acceleration = (velocity - previous.velocity) / hours
+    return {
+        "observations": previous.observations + 1,
+        "velocity": velocity,
+        "acceleration": acceleration,
+        "trend_score": velocity + acceleration * LOOKAHEAD_HOURS,
+    }
+
+
+def update_trending(conn, trending, key, value_column, observations):
+    """Fold `observations` (dicts with `key`, `value_column`, captured_at, ...) into `trending`"""
+    if not observations:
+        return
+    columns = trending.c
+    previous = {
+        row.item: row for row in conn.execute(
+            select(columns[key].label("item"), columns[value_column].label("value"), columns.captured_at,
+                   columns.observations, columns.velocity)
+            .where(columns[key].in_([obs[key] for obs in observations]))
+        )
+    }
+
+    rows = []
+    for obs in observations:
+        state = advance(previous.get(obs[key]), obs[value_column], obs["captured_at"])
+        if state is not None:
+            rows.append({**obs, **state})
+    if not rows:
+        return
+
+    stmt = INSERT_BY_DIALECT[conn.dialect.name](trending)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[key],
+        set_={column: stmt.excluded[column] for column in rows[0] if column != key},
+    )
+    conn.execute(stmt, rows)
+
+
+def update_trending_repos(conn, rows):
+    """after_batch hook: advance trending_repos for the repos just written"""
+    keys = [row["full_name"] for row in rows]
+    observations = [
+        {"repo_id": repo.id, "stars": repo.stars, "captured_at": repo.timestamp, "language": repo.language}
+        for repo in conn.execute(
+            select(GitHubRepo.id, GitHubRepo.stars, GitHubRepo.timestamp, GitHubRepo.language)
+            .where(GitHubRepo.full_name.in_(keys))
+        )
+        if repo.stars is not None and repo.timestamp is not None
+    ]
+    update_trending(conn, TrendingRepo.__table__, "repo_id", "stars", observations)
+
+
+def update_trending_posts(conn, rows):
+    """after_batch hook: advance trending_posts for the posts just written"""
+    keys = [row["post_id"] for row in rows]
+    observations = [
+        {"post_id": post.id, "score": post.score, "captured_at": post.timestamp}
+        for post in conn.execute(
+            select(RedditPost.id, RedditPost.score, RedditPost.timestamp).where(RedditPost.post_id.in_(keys))
+        )
+        if post.score is not None and post.timestamp is not None
+    ]
+    update_trending(conn, TrendingPost.__table__, "post_id", "score", observations)
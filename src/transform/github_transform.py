@@ -1,17 +1,21 @@
 # src/transform/github_transform.py
 
+from utils.telemetry import stage
+
 def normalize_repo(repo):
     return {
-        "name": repo.get("name"),
+        # Displayed as owner/name, like ingest.github_ingest.format_repos stores it
+        "name": repo.get("full_name") or repo.get("name"),
         "full_name": repo.get("full_name"),
         "url": repo.get("html_url"),
         "description": repo.get("description"),
-        "stars": repo.get("stargazers_count"),
+        "stars": repo.get("stargazers_count", 0),
         "language": repo.get("language"),
         "created_at": repo.get("created_at"),
         "updated_at": repo.get("updated_at"),
         "topics": repo.get("topics", [])
     }
 
+@stage("transform.normalize_repos")
 def normalize_repos(repos):
     return [normalize_repo(repo) for repo in repos]
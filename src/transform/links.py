@@ -0,0 +1,48 @@
+# src/transform/links.py
+
+import re
+
+# github.com/<owner>/<name>, as a link or in running text
+GITHUB_URL_RE = re.compile(r"github\.com/([a-z0-9][a-z0-9-]{0,38})/([a-z0-9._-]{1,100})", re.IGNORECASE)
+
+# A bare owner/name in prose ("check out astral-sh/ruff"); not part of a path, URL or e-mail
+SLUG_RE = re.compile(
+    r"(?<![\w/.@:-])([a-z0-9][a-z0-9-]{0,38})/([a-z0-9._-]*[a-z0-9_-])(?![\w/-])", re.IGNORECASE
+)
+
+# First path segments of github.com that are site pages, not owners
+RESERVED_OWNERS = frozenset({
+    "about", "apps", "collections", "contact", "customer-stories", "enterprise", "events", "explore",
+    "features", "login", "marketplace", "new", "notifications", "orgs", "pricing", "pulls", "search",
+    "security", "settings", "site", "sponsors", "topics", "trending", "users",
+})
+
+
+def normalize_slug(owner, name):
+    """Canonical owner/name as GitHub resolves it: case-insensitive, no .git suffix"""
+    name = name.rstrip(".")
+    if name.lower().endswith(".git"):
+        name = name[:-4]
+    if not name or owner.lower() in RESERVED_OWNERS:
+        return None
+    return f"{owner}/{name}".lower()
+
+
+def extract_repo_links(*texts):
+    """(linked, mentioned) slug sets found in `texts`.
+
+    `linked` come from github.com URLs and are trustworthy on their own;
+    `mentioned` are bare owner/name pairs, which look like plenty of other
+    things ("TCP/IP", "r/rust") and only count once matched to a known repo.
+    """
+    linked, mentioned = set(), set()
+    for text in texts:
+        if not text:
+            continue
+        for owner, name in GITHUB_URL_RE.findall(text):
+            if slug := normalize_slug(owner, name):
+                linked.add(slug)
+        for owner, name in SLUG_RE.findall(text):
+            if slug := normalize_slug(owner, name):
+                mentioned.add(slug)
+    return linked, mentioned - linked
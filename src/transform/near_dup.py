@@ -0,0 +1,70 @@
+# src/transform/near_dup.py
+
+"""MinHash signatures for near-duplicate headlines.
+
+A signature is NUM_HASHES 32-bit minimums over an item's word set; the share
+of equal positions between two signatures estimates the Jaccard similarity
+of the word sets. Split into BANDS bands of ROWS values, each band hashes to
+one bucket: items sharing any bucket are candidates (LSH), so finding them
+is an index lookup instead of a comparison against every stored item. With
+16 bands of 4 rows, a pair at similarity 0.7 shares a bucket 99% of the time,
+one at 0.3 about 12%; candidates are then checked against the threshold.
+"""
+
+import hashlib
+import random
+import re
+from array import array
+
+BANDS = 16
+ROWS = 4
+NUM_HASHES = BANDS * ROWS
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)  # fixed: stored signatures must stay comparable across runs
+_COEFFICIENTS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_HASHES)]
+
+WORD_RE = re.compile(r"\w+")
+
+
+def shingles(text):
+    """Lowercased word set of `text`"""
+    return set(WORD_RE.findall((text or "").lower()))
+
+
+def _token_hash(token):
+    # Python's hash() is salted per process; signatures are persisted
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+
+
+def minhash(text):
+    """Signature of `text` as NUM_HASHES unsigned 32-bit ints (None for text without words)"""
+    tokens = [_token_hash(token) for token in shingles(text)]
+    if not tokens:
+        return None
+    return array("I", (min((a * x + b) % _PRIME for x in tokens) & 0xFFFFFFFF for a, b in _COEFFICIENTS))
+
+
+def to_bytes(signature):
+    return signature.tobytes()
+
+
+def from_bytes(blob):
+    signature = array("I")
+    signature.frombytes(blob)
+    return signature
+
+
+def band_buckets(signature):
+    """One signed 64-bit bucket per band; the band number is part of the hash"""
+    buckets = []
+    for band in range(BANDS):
+        values = signature[band * ROWS:(band + 1) * ROWS]
+        digest = hashlib.blake2b(bytes([band]) + values.tobytes(), digest_size=8).digest()
+        buckets.append(int.from_bytes(digest, "little", signed=True))
+    return buckets
+
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of the word sets behind two signatures"""
+    return sum(x == y for x, y in zip(a, b)) / NUM_HASHES
@@ -1,17 +1,45 @@
 # src/transform/news_transform.py
 
+import atexit
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version
+
 from sumy.parsers.plaintext import PlaintextParser
 from sumy.nlp.tokenizers import Tokenizer
 from sumy.summarizers.lsa import LsaSummarizer
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+from config import NLP_BATCH_SIZE, NLP_CACHE_PATH, NLP_CACHE_SIZE, NLP_WORKERS
+from utils.memo_cache import MemoCache, memo_key
+from utils.telemetry import stage
+
 analyzer = SentimentIntensityAnalyzer()
 
+# Part of every memo key: bump the leading revision whenever enrichment output changes
+ENRICHMENT_VERSION = f"1/sumy-{version('sumy')}/vader-{version('vaderSentiment')}"
+
+# Built once per process: the tokenizer loads NLTK data on construction
+_tokenizer = None
+_summarizer = None
+
+
+def _summary_tools():
+    global _tokenizer, _summarizer
+    if _tokenizer is None:
+        _tokenizer = Tokenizer("english")
+        _summarizer = LsaSummarizer()
+    return _tokenizer, _summarizer
+
+
 def summarize_text(text):
     if not text:
         return ""
-    parser = PlaintextParser.from_string(text, Tokenizer("english"))
-    summarizer = LsaSummarizer()
+    tokenizer, summarizer = _summary_tools()
+    parser = PlaintextParser.from_string(text, tokenizer)
     summary = summarizer(parser.document, 1)  # just 1 sentence
     result = " ".join(str(sentence) for sentence in summary)
     return result[:200] + "..." if len(result) > 200 else result
@@ -27,3 +55,87 @@ def get_sentiment_label(text):
     else:
         return "Neutral"
 
+
+def enrich_batch(texts):
+    """(summary, sentiment) for each text; the unit of work sent to pool workers"""
+    return [(summarize_text(text), get_sentiment_label(text)) for text in texts]
+
+
+class BatchEnricher:
+    """Summaries and sentiment labels for many texts at once.
+
+    Each distinct (whitespace-normalized) text is processed once: repeats
+    within a call, recently seen texts (up to `memo_size`, in memory) and
+    anything in the persistent `memo` from earlier runs are lookups. The rest
+    is split into `batch_size` chunks and spread over a process pool, created
+    on first use; small inputs run inline. Workers are spawned, not forked:
+    the flow calls this from a worker thread of a threaded process, and
+    several threads may enrich at once, so the in-memory LRU and the pool
+    are guarded by a lock (held for lookups, not while enriching).
+    """
+
+    def __init__(self, workers=NLP_WORKERS, batch_size=NLP_BATCH_SIZE, memo_size=10_000, memo=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.memo_size = memo_size
+        self.memo = memo
+        self.seen = OrderedDict()  # normalized text -> (summary, sentiment)
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @stage("transform.enrich")
+    def enrich(self, texts):
+        results = [None] * len(texts)
+        pending = {}  # normalized text -> indexes still waiting for it
+        with self._lock:
+            for index, text in enumerate(texts):
+                text = " ".join((text or "").split())
+                if text in self.seen:
+                    self.seen.move_to_end(text)
+                    results[index] = self.seen[text]
+                else:
+                    pending.setdefault(text, []).append(index)
+
+        keys = {text: memo_key(text, ENRICHMENT_VERSION) for text in pending} if self.memo is not None else {}
+        stored = self.memo.get_many(keys.values()) if keys else {}
+        missing = [text for text in pending if keys.get(text) not in stored]
+        computed = dict(zip(missing, self._run(missing)))
+        if keys:
+            self.memo.put_many({keys[text]: computed[text] for text in missing})
+
+        with self._lock:
+            for text, indexes in pending.items():
+                result = computed[text] if text in computed else tuple(stored[keys[text]])
+                self.seen[text] = result
+                for index in indexes:
+                    results[index] = result
+            while len(self.seen) > self.memo_size:
+                self.seen.popitem(last=False)
+        return results
+
+    def _run(self, texts):
+        if self.workers <= 1 or len(texts) <= self.batch_size:
+            return enrich_batch(texts)
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+            pool = self._pool
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        return [result for batch in pool.map(enrich_batch, batches) for result in batch]
+
+    def close(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+
+# Shared by the CLI, news.py and the Prefect flow, in memory and across runs on disk
+enricher = BatchEnricher(memo=MemoCache(NLP_CACHE_PATH, max_entries=NLP_CACHE_SIZE))
+atexit.register(enricher.close)
+
+
+def enrich_texts(texts):
+    """(summary, sentiment) per text, in order, via the shared BatchEnricher"""
+    return enricher.enrich(texts)
@@ -1,16 +1,19 @@
 # src/transform/reddit_transform.py
 
+from utils.telemetry import stage
+
+def normalize_post(post):
+    return {
+        "id": post["id"],
+        "title": post["title"],
+        "score": post["score"],
+        "url": post["url"],
+        "author": post["author"],
+        "num_comments": post["num_comments"],
+        "created_utc": post["created_utc"],
+        "subreddit": post["subreddit"]
+    }
+
+@stage("transform.normalize_posts")
 def normalize_posts(posts):
-    normalized = []
-    for post in posts:
-        normalized.append({
-            "id": post["id"],
-            "title": post["title"],
-            "score": post["score"],
-            "url": post["url"],
-            "author": post["author"],
-            "num_comments": post["num_comments"],
-            "created_utc": post["created_utc"],
-            "subreddit": post["subreddit"]
-        })
-    return normalized
+    return [normalize_post(post) for post in posts]
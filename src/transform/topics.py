@@ -0,0 +1,80 @@
+# src/transform/topics.py
+
+import json
+import re
+
+from config import TOPICS_FILE
+
+# topic -> keywords; override with a JSON file of the same shape (DEVRADAR_TOPICS_FILE)
+DEFAULT_TOPICS = {
+    "ai": ["ai", "machine learning", "artificial intelligence", "openai", "chatgpt", "llama", "transformer", "llm"],
+    "hardware": ["nvidia", "intel", "chip", "cpu", "gpu", "processor"],
+    "big_tech": ["microsoft", "google", "meta", "apple"],
+    "mobile": ["iphone", "android"],
+    "cloud": ["cloud", "devops", "kubernetes"],
+    "software": ["software", "developer", "framework", "coding", "programming"],
+    "quantum": ["quantum"],
+    "blockchain": ["blockchain", "crypto"],
+    "security": ["cybersecurity", "vulnerability", "ransomware"],
+}
+
+
+def load_topics(path=TOPICS_FILE):
+    if not path:
+        return DEFAULT_TOPICS
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def trie_pattern(keywords):
+    """Regex source matching any of `keywords`, factored into a prefix trie.
+
+    Python's re tries every alternative at every position; sharing prefixes
+    cuts that to one branch per distinct leading character.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end of a keyword
+
+    def build(node):
+        ends_here = "" in node
+        branches = [(r"\s+" if char == " " else re.escape(char)) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not ends_here:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if ends_here else "")
+
+    return build(trie)
+
+
+class TopicMatcher:
+    """Finds which topics a text mentions in one pass of a single compiled regex.
+
+    Keywords match whole words only, case-insensitively ("ai" matches "AI
+    startup" but not "said"); multi-word keywords allow any whitespace
+    between their words.
+    """
+
+    def __init__(self, topics):
+        self.topics = topics
+        self.topic_of = {}  # normalized keyword -> topics
+        for topic, keywords in topics.items():
+            for keyword in keywords:
+                self.topic_of.setdefault(" ".join(keyword.lower().split()), set()).add(topic)
+
+        self.pattern = re.compile(r"(?<![a-z0-9])" + trie_pattern(self.topic_of) + r"(?![a-z0-9])")
+
+    def match(self, *texts):
+        """Sorted topics mentioned in any of `texts`"""
+        found = set()
+        for hit in self.pattern.findall("\n".join(text or "" for text in texts).lower()):
+            found |= self.topic_of[" ".join(hit.split())]
+        return sorted(found)
+
+
+topic_matcher = TopicMatcher(load_topics())
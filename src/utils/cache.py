@@ -0,0 +1,102 @@
+# src/utils/cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from config import PANEL_CACHE_SIZE, PANEL_CACHE_TTL
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after `ttl` seconds.
+
+    Entries carry tags (e.g. the source tables a query reads) so writers can
+    drop exactly the entries their commit made stale.
+    """
+
+    def __init__(self, maxsize=256, ttl=300, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (expires_at, tags, value)
+        self._inflight = {}  # key -> Event set when the first loader finishes
+        self._generation = 0  # bumped by invalidate() of everything
+        self._tag_generations = {}  # tag -> bumped by invalidate() of that tag
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key, loader, tags=()):
+        """Return the cached value for `key`, calling `loader()` at most once per miss.
+
+        Concurrent callers missing on the same key wait for the first loader
+        instead of each hitting the database. A value whose load overlapped an
+        invalidate() of its tags is returned to the loading caller but not
+        stored, so waiters load again rather than keep it for the whole TTL.
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[2]
+                event = self._inflight.get(key)
+                if event is None:
+                    self.misses += 1
+                    event = self._inflight[key] = threading.Event()
+                    generation = self._generations(tags)
+                    break
+            event.wait()
+
+        try:
+            value = loader()
+            with self._lock:
+                if self._generations(tags) != generation:
+                    return value  # invalidated while loading: may predate the commit
+                self._entries[key] = (self.clock() + self.ttl, frozenset(tags), value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            return value
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            event.set()
+
+    def invalidate(self, *tags):
+        """Drop entries carrying any of `tags`, or everything when none are given"""
+        with self._lock:
+            if not tags:
+                self._generation += 1
+                self._entries.clear()
+                return
+            for tag in tags:
+                self._tag_generations[tag] = self._tag_generations.get(tag, 0) + 1
+            stale = [key for key, (_, entry_tags, _) in self._entries.items() if entry_tags.intersection(tags)]
+            for key in stale:
+                del self._entries[key]
+
+    def _generations(self, tags):
+        return self._generation, tuple(self._tag_generations.get(tag, 0) for tag in tags)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Process-wide cache shared by every dashboard client
+panel_cache = TTLCache(maxsize=PANEL_CACHE_SIZE, ttl=PANEL_CACHE_TTL)
+
+
+def cached(*tags, cache=None):
+    """Memoize a function in `cache` (default: panel_cache), keyed by name and arguments"""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            target = cache if cache is not None else panel_cache
+            key = (fn.__module__, fn.__qualname__, args, tuple(sorted(kwargs.items())))
+            return target.get_or_load(key, lambda: fn(*args, **kwargs), tags)
+        wrapper.uncached = fn
+        return wrapper
+    return decorator
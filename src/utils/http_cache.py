@@ -0,0 +1,146 @@
+# src/utils/http_cache.py
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlencode
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_responses_stored_at ON responses (stored_at);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+COUNTERS = ("hits", "not_modified", "misses")
+
+
+class ConditionalCache:
+    """Persistent HTTP response cache with ETag / Last-Modified revalidation.
+
+    Entries are keyed by (url, params). Callers first ask for a `fresh` body
+    (still within the response's Cache-Control max-age, so no request at all),
+    otherwise send `validators(key)` with the request, and hand the response
+    to `store` (200) or `revalidated` (304, reuses the stored body).
+
+    Counters persist next to the entries so savings add up across cycles:
+    hits (served without a request), not_modified (304s, no body and no
+    quota) and misses (full downloads). A falsy `path` disables the cache.
+    """
+
+    def __init__(self, path, max_entry_age=7 * 24 * 3600, clock=time.time):
+        self.path = path
+        self.max_entry_age = max_entry_age
+        self.clock = clock
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url, params=None):
+        return f"{url}?{urlencode(sorted((params or {}).items()))}"
+
+    def _db(self):
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def _count(self, db, name):
+        db.execute(
+            "INSERT INTO counters (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    def fresh(self, key):
+        """Parsed body of an entry still within its max-age, or None"""
+        if not self.path:
+            return None
+        with self._lock:
+            db = self._db()
+            row = db.execute(
+                "SELECT body FROM responses WHERE key = ? AND expires_at > ?", (key, self.clock())
+            ).fetchone()
+            if row is None:
+                return None
+            self._count(db, "hits")
+        return json.loads(row[0])
+
+    def validators(self, key):
+        """Conditional request headers for the stored entry, if any"""
+        if not self.path:
+            return {}
+        with self._lock:
+            row = self._db().execute(
+                "SELECT etag, last_modified FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        headers = {}
+        if row and row[0]:
+            headers["If-None-Match"] = row[0]
+        if row and row[1]:
+            headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def store(self, key, headers, body):
+        """Remember a full (200) response and its validators"""
+        if not self.path:
+            return
+        now = self.clock()
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN")
+            with db:  # COMMIT, or ROLLBACK on error so the shared connection never stays mid-transaction
+                db.execute(
+                    "INSERT OR REPLACE INTO responses (key, etag, last_modified, body, stored_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, headers.get("ETag"), headers.get("Last-Modified"), body, now, now + self._max_age(headers)),
+                )
+                # Search params embed dates, so old keys are never asked for again
+                db.execute("DELETE FROM responses WHERE stored_at < ?", (now - self.max_entry_age,))
+                self._count(db, "misses")
+
+    def revalidated(self, key, headers):
+        """Parsed stored body after a 304, or None if the entry is gone"""
+        if not self.path:
+            return None
+        now = self.clock()
+        with self._lock:
+            db = self._db()
+            row = db.execute("SELECT body FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE responses SET stored_at = ?, expires_at = ? WHERE key = ?",
+                (now, now + self._max_age(headers), key),
+            )
+            self._count(db, "not_modified")
+        return json.loads(row[0])
+
+    def stats(self):
+        """Lifetime hit / 304 / miss counts"""
+        counts = dict.fromkeys(COUNTERS, 0)
+        if self.path:
+            with self._lock:
+                counts.update(self._db().execute("SELECT name, value FROM counters").fetchall())
+        return counts
+
+    @staticmethod
+    def _max_age(headers):
+        match = MAX_AGE_RE.search(headers.get("Cache-Control") or "")
+        return int(match.group(1)) if match else 0
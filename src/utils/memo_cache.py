@@ -0,0 +1,98 @@
+# src/utils/memo_cache.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS memo (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_memo_used_at ON memo (used_at);
+"""
+
+
+def memo_key(text, version):
+    """Hash of whitespace-normalized text plus the version of whatever computes the value"""
+    normalized = " ".join(text.split())
+    return hashlib.sha256(f"{version}\0{normalized}".encode()).hexdigest()
+
+
+class MemoCache:
+    """Persistent, size-bounded key -> JSON value store shared between processes.
+
+    Backed by one SQLite file, so the CLI, scripts and the Prefect flow all
+    reuse each other's results. Reads refresh an entry's use time; once more
+    than `max_entries` are stored, the least recently used are evicted. A
+    falsy `path` disables the cache.
+    """
+
+    def __init__(self, path, max_entries=50_000, clock=time.time):
+        self.path = path
+        self.max_entries = max_entries
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _db(self):
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def get_many(self, keys):
+        """Stored values for whichever of `keys` are present"""
+        keys = list(dict.fromkeys(keys))
+        if not self.path or not keys:
+            return {}
+        found = {}
+        with self._lock:
+            db = self._db()
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                found.update(db.execute(f"SELECT key, value FROM memo WHERE key IN ({marks})", chunk).fetchall())
+            if found:
+                now = self.clock()
+                db.execute("BEGIN")
+                with db:  # COMMIT, or ROLLBACK on error so the shared connection never stays mid-transaction
+                    db.executemany("UPDATE memo SET used_at = ? WHERE key = ?", [(now, key) for key in found])
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return {key: json.loads(value) for key, value in found.items()}
+
+    def put_many(self, items):
+        """Store `{key: value}` and evict the least recently used overflow"""
+        if not self.path or not items:
+            return
+        now = self.clock()
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN")
+            with db:
+                db.executemany(
+                    "INSERT OR REPLACE INTO memo (key, value, used_at) VALUES (?, ?, ?)",
+                    [(key, json.dumps(value), now) for key, value in items.items()],
+                )
+                overflow = db.execute("SELECT COUNT(*) FROM memo").fetchone()[0] - self.max_entries
+                if overflow > 0:
+                    db.execute(
+                        "DELETE FROM memo WHERE key IN (SELECT key FROM memo ORDER BY used_at LIMIT ?)", (overflow,)
+                    )
+
+    def __len__(self):
+        if not self.path:
+            return 0
+        with self._lock:
+            return self._db().execute("SELECT COUNT(*) FROM memo").fetchone()[0]
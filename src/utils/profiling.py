@@ -0,0 +1,284 @@
+# src/utils/profiling.py
+
+"""Sampled per-stage profiles and allocation summaries of one run (--profile).
+
+While a Profiler is recording, every utils.telemetry.stage() call registers
+itself on its thread, and a background thread samples the Python stack of
+each thread that is inside a stage every PROFILE_INTERVAL seconds. Samples
+are attributed to the innermost open stage (fetch.github, save.reddit,
+dashboard.top_repos, ...); concurrent stages of one asyncio loop go to the
+one entered last. tracemalloc runs alongside, so allocations still alive at
+the end are summarized by source line, and each stage's calls, wall time and
+net traced memory are counted.
+
+A run is a directory under PROFILE_DIR, <YYYYmmdd_HHMMSS>_<label>/:
+
+    profile.collapsed  one "stage;frame;frame... samples" line per stack, for
+                       flamegraph.pl, speedscope or inferno
+    allocations.txt    top allocation sites and peak traced memory
+    summary.json       per-stage calls / seconds / samples / net KB, per-function
+                       self and total samples, allocation sites; read by compare_runs()
+
+Sampling costs one stack walk per thread in a stage per tick. tracemalloc
+is the expensive part, slowing allocation-heavy stages several times over;
+PROFILE_TRACEMALLOC_FRAMES=0 leaves it off when the timings themselves
+matter. Replay worker processes are not profiled.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+from config import PROFILE_DIR, PROFILE_INTERVAL, PROFILE_TRACEMALLOC_FRAMES
+from utils import telemetry
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TOP_FUNCTIONS = 200
+TOP_ALLOCATIONS = 50
+
+
+def short_path(filename):
+    """A frame's file as imported (relative to its sys.path entry), to keep collapsed stacks readable"""
+    for entry in sorted((os.path.abspath(entry) for entry in sys.path if entry), key=len, reverse=True):
+        if filename.startswith(entry + os.sep):
+            return os.path.relpath(filename, entry)
+    return os.path.basename(filename)
+
+
+class Profiler:
+    """Stack sampler and tracemalloc session for one run; see the module docstring"""
+
+    def __init__(self, label, root=PROFILE_DIR, interval=PROFILE_INTERVAL,
+                 tracemalloc_frames=PROFILE_TRACEMALLOC_FRAMES):
+        self.label = label
+        self.interval = interval
+        self.tracemalloc_frames = tracemalloc_frames
+        self.started_at = datetime.now()
+        self.run_dir = os.path.join(root, f"{self.started_at:%Y%m%d_%H%M%S}_{label}")
+        self.samples = Counter()  # (stage, frame labels, outermost first) -> samples
+        self.stages = defaultdict(lambda: {"calls": 0, "seconds": 0.0, "net_bytes": 0})
+        self.ticks = 0
+        self._open = {}  # thread id -> [[stage, traced bytes at entry]], innermost last
+        self._labels = {}  # code object -> frame label
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._sampler = None
+        self._root = None
+        self._started = None
+        self._owns_tracemalloc = False
+
+    def start(self, track_caller=True):
+        """Begin sampling; with `track_caller`, the calling thread counts as inside a stage named after the run"""
+        self._started = time.perf_counter()
+        if self.tracemalloc_frames and not tracemalloc.is_tracing():
+            tracemalloc.start(self.tracemalloc_frames)
+            self._owns_tracemalloc = True
+        if track_caller:
+            self._root = self.enter(self.label)
+        self._sampler = threading.Thread(target=self._sample, name="devradar-profiler", daemon=True)
+        self._sampler.start()
+        telemetry._profiler = self
+        logger.info(f"Profiling '{self.label}' every {self.interval * 1000:g}ms into {self.run_dir}")
+        return self
+
+    def enter(self, name):
+        """Called by telemetry.stage() on entry; returns the token to pass to exit()"""
+        entry = [name, tracemalloc.get_traced_memory()[0]]
+        self._open.setdefault(threading.get_ident(), []).append(entry)
+        return entry
+
+    def exit(self, entry, seconds):
+        """Called by telemetry.stage() on exit"""
+        open_stages = self._open.get(threading.get_ident(), [])
+        for i in range(len(open_stages) - 1, -1, -1):
+            if open_stages[i] is entry:
+                del open_stages[i]
+                break
+        net_bytes = tracemalloc.get_traced_memory()[0] - entry[1]
+        with self._lock:
+            stats = self.stages[entry[0]]
+            stats["calls"] += 1
+            stats["seconds"] += seconds
+            stats["net_bytes"] += net_bytes
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = f"{code.co_name} ({short_path(code.co_filename)}:{code.co_firstlineno})"
+        return label
+
+    def _sample(self):
+        me = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            self.ticks += 1
+            frames = sys._current_frames()
+            for thread_id, open_stages in list(self._open.items()):
+                frame = frames.get(thread_id)
+                if thread_id == me or frame is None:
+                    continue
+                try:
+                    stage = open_stages[-1][0]
+                except IndexError:
+                    continue  # not inside a stage right now
+                stack = []
+                while frame is not None:
+                    stack.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                self.samples[(stage, tuple(reversed(stack)))] += 1
+
+    def stop(self):
+        """Stop sampling and tracing and write the run directory; returns its path"""
+        if telemetry._profiler is self:
+            telemetry._profiler = None
+        self._stopped.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        if self._root is not None:
+            self.exit(self._root, time.perf_counter() - self._started)
+        seconds = time.perf_counter() - self._started
+
+        statistics, tracing = [], tracemalloc.is_tracing()
+        if tracing:
+            statistics = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),  # the samples themselves
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            )).statistics("lineno")
+        current, peak = tracemalloc.get_traced_memory()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+
+        os.makedirs(self.run_dir, exist_ok=True)
+        with open(os.path.join(self.run_dir, "profile.collapsed"), "w") as f:
+            for (stage, stack), count in sorted(self.samples.items()):
+                f.write(f"{';'.join((stage, *stack))} {count}\n")
+
+        allocations = []
+        for stat in statistics[:TOP_ALLOCATIONS]:
+            frame = stat.traceback[0]
+            allocations.append({"site": f"{short_path(frame.filename)}:{frame.lineno}",
+                                "kb": round(stat.size / 1024, 1), "count": stat.count})
+        with open(os.path.join(self.run_dir, "allocations.txt"), "w") as f:
+            if not tracing:
+                f.write("allocation tracking was off (DEVRADAR_PROFILE_TRACEMALLOC_FRAMES=0)\n")
+            else:
+                f.write(f"peak traced memory {peak / 1024:,.0f} KB, "
+                        f"{current / 1024:,.0f} KB still allocated at the end\n\n")
+                f.write(f"{'KB':>10} {'blocks':>9}  site\n")
+            for allocation in allocations:
+                f.write(f"{allocation['kb']:>10,.1f} {allocation['count']:>9,}  {allocation['site']}\n")
+
+        # Seconds a sample stands for: the sampler falls behind the interval when the GIL is busy
+        per_sample = seconds / self.ticks if self.ticks else self.interval
+        stage_samples, self_samples, total_samples = Counter(), Counter(), Counter()
+        for (stage, stack), count in self.samples.items():
+            stage_samples[stage] += count
+            if stack:
+                self_samples[stack[-1]] += count
+            for label in set(stack):
+                total_samples[label] += count
+        summary = {
+            "label": self.label,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "argv": sys.argv,
+            "seconds": round(seconds, 3),
+            "interval": self.interval,
+            "seconds_per_sample": per_sample,
+            "samples": sum(self.samples.values()),
+            "peak_kb": round(peak / 1024, 1) if tracing else None,
+            "stages": {stage: {"calls": stats["calls"], "seconds": round(stats["seconds"], 4),
+                               "samples": stage_samples[stage], "net_kb": round(stats["net_bytes"] / 1024, 1)}
+                       for stage, stats in sorted(self.stages.items())},
+            "functions": {label: {"self": self_samples[label], "total": count}
+                          for label, count in total_samples.most_common(TOP_FUNCTIONS)},
+            "allocations": allocations,
+        }
+        with open(os.path.join(self.run_dir, "summary.json"), "w") as f:
+            json.dump(summary, f, indent=2)
+
+        logger.info(f"Profile of '{self.label}' ({summary['samples']} samples over {seconds:.1f}s) "
+                    f"written to {self.run_dir}")
+        return self.run_dir
+
+
+@contextmanager
+def profiled(label, enabled=True):
+    """Profile the block as a run named `label`; a no-op unless `enabled` (the --profile flag)"""
+    if not enabled:
+        yield None
+        return
+    profiler = Profiler(label).start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+
+
+def resolve_run(run, root=PROFILE_DIR):
+    """Path of a run given its directory or its name under `root`"""
+    for path in (run, os.path.join(root, run)):
+        if os.path.isfile(os.path.join(path, "summary.json")):
+            return path
+    raise FileNotFoundError(f"No profile run {run!r} (looked for {run}/summary.json and under {root}/)")
+
+
+def _change(before, after):
+    if not before:
+        return "new" if after else ""
+    return f"{(after - before) / before:+.0%}"
+
+
+def compare_runs(before, after, top=15, root=PROFILE_DIR):
+    """Lines of a report of what changed from run `before` to run `after`
+
+    Stages by mean wall time per call; functions by estimated self time,
+    largest change first, which is where a hot-path regression shows up;
+    allocation sites by KB still allocated at the end of the run.
+    """
+    runs = []
+    for run in (before, after):
+        with open(os.path.join(resolve_run(run, root), "summary.json")) as f:
+            runs.append(json.load(f))
+    a, b = runs
+    lines = [" -> ".join(f"{run['label']} {run['started_at']} ({run['seconds']}s)" for run in runs), ""]
+
+    lines.append(f"{'stage':<40} {'calls':>13} {'ms/call':>21} {'change':>8}")
+    for stage in sorted(set(a["stages"]) | set(b["stages"])):
+        sa, sb = a["stages"].get(stage), b["stages"].get(stage)
+        ms_a, ms_b = (s["seconds"] / s["calls"] * 1000 if s and s["calls"] else None for s in (sa, sb))
+        calls = f"{sa['calls'] if sa else '-'} -> {sb['calls'] if sb else '-'}"
+        ms = f"{'-' if ms_a is None else f'{ms_a:,.1f}'} -> {'-' if ms_b is None else f'{ms_b:,.1f}'}"
+        change = "gone" if ms_b is None else _change(ms_a, ms_b)
+        lines.append(f"{stage:<40} {calls:>13} {ms:>21} {change:>8}")
+
+    self_ms = [{label: f["self"] * run["seconds_per_sample"] * 1000 for label, f in run["functions"].items()}
+               for run in runs]
+    deltas = sorted(set(self_ms[0]) | set(self_ms[1]),
+                    key=lambda label: -abs(self_ms[1].get(label, 0) - self_ms[0].get(label, 0)))
+    lines += ["", f"{'function (self ms)':<70} {'before':>9} {'after':>9} {'change':>8}"]
+    for label in deltas[:top]:
+        ms_a, ms_b = self_ms[0].get(label, 0), self_ms[1].get(label, 0)
+        if ms_a or ms_b:
+            lines.append(f"{label[:70]:<70} {ms_a:>9,.0f} {ms_b:>9,.0f} {_change(ms_a, ms_b):>8}")
+
+    if a["peak_kb"] is None or b["peak_kb"] is None:
+        return lines + ["", "allocations not compared: tracking was off in one of the runs"]
+    kb = [{row["site"]: row["kb"] for row in run["allocations"]} for run in runs]
+    sites = sorted(set(kb[0]) | set(kb[1]), key=lambda site: -abs(kb[1].get(site, 0) - kb[0].get(site, 0)))
+    lines += ["", f"{'allocation site (KB)':<70} {'before':>9} {'after':>9} {'change':>8}"]
+    for site in sites[:top]:
+        kb_a, kb_b = kb[0].get(site, 0), kb[1].get(site, 0)
+        lines.append(f"{site[:70]:<70} {kb_a:>9,.0f} {kb_b:>9,.0f} {_change(kb_a, kb_b):>8}")
+    lines += ["", f"peak traced memory: {a['peak_kb']:,.0f} KB -> {b['peak_kb']:,.0f} KB "
+                  f"({_change(a['peak_kb'], b['peak_kb'])})"]
+    return lines
@@ -0,0 +1,183 @@
+# src/utils/telemetry.py
+
+"""Traces and metrics for every fetch, transform and save call.
+
+stage(name) opens an OpenTelemetry span and times the call into the
+devradar_stage_seconds histogram; next to it are histograms for API latency
+(devradar_http_request_seconds, fed by client hooks), rows written per save
+(devradar_rows_written) and rate-limit sleeps (devradar_rate_limit_wait_seconds).
+Each record is a few microseconds, so it stays on permanently.
+
+Both libraries are optional: without opentelemetry stage() only times, and
+without prometheus_client the metrics are no-ops. Spans go nowhere until
+configure_tracing() installs an exporter (DEVRADAR_TRACING). Metrics are
+per process; set PROMETHEUS_MULTIPROC_DIR for every process to have the
+dashboard's /metrics report the ingestion processes too.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+from config import TRACING_EXPORTER
+from utils.logger import get_logger
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import Status, StatusCode
+except ImportError:
+    trace = None
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:
+    prometheus_client = None
+
+logger = get_logger(__name__)
+
+
+class _NoopMetric:
+    def labels(self, *args, **kwargs):
+        return self
+
+    def observe(self, value):
+        pass
+
+
+class _NoopSpan:
+    def set_attribute(self, key, value):
+        pass
+
+
+def _histogram(name, documentation, labels, buckets):
+    if prometheus_client is None:
+        return _NoopMetric()
+    return prometheus_client.Histogram(name, documentation, labels, buckets=buckets)
+
+
+STAGE_SECONDS = _histogram(
+    "devradar_stage_seconds", "Duration of fetch, transform and save calls", ["stage"],
+    (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300),
+)
+HTTP_SECONDS = _histogram(
+    "devradar_http_request_seconds", "Time to response headers of API calls", ["service", "status"],
+    (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+ROWS_WRITTEN = _histogram(
+    "devradar_rows_written", "Rows upserted per save call", ["source"],
+    (1, 10, 50, 100, 500, 1000, 5000, 10000, 50000),
+)
+RATE_LIMIT_WAIT = _histogram(
+    "devradar_rate_limit_wait_seconds", "Time spent sleeping on API rate limits", ["resource"],
+    (0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600),
+)
+
+_tracer = trace.get_tracer("devradar") if trace is not None else None
+_profiler = None  # utils.profiling.Profiler while a --profile run is recording
+
+
+@contextmanager
+def stage(name, **attributes):
+    """Span and duration histogram around one fetch / transform / save call.
+
+    Yields the span, so callers can attach what they learn on the way
+    (rows written, items fetched). Also works as a decorator of plain
+    functions; async code uses it as `with stage(...)` inside the coroutine.
+    """
+    started = time.perf_counter()
+    profiler = _profiler
+    entry = profiler.enter(name) if profiler is not None else None
+    try:
+        if _tracer is None:
+            yield _NoopSpan()
+        else:
+            with _tracer.start_as_current_span(name, attributes=attributes) as span:
+                yield span
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.labels(name).observe(elapsed)
+        if entry is not None:
+            profiler.exit(entry, elapsed)
+
+
+def record_error(error):
+    """Mark the current span failed for an error the caller handles itself (the save functions return 0)"""
+    if trace is not None:
+        span = trace.get_current_span()
+        span.record_exception(error)
+        span.set_status(Status(StatusCode.ERROR, str(error)))
+
+
+def observe_rows(source, rows):
+    """Rows one save call wrote, also set on its span"""
+    ROWS_WRITTEN.labels(source).observe(rows)
+    if trace is not None:
+        trace.get_current_span().set_attribute("rows", rows)
+
+
+def observe_rate_limit_wait(resource, seconds):
+    RATE_LIMIT_WAIT.labels(resource).observe(seconds)
+
+
+def requests_hook(service):
+    """`requests` response hook timing every call to `service`"""
+    def hook(response, *args, **kwargs):
+        HTTP_SECONDS.labels(service, str(response.status_code)).observe(response.elapsed.total_seconds())
+    return hook
+
+
+def httpx_event_hooks(service):
+    """httpx.AsyncClient event hooks timing every call to `service`"""
+    async def on_request(request):
+        request.extensions["devradar_started"] = time.perf_counter()
+
+    async def on_response(response):
+        started = response.request.extensions.get("devradar_started")
+        if started is not None:
+            HTTP_SECONDS.labels(service, str(response.status_code)).observe(time.perf_counter() - started)
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+def metrics_payload():
+    """(body, content type) of a Prometheus scrape of this process, or of every process in multiprocess mode"""
+    if prometheus_client is None:
+        return b"# prometheus_client is not installed\n", "text/plain; charset=utf-8"
+    registry = prometheus_client.REGISTRY
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return prometheus_client.generate_latest(registry), prometheus_client.CONTENT_TYPE_LATEST
+
+
+_configured = False
+
+
+def configure_tracing(exporter=TRACING_EXPORTER):
+    """Install a tracer provider exporting to `exporter` ("console" or "otlp"); "" leaves tracing as it is"""
+    global _configured
+    if _configured or not exporter or trace is None:
+        return
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+        if exporter == "otlp":
+            # Endpoint and headers come from the standard OTEL_EXPORTER_OTLP_* variables
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            span_exporter = OTLPSpanExporter()
+        elif exporter == "console":
+            span_exporter = ConsoleSpanExporter()
+        else:
+            logger.warning(f"Unknown DEVRADAR_TRACING exporter {exporter!r}, tracing stays off")
+            return
+    except ImportError as e:
+        logger.warning(f"Tracing exporter {exporter!r} is not available ({e}), tracing stays off")
+        return
+
+    provider = TracerProvider(resource=Resource.create({"service.name": "devradar"}))
+    provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    trace.set_tracer_provider(provider)
+    _configured = True
@@ -0,0 +1,51 @@
+# tests/conftest.py
+
+"""Shared setup: a scratch SQLite database, src/ and benchmarks/ on the path.
+
+The environment is set before anything from src is imported, since config
+and db.database read it at import time. Archive and on-disk caches are off
+so a test run leaves nothing behind.
+"""
+
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRATCH = tempfile.mkdtemp(prefix="devradar-tests-")
+
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(SCRATCH, 'devradar.db')}"
+os.environ["DEVRADAR_ARCHIVE_DIR"] = ""
+os.environ["DEVRADAR_NLP_CACHE"] = ""
+os.environ["DEVRADAR_GITHUB_HTTP_CACHE"] = ""
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import pytest
+from sqlalchemy import inspect, text
+
+from db.create_tables import init_db
+from db.database import engine
+from db.models import Base
+from mock_server import MockAPIServer
+from utils.cache import panel_cache
+
+
+@pytest.fixture
+def db():
+    """The test database with its schema in place and every table empty"""
+    init_db()
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+        if "search_index" in inspect(conn).get_table_names():
+            conn.execute(text("DELETE FROM search_index"))
+    panel_cache.invalidate()
+    return engine
+
+
+@pytest.fixture
+def api_server():
+    """A MockAPIServer answering instantly, shut down after the test"""
+    with MockAPIServer(latency=0) as server:
+        yield server
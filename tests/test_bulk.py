@@ -0,0 +1,47 @@
+# tests/test_bulk.py
+
+from sqlalchemy import select
+
+from db.models import GitHubRepo, RepoStarSnapshot
+from mock_server import fake_repo
+from storage.bulk import upsert_rows
+from storage.github_storage import save_github_to_db
+from transform.github_transform import normalize_repo
+
+
+def test_duplicate_keys_in_one_call_last_wins(db):
+    rows = [
+        {"full_name": "a/one", "name": "one", "stars": 1},
+        {"full_name": "b/two", "name": "two", "stars": 2},
+        {"full_name": "a/one", "name": "one", "stars": 3},
+    ]
+
+    assert upsert_rows(GitHubRepo.__table__, rows, "full_name", batch_size=2) == 2
+
+    with db.connect() as conn:
+        stored = dict(conn.execute(select(GitHubRepo.full_name, GitHubRepo.stars)).all())
+    assert stored == {"a/one": 3, "b/two": 2}
+
+
+def test_rewrite_updates_in_place(db):
+    upsert_rows(GitHubRepo.__table__, [{"full_name": "a/one", "name": "one", "stars": 1}], "full_name")
+    upsert_rows(GitHubRepo.__table__, [{"full_name": "a/one", "name": "renamed", "stars": 5}], "full_name")
+
+    with db.connect() as conn:
+        assert conn.execute(select(GitHubRepo.name, GitHubRepo.stars)).all() == [("renamed", 5)]
+
+
+def test_save_github_snapshots_each_write(db):
+    repos = [normalize_repo(fake_repo(i)) for i in range(3)]
+    assert save_github_to_db(repos + repos[:1], batch_size=2) == 3
+
+    bumped = {**repos[0], "stars": repos[0]["stars"] + 10}
+    assert save_github_to_db([bumped]) == 1
+
+    with db.connect() as conn:
+        assert len(conn.execute(select(GitHubRepo.id)).all()) == 3
+        history = conn.execute(
+            select(RepoStarSnapshot.stars).join(GitHubRepo, GitHubRepo.id == RepoStarSnapshot.repo_id)
+            .where(GitHubRepo.full_name == repos[0]["name"]).order_by(RepoStarSnapshot.id)
+        ).scalars().all()
+    assert history == [repos[0]["stars"], repos[0]["stars"] + 10]
@@ -0,0 +1,102 @@
+# tests/test_cache.py
+
+import threading
+
+from utils.cache import TTLCache, cached
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_hit_until_ttl_expires():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    loads = []
+    load = lambda: loads.append(1) or len(loads)
+
+    assert cache.get_or_load("k", load) == 1
+    clock.now = 9.9
+    assert cache.get_or_load("k", load) == 1
+    clock.now = 10.0
+    assert cache.get_or_load("k", load) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.get_or_load("a", lambda: "a")
+    cache.get_or_load("b", lambda: "b")
+    cache.get_or_load("a", lambda: "stale")  # refreshes a
+    cache.get_or_load("c", lambda: "c")
+
+    assert cache.get_or_load("a", lambda: "reloaded") == "a"
+    assert cache.get_or_load("b", lambda: "reloaded") == "reloaded"
+
+
+def test_invalidate_drops_only_tagged_entries():
+    cache = TTLCache()
+    cache.get_or_load("repos", lambda: 1, tags=("github",))
+    cache.get_or_load("posts", lambda: 1, tags=("reddit",))
+
+    cache.invalidate("github")
+
+    assert cache.get_or_load("repos", lambda: 2, tags=("github",)) == 2
+    assert cache.get_or_load("posts", lambda: 2, tags=("reddit",)) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_concurrent_misses_load_once():
+    cache = TTLCache()
+    started, release = threading.Event(), threading.Event()
+    loads = []
+
+    def slow_load():
+        loads.append(1)
+        started.set()
+        release.wait(5)
+        return "value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("k", slow_load))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    started.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ["value"] * 4
+    assert len(loads) == 1
+
+
+def test_load_overlapping_invalidate_is_not_stored():
+    cache = TTLCache()
+
+    def load_then_commit():
+        cache.invalidate("github")  # a writer commits while the query runs
+        return "before commit"
+
+    assert cache.get_or_load("repos", load_then_commit, tags=("github",)) == "before commit"
+    assert cache.get_or_load("repos", lambda: "after commit", tags=("github",)) == "after commit"
+
+
+def test_cached_keys_on_arguments():
+    cache = TTLCache()
+    calls = []
+
+    @cached("github", cache=cache)
+    def top_repos(limit):
+        calls.append(limit)
+        return list(range(limit))
+
+    assert top_repos(2) == [0, 1]
+    assert top_repos(2) == [0, 1]
+    assert top_repos(3) == [0, 1, 2]
+    assert calls == [2, 3]
+    assert top_repos.uncached(2) == [0, 1]
@@ -0,0 +1,24 @@
+# tests/test_github_ingest.py
+
+import pytest
+
+from ingest import github_ingest
+from ingest.github_ingest import fetch_top_repos
+from mock_server import fake_repo
+
+
+@pytest.fixture
+def github_api(api_server, monkeypatch):
+    monkeypatch.setattr(github_ingest, "SEARCH_URL", f"{api_server.url}/search/repositories")
+    return api_server
+
+
+def test_top_repos_hand_back_the_raw_search_items(github_api):
+    raw = []
+    repos = fetch_top_repos(limit=8, raw=raw)
+
+    # new_trending and recently_active (3 each) came up short, so popular (8) ran too
+    assert raw == [fake_repo(i, "python") for i in [0, 1, 2, 0, 1, 2, *range(8)]]
+    assert [repo["full_name"] for repo in repos] == [fake_repo(i)["full_name"] for i in range(8)]
+    assert repos[0]["trending_reason"] == "new_trending"
+    assert "trending_reason" not in raw[0]
@@ -0,0 +1,73 @@
+# tests/test_legacy_posts.py
+
+from datetime import datetime
+
+from sqlalchemy import insert, select
+
+from db.models import PostScoreSnapshot, RedditPost
+from storage.legacy_posts import merge_legacy_duplicates
+from storage.reddit_storage import save_reddit_to_db
+from storage.search import index_documents, search
+
+TITLE = "Show HN-style thread: a tiny SQLite query planner"
+URL = "https://example.com/planner"
+
+
+def post(post_id, title=TITLE, url=URL, score=10):
+    return {"id": post_id, "title": title, "score": score, "url": url}
+
+
+def add_legacy_row(db, title=TITLE, url=URL, score=3):
+    """A row as migration 0002 left it, with one snapshot of its old score"""
+    with db.begin() as conn:
+        row_id = conn.execute(
+            insert(RedditPost).values(post_id="pending", title=title, url=url, score=score,
+                                      timestamp=datetime(2025, 6, 1))
+        ).inserted_primary_key[0]
+        conn.execute(RedditPost.__table__.update().where(RedditPost.id == row_id).values(post_id=f"legacy-{row_id}"))
+        conn.execute(insert(PostScoreSnapshot).values(post_id=row_id, score=score, captured_at=datetime(2025, 6, 1)))
+        index_documents(conn, "post", [(row_id, url, title, "")])
+    return row_id
+
+
+def stored(db):
+    with db.connect() as conn:
+        return conn.execute(select(RedditPost.id, RedditPost.post_id, RedditPost.score).order_by(RedditPost.id)).all()
+
+
+def history(db, row_id):
+    with db.connect() as conn:
+        return conn.execute(
+            select(PostScoreSnapshot.score).where(PostScoreSnapshot.post_id == row_id).order_by(PostScoreSnapshot.id)
+        ).scalars().all()
+
+
+def test_saving_a_post_adopts_its_legacy_row(db):
+    legacy_id = add_legacy_row(db)
+    other_id = add_legacy_row(db, title="Something else entirely")
+
+    assert save_reddit_to_db([post("abc123")]) == 1
+
+    assert stored(db) == [(legacy_id, "abc123", 10), (other_id, f"legacy-{other_id}", 3)]
+    assert history(db, legacy_id) == [3, 10]
+
+
+def test_same_url_with_another_title_is_a_different_post(db):
+    legacy_id = add_legacy_row(db)
+    save_reddit_to_db([post("crosspost", title="Crossposted: a tiny SQLite query planner")])
+    assert [row.post_id for row in stored(db)] == [f"legacy-{legacy_id}", "crosspost"]
+
+
+def test_merge_folds_existing_duplicates(db):
+    save_reddit_to_db([post("abc123")])  # saved before the legacy row existed: a duplicate pair
+    keyed_id = stored(db)[0].id
+    legacy_id = add_legacy_row(db)
+    save_reddit_to_db([post("abc123", score=12)])  # the key is taken, so no adoption
+    assert len(stored(db)) == 2
+    assert [hit["url"] for hit in search("planner")] == [URL, URL]
+
+    assert merge_legacy_duplicates() == 1
+    assert stored(db) == [(keyed_id, "abc123", 12)]
+    assert sorted(history(db, keyed_id)) == [3, 10, 12]
+    assert [hit["url"] for hit in search("planner")] == [URL]
+    assert merge_legacy_duplicates() == 0
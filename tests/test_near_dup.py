@@ -0,0 +1,66 @@
+# tests/test_near_dup.py
+
+from sqlalchemy import select
+
+from db.models import RedditPost, TechNews
+from storage.news_storage import save_news_to_db
+from storage.reddit_storage import save_reddit_to_db
+from transform.near_dup import NUM_HASHES, band_buckets, from_bytes, minhash, similarity, to_bytes
+
+STORY = "Python 3.13 released with an experimental JIT compiler and free threading"
+
+
+def post(post_id, title, score=1):
+    return {"id": post_id, "title": title, "score": score, "url": f"https://reddit.com/{post_id}"}
+
+
+def test_signature_is_stable_and_round_trips():
+    signature = minhash(STORY)
+    assert len(signature) == NUM_HASHES
+    assert minhash(STORY.upper()) == signature
+    assert from_bytes(to_bytes(signature)) == signature
+    assert minhash("  ...  ") is None
+
+
+def test_similarity_tracks_word_overlap():
+    assert similarity(minhash(STORY), minhash(STORY)) == 1.0
+    assert similarity(minhash(STORY), minhash(STORY + " today")) > 0.7
+    assert similarity(minhash(STORY), minhash("Rust for Linux drivers merged")) < 0.2
+
+
+def test_near_duplicates_share_a_band():
+    same = set(band_buckets(minhash(STORY))) & set(band_buckets(minhash(STORY + " today")))
+    assert same
+
+
+def test_posts_cluster_under_the_oldest(db):
+    save_reddit_to_db([post("a", STORY), post("b", "Rust for Linux drivers merged")])
+    save_reddit_to_db([post("c", STORY + " today")])
+
+    with db.connect() as conn:
+        clusters = dict(conn.execute(select(RedditPost.post_id, RedditPost.cluster_id)).all())
+        ids = dict(conn.execute(select(RedditPost.post_id, RedditPost.id)).all())
+    assert clusters["a"] == clusters["c"] == ids["a"]
+    assert clusters["b"] == ids["b"]
+
+
+def test_retitled_post_leaves_its_cluster(db):
+    save_reddit_to_db([post("a", STORY), post("b", STORY + " today")])
+    save_reddit_to_db([post("b", "Rust for Linux drivers merged")])
+
+    with db.connect() as conn:
+        clusters = dict(conn.execute(select(RedditPost.post_id, RedditPost.cluster_id)).all())
+        ids = dict(conn.execute(select(RedditPost.post_id, RedditPost.id)).all())
+    assert clusters["b"] == ids["b"] != clusters["a"]
+
+
+def test_news_clusters_within_one_batch(db):
+    articles = [
+        {"url": f"https://news.example.com/{i}", "title": title, "summary": "", "sentiment": "neutral"}
+        for i, title in enumerate([STORY, STORY + " today", "Rust for Linux drivers merged"])
+    ]
+    assert save_news_to_db(articles) == 3
+
+    with db.connect() as conn:
+        clusters = conn.execute(select(TechNews.cluster_id).order_by(TechNews.id)).scalars().all()
+    assert clusters[0] == clusters[1] != clusters[2]
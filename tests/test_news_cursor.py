@@ -0,0 +1,104 @@
+# tests/test_news_cursor.py
+
+import asyncio
+import json
+
+import pytest
+
+from ingest import async_ingest, news_ingest
+from ingest.news_ingest import advance_cursor, fetch_new_tech_news, unseen_articles
+from mock_server import FixtureStore, MockAPIServer, fake_article
+from storage.cursors import load_cursor, save_cursor
+
+
+def article(article_id, published):
+    return {"article_id": article_id, "pubDate": published}
+
+
+def test_unseen_stops_at_the_mark():
+    cursor = {"published_at": "2024-01-01 10:00:00", "ids": ["b"]}
+    page = [
+        article("d", "2024-01-01 11:00:00"),
+        article("c", "2024-01-01 10:00:00"),  # same second as the mark, not seen yet
+        article("b", "2024-01-01 10:00:00"),
+        article("a", "2024-01-01 09:00:00"),
+    ]
+    assert unseen_articles(page, cursor) == ([page[0], page[1]], True)
+    assert unseen_articles(page, None) == (page, False)
+
+
+def test_advance_keeps_ids_at_the_newest_timestamp():
+    cursor = {"published_at": "2024-01-01 10:00:00", "ids": ["b"]}
+    assert advance_cursor(cursor, [article("c", "2024-01-01 10:00:00")]) == {
+        "published_at": "2024-01-01 10:00:00", "ids": ["b", "c"],
+    }
+    assert advance_cursor(cursor, [article("x", "2024-01-01 09:00:00")]) == cursor
+    assert advance_cursor(cursor, []) == cursor
+
+
+def test_cursor_round_trips(db):
+    assert load_cursor("newsdata") is None
+    save_cursor("newsdata", {"published_at": "2024-01-01", "ids": ["a"]})
+    save_cursor("newsdata", {"published_at": "2024-01-02", "ids": ["b"]})
+    assert load_cursor("newsdata") == {"published_at": "2024-01-02", "ids": ["b"]}
+
+
+@pytest.fixture
+def news_api(api_server, monkeypatch):
+    monkeypatch.setattr(news_ingest, "NEWS_URL", f"{api_server.url}/news")
+    monkeypatch.setattr(async_ingest, "NEWS_URL", f"{api_server.url}/news")
+    return api_server
+
+
+def test_incremental_fetch_reads_only_new_pages(news_api):
+    news_api.news_total, news_api.news_size = 50, 20
+    news, cursor = fetch_new_tech_news("key", max_pages=10)
+    assert len(news) == 50
+    assert cursor == {"published_at": fake_article(49)["pubDate"], "ids": ["article-49"]}
+
+    news_api.news_total = 55  # five articles published since
+    hits = news_api.hits
+    news, cursor = fetch_new_tech_news("key", cursor, max_pages=10)
+    assert [item["link"] for item in news] == [fake_article(i)["link"] for i in range(54, 49, -1)]
+    assert news_api.hits - hits == 1
+    assert cursor["ids"] == ["article-54"]
+
+    assert fetch_new_tech_news("key", cursor) == ([], cursor)
+
+
+def test_async_fetch_pages_like_the_sync_one(news_api):
+    news_api.news_total, news_api.news_size = 50, 20
+    cursor = {"published_at": fake_article(9)["pubDate"], "ids": ["article-9"]}
+    fetched = asyncio.run(async_ingest.fetch_new_tech_news_async("key", cursor, max_pages=10))
+    assert fetched == fetch_new_tech_news("key", cursor, max_pages=10)
+    assert len(fetched[0]) == 40
+
+    news, stopped = asyncio.run(async_ingest.fetch_new_tech_news_async("key", cursor, max_pages=1))
+    assert len(news) == 20
+    assert stopped["ids"] == ["article-49"]
+
+
+def test_failed_fetch_keeps_the_cursor(news_api, monkeypatch):
+    monkeypatch.setattr(news_ingest, "NEWS_URL", f"{news_api.url}/missing")
+    cursor = {"published_at": "2024-01-01 10:00:00", "ids": ["a"]}
+    assert fetch_new_tech_news("key", cursor) == ([], cursor)
+
+
+def test_replays_recorded_page(tmp_path, monkeypatch):
+    off_topic = {**fake_article(2), "title": "Local bakery wins award", "description": "Bread, mostly."}
+    recorded = {
+        "route": "news", "method": "GET", "target": "/news?category=technology&language=en",
+        "status": 200, "headers": {},
+        "body": {"results": [fake_article(3), off_topic, fake_article(1)], "nextPage": None},
+    }
+    (tmp_path / "news-recorded.json").write_text(json.dumps(recorded))
+
+    with MockAPIServer(latency=0, fixtures=str(tmp_path), news_total=0) as server:
+        monkeypatch.setattr(news_ingest, "NEWS_URL", f"{server.url}/news")
+        raw = []
+        news, cursor = fetch_new_tech_news("key", raw=raw)
+
+    assert [item["link"] for item in news] == [fake_article(3)["link"], fake_article(1)["link"]]
+    assert raw == [fake_article(3), off_topic, fake_article(1)]  # unfiltered, as NewsData sent them
+    assert cursor["ids"] == ["article-3"]
+    assert len(FixtureStore(str(tmp_path))) == 1
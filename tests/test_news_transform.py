@@ -0,0 +1,38 @@
+# tests/test_news_transform.py
+
+import threading
+
+from transform.news_transform import BatchEnricher, enrich_batch
+
+TEXTS = [f"Release {i} of the framework ships faster builds and better errors." for i in range(40)]
+
+
+def test_repeats_are_enriched_once():
+    enricher = BatchEnricher(workers=1)
+    first = enricher.enrich([TEXTS[0], f"  {TEXTS[0]} ", TEXTS[1]])
+    assert first[0] == first[1] == enrich_batch([TEXTS[0]])[0]
+    assert list(enricher.seen) == TEXTS[:2]
+
+
+def test_concurrent_callers_share_the_lru():
+    enricher = BatchEnricher(workers=1, memo_size=8)
+    expected = enrich_batch(TEXTS)
+    failures = []
+
+    def enrich(offset):
+        try:
+            for _ in range(5):
+                texts = TEXTS[offset:] + TEXTS[:offset]
+                if enricher.enrich(texts) != expected[offset:] + expected[:offset]:
+                    failures.append(offset)
+        except Exception as e:
+            failures.append(e)
+
+    threads = [threading.Thread(target=enrich, args=(offset,)) for offset in range(0, 40, 5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(60)
+
+    assert failures == []
+    assert len(enricher.seen) <= 8
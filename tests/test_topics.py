@@ -0,0 +1,41 @@
+# tests/test_topics.py
+
+import re
+
+import pytest
+
+from transform.topics import DEFAULT_TOPICS, TopicMatcher, trie_pattern
+
+
+@pytest.mark.parametrize("keywords", [["go", "golang", "gopher"], ["ai"], ["a", "ab", "abc", "b"]])
+def test_trie_pattern_matches_exactly_the_keywords(keywords):
+    pattern = re.compile(f"(?:{trie_pattern(keywords)})$")
+    for keyword in keywords:
+        assert pattern.match(keyword)
+    for other in ["", "g", "gol", "abcd", "c"]:
+        if other not in keywords:
+            assert not pattern.match(other)
+
+
+@pytest.fixture
+def matcher():
+    return TopicMatcher(DEFAULT_TOPICS)
+
+
+def test_matches_whole_words_case_insensitively(matcher):
+    assert matcher.match("AI startup raises funding") == ["ai"]
+    assert matcher.match("He said the chips were fine") == []
+    assert matcher.match("New GPU from NVIDIA") == ["hardware"]
+
+
+def test_multi_word_keywords_allow_any_whitespace(matcher):
+    assert matcher.match("Advances in machine\n  learning") == ["ai"]
+
+
+def test_collects_topics_across_texts(matcher):
+    assert matcher.match("Kubernetes 1.31 released", None, "an Android developer preview") == ["cloud", "mobile", "software"]
+
+
+def test_keyword_shared_by_topics():
+    matcher = TopicMatcher({"ai": ["OpenAI"], "big_tech": ["openai", "google"]})
+    assert matcher.match("openai and Google") == ["ai", "big_tech"]